@@ -25,6 +25,30 @@ FUnrealMCPBlueprintCommands::FUnrealMCPBlueprintCommands()
 {
 }
 
+// Find an engine basic-shape mesh by its lowercase short name ("cube", "sphere", ...).
+// The meshes under /Engine/BasicShapes are found with one asset registry query on first use
+// and kept, so later lookups are a map find.
+static UStaticMesh* FindBasicShapeMesh(const FString& ShapeName)
+{
+    static TMap<FString, TWeakObjectPtr<UStaticMesh>> BasicShapeMeshes;
+    if (BasicShapeMeshes.Num() == 0)
+    {
+        IAssetRegistry& AssetRegistry = FModuleManager::LoadModuleChecked<FAssetRegistryModule>("AssetRegistry").Get();
+        TArray<FAssetData> Assets;
+        AssetRegistry.GetAssetsByPath(FName(TEXT("/Engine/BasicShapes")), Assets);
+        for (const FAssetData& Asset : Assets)
+        {
+            if (UStaticMesh* Mesh = Cast<UStaticMesh>(Asset.GetAsset()))
+            {
+                BasicShapeMeshes.Add(Asset.AssetName.ToString().ToLower(), Mesh);
+            }
+        }
+    }
+
+    const TWeakObjectPtr<UStaticMesh>* Mesh = BasicShapeMeshes.Find(ShapeName.ToLower());
+    return Mesh ? Mesh->Get() : nullptr;
+}
+
 TSharedPtr<FJsonObject> FUnrealMCPBlueprintCommands::HandleCommand(const FString& CommandType, const TSharedPtr<FJsonObject>& Params)
 {
     if (CommandType == TEXT("create_blueprint"))
@@ -1013,8 +1037,11 @@ TSharedPtr<FJsonObject> FUnrealMCPBlueprintCommands::HandleSetStaticMeshProperti
     // Set static mesh properties
     if (Params->HasField(TEXT("static_mesh")))
     {
+        // Either an asset path or the short name of an engine basic shape ("cube")
         FString MeshPath = Params->GetStringField(TEXT("static_mesh"));
-        UStaticMesh* Mesh = Cast<UStaticMesh>(UEditorAssetLibrary::LoadAsset(MeshPath));
+        UStaticMesh* Mesh = MeshPath.Contains(TEXT("/"))
+            ? Cast<UStaticMesh>(UEditorAssetLibrary::LoadAsset(MeshPath))
+            : FindBasicShapeMesh(MeshPath);
         if (Mesh)
         {
             MeshComponent->SetStaticMesh(Mesh);
@@ -16,6 +16,7 @@
 #include "Camera/CameraActor.h"
 #include "Kismet/GameplayStatics.h"
 #include "EdGraphSchema_K2.h"
+#include "ScopedTransaction.h"
 
 // Declare the log category
 DEFINE_LOG_CATEGORY_STATIC(LogUnrealMCP, Log, All);
@@ -62,6 +63,10 @@ TSharedPtr<FJsonObject> FUnrealMCPBlueprintNodeCommands::HandleCommand(const FSt
     {
         return HandleSetBlueprintNodePinValue(Params);
     }
+    else if (CommandType == TEXT("set_blueprint_node_pin_values"))
+    {
+        return HandleSetBlueprintNodePinValues(Params);
+    }
     
     return FUnrealMCPCommonUtils::CreateErrorResponse(FString::Printf(TEXT("Unknown blueprint node command: %s"), *CommandType));
 }
@@ -712,28 +717,55 @@ TSharedPtr<FJsonObject> FUnrealMCPBlueprintNodeCommands::HandleAddBlueprintVaria
     // Create variable based on type
     FEdGraphPinType PinType;
     
+    // Flat arrays are declared as TArray<ElementType>; Blueprints can't nest containers
+    FString ElementType = VariableType;
+    if (ElementType.StartsWith(TEXT("TArray<")) && ElementType.EndsWith(TEXT(">")))
+    {
+        ElementType = ElementType.Mid(7, ElementType.Len() - 8).TrimStartAndEnd();
+        PinType.ContainerType = EPinContainerType::Array;
+    }
+
     // Set up pin type based on variable_type string
-    if (VariableType == TEXT("Boolean"))
+    if (ElementType == TEXT("Boolean") || ElementType == TEXT("Bool"))
     {
         PinType.PinCategory = UEdGraphSchema_K2::PC_Boolean;
     }
-    else if (VariableType == TEXT("Integer") || VariableType == TEXT("Int"))
+    else if (ElementType == TEXT("Byte") || ElementType == TEXT("uint8"))
+    {
+        PinType.PinCategory = UEdGraphSchema_K2::PC_Byte;
+    }
+    else if (ElementType == TEXT("Integer") || ElementType == TEXT("Int"))
     {
         PinType.PinCategory = UEdGraphSchema_K2::PC_Int;
     }
-    else if (VariableType == TEXT("Float"))
+    else if (ElementType == TEXT("Float"))
     {
         PinType.PinCategory = UEdGraphSchema_K2::PC_Float;
     }
-    else if (VariableType == TEXT("String"))
+    else if (ElementType == TEXT("String"))
     {
         PinType.PinCategory = UEdGraphSchema_K2::PC_String;
     }
-    else if (VariableType == TEXT("Vector"))
+    else if (ElementType == TEXT("Vector"))
     {
         PinType.PinCategory = UEdGraphSchema_K2::PC_Struct;
         PinType.PinSubCategoryObject = TBaseStructure<FVector>::Get();
     }
+    else if (ElementType == TEXT("Vector2D") || ElementType == TEXT("FVector2D"))
+    {
+        PinType.PinCategory = UEdGraphSchema_K2::PC_Struct;
+        PinType.PinSubCategoryObject = TBaseStructure<FVector2D>::Get();
+    }
+    else if (ElementType == TEXT("IntPoint") || ElementType == TEXT("FIntPoint"))
+    {
+        PinType.PinCategory = UEdGraphSchema_K2::PC_Struct;
+        PinType.PinSubCategoryObject = TBaseStructure<FIntPoint>::Get();
+    }
+    else if (ElementType == TEXT("Transform") || ElementType == TEXT("FTransform"))
+    {
+        PinType.PinCategory = UEdGraphSchema_K2::PC_Struct;
+        PinType.PinSubCategoryObject = TBaseStructure<FTransform>::Get();
+    }
     else
     {
         return FUnrealMCPCommonUtils::CreateErrorResponse(FString::Printf(TEXT("Unsupported variable type: %s"), *VariableType));
@@ -960,4 +992,58 @@ TSharedPtr<FJsonObject> FUnrealMCPBlueprintNodeCommands::HandleSetBlueprintNodeP
     ResultObj->SetStringField(TEXT("pin_name"), PinName);
     ResultObj->SetStringField(TEXT("value"), Value);
     return ResultObj;
-} 
\ No newline at end of file
+} 
+
+TSharedPtr<FJsonObject> FUnrealMCPBlueprintNodeCommands::HandleSetBlueprintNodePinValues(const TSharedPtr<FJsonObject>& Params)
+{
+    FString BlueprintName, NodeId;
+    const TSharedPtr<FJsonObject>* Values = nullptr;
+    if (!Params->TryGetStringField(TEXT("blueprint_name"), BlueprintName) ||
+        !Params->TryGetStringField(TEXT("node_id"), NodeId) ||
+        !Params->TryGetObjectField(TEXT("values"), Values))
+    {
+        return FUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Missing required parameter"));
+    }
+
+    UBlueprint* Blueprint = FUnrealMCPCommonUtils::FindBlueprint(BlueprintName);
+    if (!Blueprint) return FUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Blueprint not found"));
+
+    UEdGraph* EventGraph = FUnrealMCPCommonUtils::FindOrCreateEventGraph(Blueprint);
+    if (!EventGraph) return FUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Failed to get event graph"));
+
+    UEdGraphNode* Node = nullptr;
+    for (UEdGraphNode* N : EventGraph->Nodes)
+        if (N->NodeGuid.ToString() == NodeId) { Node = N; break; }
+    if (!Node) return FUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Node not found"));
+
+    // Resolve every pin and value first, so a bad entry leaves the node unchanged
+    TArray<TPair<UEdGraphPin*, FString>> PinValues;
+    PinValues.Reserve((*Values)->Values.Num());
+    for (const TPair<FString, TSharedPtr<FJsonValue>>& Entry : (*Values)->Values)
+    {
+        UEdGraphPin* Pin = FUnrealMCPCommonUtils::FindPin(Node, Entry.Key);
+        if (!Pin) return FUnrealMCPCommonUtils::CreateErrorResponse(FString::Printf(TEXT("Pin not found: %s"), *Entry.Key));
+
+        FString Value;
+        if (!Entry.Value.IsValid() || !Entry.Value->TryGetString(Value))
+        {
+            return FUnrealMCPCommonUtils::CreateErrorResponse(FString::Printf(TEXT("Invalid value for pin: %s"), *Entry.Key));
+        }
+        PinValues.Emplace(Pin, Value);
+    }
+
+    {
+        const FScopedTransaction Transaction(NSLOCTEXT("UnrealMCP", "SetBlueprintNodePinValues", "Set Blueprint Node Pin Values"));
+        Node->Modify();
+        for (const TPair<UEdGraphPin*, FString>& PinValue : PinValues)
+        {
+            PinValue.Key->DefaultValue = PinValue.Value;
+        }
+    }
+    FBlueprintEditorUtils::MarkBlueprintAsModified(Blueprint);
+
+    TSharedPtr<FJsonObject> ResultObj = MakeShared<FJsonObject>();
+    ResultObj->SetStringField(TEXT("node_id"), NodeId);
+    ResultObj->SetObjectField(TEXT("values"), *Values);
+    return ResultObj;
+}
@@ -74,6 +74,15 @@ TSharedPtr<FJsonObject> FUnrealMCPEditorCommands::HandleCommand(const FString& C
     {
         return HandleTakeScreenshot(Params);
     }
+    // Blueprint edit batches
+    else if (CommandType == TEXT("begin_blueprint_edit_batch"))
+    {
+        return HandleBeginBlueprintEditBatch(Params);
+    }
+    else if (CommandType == TEXT("end_blueprint_edit_batch"))
+    {
+        return HandleEndBlueprintEditBatch(Params);
+    }
     
     return FUnrealMCPCommonUtils::CreateErrorResponse(FString::Printf(TEXT("Unknown editor command: %s"), *CommandType));
 }
@@ -597,4 +606,55 @@ TSharedPtr<FJsonObject> FUnrealMCPEditorCommands::HandleTakeScreenshot(const TSh
     }
     
     return FUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Failed to take screenshot"));
-} 
\ No newline at end of file
+} 
+
+// Name of the realtime override that Blueprint edit batches put on the level viewports
+static FText GetBlueprintEditBatchOverrideName()
+{
+    return NSLOCTEXT("UnrealMCP", "BlueprintEditBatch", "MCP Blueprint edit batch");
+}
+
+TSharedPtr<FJsonObject> FUnrealMCPEditorCommands::HandleBeginBlueprintEditBatch(const TSharedPtr<FJsonObject>& Params)
+{
+    // Stop the level viewports from redrawing every frame while many Blueprints are edited;
+    // nested batches only count, the outermost one owns the override
+    if (BlueprintEditBatchDepth++ == 0)
+    {
+        for (FLevelEditorViewportClient* ViewportClient : GEditor->GetLevelViewportClients())
+        {
+            if (ViewportClient)
+            {
+                ViewportClient->AddRealtimeOverride(false, GetBlueprintEditBatchOverrideName());
+            }
+        }
+    }
+
+    TSharedPtr<FJsonObject> ResultObj = MakeShared<FJsonObject>();
+    ResultObj->SetNumberField(TEXT("depth"), BlueprintEditBatchDepth);
+    return ResultObj;
+}
+
+TSharedPtr<FJsonObject> FUnrealMCPEditorCommands::HandleEndBlueprintEditBatch(const TSharedPtr<FJsonObject>& Params)
+{
+    if (BlueprintEditBatchDepth == 0)
+    {
+        return FUnrealMCPCommonUtils::CreateErrorResponse(TEXT("No Blueprint edit batch is open"));
+    }
+
+    if (--BlueprintEditBatchDepth == 0)
+    {
+        // Viewports opened during the batch have no override to remove
+        for (FLevelEditorViewportClient* ViewportClient : GEditor->GetLevelViewportClients())
+        {
+            if (ViewportClient)
+            {
+                ViewportClient->RemoveRealtimeOverride(GetBlueprintEditBatchOverrideName(), false);
+            }
+        }
+        GEditor->RedrawLevelEditingViewports();
+    }
+
+    TSharedPtr<FJsonObject> ResultObj = MakeShared<FJsonObject>();
+    ResultObj->SetNumberField(TEXT("depth"), BlueprintEditBatchDepth);
+    return ResultObj;
+}
@@ -10,10 +10,14 @@
 #include "JsonObjectConverter.h"
 #include "Misc/ScopeLock.h"
 #include "HAL/PlatformTime.h"
+#include "Async/Async.h"
 
 // Buffer size for receiving data
 const int32 BufferSize = 8192;
 
+// Largest command accepted; bigger payloads (e.g. batches) arrive over several reads
+const int32 MaxMessageSize = 16 * 1024 * 1024;
+
 FMCPServerRunnable::FMCPServerRunnable(UUnrealMCPBridge* InBridge, TSharedPtr<FSocket> InListenerSocket)
     : Bridge(InBridge)
     , ListenerSocket(InListenerSocket)
@@ -45,101 +49,18 @@ uint32 FMCPServerRunnable::Run()
         {
             UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Client connection pending, accepting..."));
             
-            ClientSocket = MakeShareable(ListenerSocket->Accept(TEXT("MCPClient")));
+            TSharedPtr<FSocket> ClientSocket = MakeShareable(ListenerSocket->Accept(TEXT("MCPClient")));
             if (ClientSocket.IsValid())
             {
                 UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Client connection accepted"));
                 
-                // Set socket options to improve connection stability
-                ClientSocket->SetNoDelay(true);
-                int32 SocketBufferSize = 65536;  // 64KB buffer
-                ClientSocket->SetSendBufferSize(SocketBufferSize, SocketBufferSize);
-                ClientSocket->SetReceiveBufferSize(SocketBufferSize, SocketBufferSize);
-                
-                uint8 Buffer[8192];
-                while (bRunning)
+                // Serve each client on its own thread so a long-lived connection doesn't block new ones
+                ActiveClients.Increment();
+                Async(EAsyncExecution::Thread, [this, ClientSocket]()
                 {
-                    int32 BytesRead = 0;
-                    if (ClientSocket->Recv(Buffer, sizeof(Buffer), BytesRead))
-                    {
-                        if (BytesRead == 0)
-                        {
-                            UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Client disconnected (zero bytes)"));
-                            break;
-                        }
-
-                        // Convert received data to string
-                        Buffer[BytesRead] = '\0';
-                        FString ReceivedText = UTF8_TO_TCHAR(Buffer);
-                        UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Received: %s"), *ReceivedText);
-
-                        // Parse JSON
-                        TSharedPtr<FJsonObject> JsonObject;
-                        TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(ReceivedText);
-                        
-                        if (FJsonSerializer::Deserialize(Reader, JsonObject))
-                        {
-                            // Get command type
-                            FString CommandType;
-                            if (JsonObject->TryGetStringField(TEXT("type"), CommandType))
-                            {
-                                // Execute command
-                                FString Response = Bridge->ExecuteCommand(CommandType, JsonObject->GetObjectField(TEXT("params")));
-                                
-                                // Log response for debugging
-                                UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Sending response: %s"), *Response);
-                                
-                                // Send response
-                                int32 BytesSent = 0;
-                                if (!ClientSocket->Send((uint8*)TCHAR_TO_UTF8(*Response), Response.Len(), BytesSent))
-                                {
-                                    UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Failed to send response"));
-                                }
-                                else {
-                                    UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Response sent successfully, bytes: %d"), BytesSent);
-                                }
-                            }
-                            else
-                            {
-                                UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Missing 'type' field in command"));
-                            }
-                        }
-                        else
-                        {
-                            UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Failed to parse JSON from: %s"), *ReceivedText);
-                        }
-                    }
-                    else
-                    {
-                        int32 LastError = (int32)ISocketSubsystem::Get()->GetLastErrorCode();
-                        // Don't break the connection for WouldBlock error, which is normal for non-blocking sockets
-                        bool bShouldBreak = true;
-                        
-                        // Check for "would block" error which isn't a real error for non-blocking sockets
-                        if (LastError == SE_EWOULDBLOCK) 
-                        {
-                            UE_LOG(LogTemp, Verbose, TEXT("MCPServerRunnable: Socket would block, continuing..."));
-                            bShouldBreak = false;
-                            // Small sleep to prevent tight loop when no data
-                            FPlatformProcess::Sleep(0.01f);
-                        }
-                        // Check for other transient errors we might want to tolerate
-                        else if (LastError == SE_EINTR) // Interrupted system call
-                        {
-                            UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Socket read interrupted, continuing..."));
-                            bShouldBreak = false;
-                        }
-                        else 
-                        {
-                            UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Client disconnected or error. Last error code: %d"), LastError);
-                        }
-                        
-                        if (bShouldBreak)
-                        {
-                            break;
-                        }
-                    }
-                }
+                    ServeClient(ClientSocket);
+                    ActiveClients.Decrement();
+                });
             }
             else
             {
@@ -151,10 +72,236 @@ uint32 FMCPServerRunnable::Run()
         FPlatformProcess::Sleep(0.1f);
     }
     
+    // Client threads exit once they see bRunning cleared; wait for them before the runnable goes away
+    while (ActiveClients.GetValue() > 0)
+    {
+        FPlatformProcess::Sleep(0.01f);
+    }
+    
     UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Server thread stopping"));
     return 0;
 }
 
+void FMCPServerRunnable::ServeClient(TSharedPtr<FSocket> ClientSocket)
+{
+    // Set socket options to improve connection stability
+    ClientSocket->SetNoDelay(true);
+    int32 SocketBufferSize = 65536;  // 64KB buffer
+    ClientSocket->SetSendBufferSize(SocketBufferSize, SocketBufferSize);
+    ClientSocket->SetReceiveBufferSize(SocketBufferSize, SocketBufferSize);
+    
+    uint8 Buffer[BufferSize];
+    TArray<uint8> MessageBytes;
+    
+    // Decided by the first byte of the connection: '{' means raw JSON, anything else a 4-byte length prefix
+    bool bFramingKnown = false;
+    bool bFramed = false;
+    
+    while (bRunning)
+    {
+        int32 BytesRead = 0;
+        if (ClientSocket->Recv(Buffer, BufferSize, BytesRead))
+        {
+            if (BytesRead == 0)
+            {
+                UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Client disconnected (zero bytes)"));
+                break;
+            }
+            
+            MessageBytes.Append(Buffer, BytesRead);
+            if (!bFramingKnown)
+            {
+                bFramed = MessageBytes[0] != '{';
+                bFramingKnown = true;
+            }
+            
+            // Handle every complete message received so far
+            TSharedPtr<FJsonObject> JsonObject;
+            bool bCorrupt = false;
+            while (ExtractMessage(MessageBytes, bFramed, JsonObject, bCorrupt))
+            {
+                if (JsonObject.IsValid())
+                {
+                    ProcessCommand(ClientSocket, JsonObject, bFramed);
+                }
+            }
+            
+            // A bad frame can't be answered by id, and the bytes after it can't be trusted to
+            // start a new frame; closing lets the client fail its requests at once instead of timing out
+            if (bCorrupt)
+            {
+                UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Closing client connection after a malformed frame"));
+                ClientSocket->Close();
+                break;
+            }
+        }
+        else
+        {
+            int32 LastError = (int32)ISocketSubsystem::Get()->GetLastErrorCode();
+            // Don't break the connection for WouldBlock error, which is normal for non-blocking sockets
+            bool bShouldBreak = true;
+            
+            // Check for "would block" error which isn't a real error for non-blocking sockets
+            if (LastError == SE_EWOULDBLOCK) 
+            {
+                UE_LOG(LogTemp, Verbose, TEXT("MCPServerRunnable: Socket would block, continuing..."));
+                bShouldBreak = false;
+                // Small sleep to prevent tight loop when no data
+                FPlatformProcess::Sleep(0.01f);
+            }
+            // Check for other transient errors we might want to tolerate
+            else if (LastError == SE_EINTR) // Interrupted system call
+            {
+                UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Socket read interrupted, continuing..."));
+                bShouldBreak = false;
+            }
+            else 
+            {
+                UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Client disconnected or error. Last error code: %d"), LastError);
+            }
+            
+            if (bShouldBreak)
+            {
+                break;
+            }
+        }
+    }
+}
+
+// Pop one complete message off the front of the buffer; OutMessage is left invalid if it didn't parse.
+// bOutCorrupt is set, and false returned, when the stream can no longer be read.
+bool FMCPServerRunnable::ExtractMessage(TArray<uint8>& MessageBytes, bool bFramed, TSharedPtr<FJsonObject>& OutMessage, bool& bOutCorrupt)
+{
+    OutMessage.Reset();
+    bOutCorrupt = false;
+    
+    if (bFramed)
+    {
+        if (MessageBytes.Num() < 4)
+        {
+            return false;
+        }
+        
+        const int32 Length = (MessageBytes[0] << 24) | (MessageBytes[1] << 16) | (MessageBytes[2] << 8) | MessageBytes[3];
+        if (Length < 0 || Length > MaxMessageSize)
+        {
+            UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Rejecting frame of %d bytes"), Length);
+            MessageBytes.Reset();
+            bOutCorrupt = true;
+            return false;
+        }
+        if (MessageBytes.Num() < 4 + Length)
+        {
+            return false;
+        }
+        
+        FUTF8ToTCHAR ReceivedConverter(reinterpret_cast<const ANSICHAR*>(MessageBytes.GetData() + 4), Length);
+        FString ReceivedText(ReceivedConverter.Length(), ReceivedConverter.Get());
+        MessageBytes.RemoveAt(0, 4 + Length);
+        
+        UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Received: %s"), *ReceivedText);
+        TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(ReceivedText);
+        if (!FJsonSerializer::Deserialize(Reader, OutMessage))
+        {
+            UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Failed to parse JSON from: %s"), *ReceivedText);
+            OutMessage.Reset();
+            bOutCorrupt = true;
+            return false;
+        }
+        return true;
+    }
+    
+    // Raw JSON: accumulate until a complete object has arrived, dropping any bytes before it
+    int32 MessageStart = MessageBytes.IndexOfByKey('{');
+    if (MessageStart == INDEX_NONE)
+    {
+        MessageBytes.Reset();
+        return false;
+    }
+    if (MessageStart > 0)
+    {
+        MessageBytes.RemoveAt(0, MessageStart);
+    }
+    
+    // Convert received data to string
+    FUTF8ToTCHAR ReceivedConverter(reinterpret_cast<const ANSICHAR*>(MessageBytes.GetData()), MessageBytes.Num());
+    FString ReceivedText(ReceivedConverter.Length(), ReceivedConverter.Get());
+    
+    TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(ReceivedText);
+    if (FJsonSerializer::Deserialize(Reader, OutMessage))
+    {
+        UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Received: %s"), *ReceivedText);
+        MessageBytes.Reset();
+        return true;
+    }
+    
+    OutMessage.Reset();
+    if (MessageBytes.Num() > MaxMessageSize)
+    {
+        UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Failed to parse JSON from: %s"), *ReceivedText);
+        MessageBytes.Reset();
+        bOutCorrupt = true;
+    }
+    return false;
+}
+
+void FMCPServerRunnable::ProcessCommand(TSharedPtr<FSocket> ClientSocket, const TSharedPtr<FJsonObject>& JsonObject, bool bFramed)
+{
+    // Get command type
+    FString CommandType;
+    if (!JsonObject->TryGetStringField(TEXT("type"), CommandType))
+    {
+        UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Missing 'type' field in command"));
+        return;
+    }
+    
+    const TSharedPtr<FJsonObject>* ParamsObject = nullptr;
+    TSharedPtr<FJsonObject> Params;
+    if (JsonObject->TryGetObjectField(TEXT("params"), ParamsObject))
+    {
+        Params = *ParamsObject;
+    }
+    else
+    {
+        Params = MakeShareable(new FJsonObject);
+    }
+    
+    // Execute command, echoing the request id (if any) so pipelined clients can match responses
+    FString Response = Bridge->ExecuteCommand(CommandType, Params, JsonObject->TryGetField(TEXT("id")));
+    
+    // Log response for debugging
+    UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Sending response: %s"), *Response);
+    
+    // Send response as UTF-8, with a length prefix if the client framed its request
+    FTCHARToUTF8 ResponseUtf8(*Response);
+    TArray<uint8> Payload;
+    Payload.Reserve(ResponseUtf8.Length() + 4);
+    if (bFramed)
+    {
+        const uint32 Length = ResponseUtf8.Length();
+        Payload.Add((Length >> 24) & 0xFF);
+        Payload.Add((Length >> 16) & 0xFF);
+        Payload.Add((Length >> 8) & 0xFF);
+        Payload.Add(Length & 0xFF);
+    }
+    Payload.Append(reinterpret_cast<const uint8*>(ResponseUtf8.Get()), ResponseUtf8.Length());
+    
+    // Loop until every byte is written
+    int32 TotalSent = 0;
+    while (TotalSent < Payload.Num())
+    {
+        int32 BytesSent = 0;
+        if (!ClientSocket->Send(Payload.GetData() + TotalSent, Payload.Num() - TotalSent, BytesSent))
+        {
+            UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Failed to send response"));
+            return;
+        }
+        TotalSent += BytesSent;
+    }
+    
+    UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Response sent successfully, bytes: %d"), TotalSent);
+}
+
 void FMCPServerRunnable::Stop()
 {
     bRunning = false;
@@ -10,6 +10,7 @@
 #include "Serialization/JsonSerializer.h"
 #include "Serialization/JsonReader.h"
 #include "Serialization/JsonWriter.h"
+#include "Policies/CondensedJsonPrintPolicy.h"
 #include "Engine/StaticMeshActor.h"
 #include "Engine/DirectionalLight.h"
 #include "Engine/PointLight.h"
@@ -201,7 +202,7 @@ void UUnrealMCPBridge::StopServer()
 }
 
 // Execute a command received from a client
-FString UUnrealMCPBridge::ExecuteCommand(const FString& CommandType, const TSharedPtr<FJsonObject>& Params)
+FString UUnrealMCPBridge::ExecuteCommand(const FString& CommandType, const TSharedPtr<FJsonObject>& Params, const TSharedPtr<FJsonValue>& RequestId)
 {
     UE_LOG(LogTemp, Display, TEXT("UnrealMCPBridge: Executing command: %s"), *CommandType);
     
@@ -210,124 +211,287 @@ FString UUnrealMCPBridge::ExecuteCommand(const FString& CommandType, const TShar
     TFuture<FString> Future = Promise.GetFuture();
     
     // Queue execution on Game Thread
-    AsyncTask(ENamedThreads::GameThread, [this, CommandType, Params, Promise = MoveTemp(Promise)]() mutable
+    AsyncTask(ENamedThreads::GameThread, [this, CommandType, Params, RequestId, Promise = MoveTemp(Promise)]() mutable
     {
-        TSharedPtr<FJsonObject> ResponseJson = MakeShareable(new FJsonObject);
+        TSharedPtr<FJsonObject> ResponseJson = ExecuteCommandInternal(CommandType, Params);
+        if (RequestId.IsValid())
+        {
+            ResponseJson->SetField(TEXT("id"), RequestId);
+        }
+        
+        // Condensed output: the client only parses it, so indentation is pure payload and parse cost
+        FString ResultString;
+        TSharedRef<TJsonWriter<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>> Writer = TJsonWriterFactory<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>::Create(&ResultString);
+        FJsonSerializer::Serialize(ResponseJson.ToSharedRef(), Writer);
+        Promise.SetValue(ResultString);
+    });
+    
+    return Future.Get();
+}
+
+// Dispatch a command to its handler and build the response object; must run on the Game Thread
+TSharedPtr<FJsonObject> UUnrealMCPBridge::ExecuteCommandInternal(const FString& CommandType, const TSharedPtr<FJsonObject>& Params)
+{
+    TSharedPtr<FJsonObject> ResponseJson = MakeShareable(new FJsonObject);
+    
+    try
+    {
+        TSharedPtr<FJsonObject> ResultJson;
         
-        try
+        if (CommandType == TEXT("ping"))
         {
-            TSharedPtr<FJsonObject> ResultJson;
-            
-            if (CommandType == TEXT("ping"))
-            {
-                ResultJson = MakeShareable(new FJsonObject);
-                ResultJson->SetStringField(TEXT("message"), TEXT("pong"));
-            }
-            // Editor Commands (including actor manipulation)
-            else if (CommandType == TEXT("get_actors_in_level") || 
-                     CommandType == TEXT("find_actors_by_name") ||
-                     CommandType == TEXT("spawn_actor") ||
-                     CommandType == TEXT("create_actor") ||
-                     CommandType == TEXT("delete_actor") || 
-                     CommandType == TEXT("set_actor_transform") ||
-                     CommandType == TEXT("get_actor_properties") ||
-                     CommandType == TEXT("set_actor_property") ||
-                     CommandType == TEXT("spawn_blueprint_actor") ||
-                     CommandType == TEXT("focus_viewport") || 
-                     CommandType == TEXT("take_screenshot"))
-            {
-                ResultJson = EditorCommands->HandleCommand(CommandType, Params);
-            }
-            // Blueprint Commands
-            else if (CommandType == TEXT("create_blueprint") || 
-                     CommandType == TEXT("add_component_to_blueprint") || 
-                     CommandType == TEXT("set_component_property") || 
-                     CommandType == TEXT("set_physics_properties") || 
-                     CommandType == TEXT("compile_blueprint") || 
-                     CommandType == TEXT("set_blueprint_property") || 
-                     CommandType == TEXT("set_static_mesh_properties") ||
-                     CommandType == TEXT("set_pawn_properties"))
-            {
-                ResultJson = BlueprintCommands->HandleCommand(CommandType, Params);
-            }
-            // Blueprint Node Commands
-            else if (CommandType == TEXT("connect_blueprint_nodes") || 
-                     CommandType == TEXT("add_blueprint_get_self_component_reference") ||
-                     CommandType == TEXT("add_blueprint_self_reference") ||
-                     CommandType == TEXT("find_blueprint_nodes") ||
-                     CommandType == TEXT("add_blueprint_event_node") ||
-                     CommandType == TEXT("add_blueprint_input_action_node") ||
-                     CommandType == TEXT("add_blueprint_function_node") ||
-                     CommandType == TEXT("add_blueprint_get_component_node") ||
-                     CommandType == TEXT("add_blueprint_variable") ||
-                     CommandType == TEXT("set_blueprint_node_pin_value"))
-            {
-                ResultJson = BlueprintNodeCommands->HandleCommand(CommandType, Params);
-            }
-            // Project Commands
-            else if (CommandType == TEXT("create_input_mapping"))
+            ResultJson = MakeShareable(new FJsonObject);
+            ResultJson->SetStringField(TEXT("message"), TEXT("pong"));
+        }
+        // Several commands in one round-trip
+        else if (CommandType == TEXT("batch"))
+        {
+            ResultJson = HandleBatch(Params);
+        }
+        // Editor Commands (including actor manipulation)
+        else if (CommandType == TEXT("get_actors_in_level") || 
+                 CommandType == TEXT("find_actors_by_name") ||
+                 CommandType == TEXT("spawn_actor") ||
+                 CommandType == TEXT("create_actor") ||
+                 CommandType == TEXT("delete_actor") || 
+                 CommandType == TEXT("set_actor_transform") ||
+                 CommandType == TEXT("get_actor_properties") ||
+                 CommandType == TEXT("set_actor_property") ||
+                 CommandType == TEXT("spawn_blueprint_actor") ||
+                 CommandType == TEXT("focus_viewport") || 
+                 CommandType == TEXT("take_screenshot") ||
+                 CommandType == TEXT("begin_blueprint_edit_batch") ||
+                 CommandType == TEXT("end_blueprint_edit_batch"))
+        {
+            ResultJson = EditorCommands->HandleCommand(CommandType, Params);
+        }
+        // Blueprint Commands
+        else if (CommandType == TEXT("create_blueprint") || 
+                 CommandType == TEXT("add_component_to_blueprint") || 
+                 CommandType == TEXT("set_component_property") || 
+                 CommandType == TEXT("set_physics_properties") || 
+                 CommandType == TEXT("compile_blueprint") || 
+                 CommandType == TEXT("set_blueprint_property") || 
+                 CommandType == TEXT("set_static_mesh_properties") ||
+                 CommandType == TEXT("set_pawn_properties"))
+        {
+            ResultJson = BlueprintCommands->HandleCommand(CommandType, Params);
+        }
+        // Blueprint Node Commands
+        else if (CommandType == TEXT("connect_blueprint_nodes") || 
+                 CommandType == TEXT("add_blueprint_get_self_component_reference") ||
+                 CommandType == TEXT("add_blueprint_self_reference") ||
+                 CommandType == TEXT("find_blueprint_nodes") ||
+                 CommandType == TEXT("add_blueprint_event_node") ||
+                 CommandType == TEXT("add_blueprint_input_action_node") ||
+                 CommandType == TEXT("add_blueprint_function_node") ||
+                 CommandType == TEXT("add_blueprint_get_component_node") ||
+                 CommandType == TEXT("add_blueprint_variable") ||
+                 CommandType == TEXT("set_blueprint_node_pin_value") ||
+                 CommandType == TEXT("set_blueprint_node_pin_values"))
+        {
+            ResultJson = BlueprintNodeCommands->HandleCommand(CommandType, Params);
+        }
+        // Project Commands
+        else if (CommandType == TEXT("create_input_mapping"))
+        {
+            ResultJson = ProjectCommands->HandleCommand(CommandType, Params);
+        }
+        // UMG Commands
+        else if (CommandType == TEXT("create_umg_widget_blueprint") ||
+                 CommandType == TEXT("add_text_block_to_widget") ||
+                 CommandType == TEXT("add_button_to_widget") ||
+                 CommandType == TEXT("bind_widget_event") ||
+                 CommandType == TEXT("set_text_block_binding") ||
+                 CommandType == TEXT("add_widget_to_viewport"))
+        {
+            ResultJson = UMGCommands->HandleCommand(CommandType, Params);
+        }
+        else
+        {
+            ResponseJson->SetStringField(TEXT("status"), TEXT("error"));
+            ResponseJson->SetStringField(TEXT("error"), FString::Printf(TEXT("Unknown command: %s"), *CommandType));
+            return ResponseJson;
+        }
+        
+        // Check if the result contains an error
+        bool bSuccess = true;
+        FString ErrorMessage;
+        
+        if (ResultJson->HasField(TEXT("success")))
+        {
+            bSuccess = ResultJson->GetBoolField(TEXT("success"));
+            if (!bSuccess && ResultJson->HasField(TEXT("error")))
             {
-                ResultJson = ProjectCommands->HandleCommand(CommandType, Params);
+                ErrorMessage = ResultJson->GetStringField(TEXT("error"));
             }
-            // UMG Commands
-            else if (CommandType == TEXT("create_umg_widget_blueprint") ||
-                     CommandType == TEXT("add_text_block_to_widget") ||
-                     CommandType == TEXT("add_button_to_widget") ||
-                     CommandType == TEXT("bind_widget_event") ||
-                     CommandType == TEXT("set_text_block_binding") ||
-                     CommandType == TEXT("add_widget_to_viewport"))
+        }
+        
+        if (bSuccess)
+        {
+            // Set success status and include the result
+            ResponseJson->SetStringField(TEXT("status"), TEXT("success"));
+            ResponseJson->SetObjectField(TEXT("result"), ResultJson);
+        }
+        else
+        {
+            // Set error status and include the error message
+            ResponseJson->SetStringField(TEXT("status"), TEXT("error"));
+            ResponseJson->SetStringField(TEXT("error"), ErrorMessage);
+        }
+    }
+    catch (const std::exception& e)
+    {
+        ResponseJson->SetStringField(TEXT("status"), TEXT("error"));
+        ResponseJson->SetStringField(TEXT("error"), UTF8_TO_TCHAR(e.what()));
+    }
+    
+    return ResponseJson;
+}
+
+// Look up a batch reference of the form "<op index>.<field>.<field>..." in the responses of earlier ops
+static TSharedPtr<FJsonValue> LookupBatchReference(const FString& Reference, const TArray<TSharedPtr<FJsonValue>>& Results)
+{
+    TArray<FString> Parts;
+    Reference.ParseIntoArray(Parts, TEXT("."), true);
+    if (Parts.Num() == 0 || !Parts[0].IsNumeric())
+    {
+        return nullptr;
+    }
+    
+    const int32 Index = FCString::Atoi(*Parts[0]);
+    if (!Results.IsValidIndex(Index))
+    {
+        return nullptr;
+    }
+    
+    TSharedPtr<FJsonValue> Value = Results[Index];
+    for (int32 PartIndex = 1; PartIndex < Parts.Num() && Value.IsValid(); ++PartIndex)
+    {
+        const TSharedPtr<FJsonObject>* Object = nullptr;
+        if (!Value->TryGetObject(Object))
+        {
+            return nullptr;
+        }
+        Value = (*Object)->TryGetField(Parts[PartIndex]);
+    }
+    return Value;
+}
+
+// Replace top-level {"$ref": "..."} params with the values they point to; returns null if one can't be resolved
+static TSharedPtr<FJsonObject> ResolveBatchReferences(const TSharedPtr<FJsonObject>& OpParams, const TArray<TSharedPtr<FJsonValue>>& Results, FString& OutError)
+{
+    TSharedPtr<FJsonObject> Resolved = OpParams;
+    for (const TPair<FString, TSharedPtr<FJsonValue>>& Field : OpParams->Values)
+    {
+        const TSharedPtr<FJsonObject>* RefObject = nullptr;
+        FString Reference;
+        if (!Field.Value.IsValid() || !Field.Value->TryGetObject(RefObject) || !(*RefObject)->TryGetStringField(TEXT("$ref"), Reference))
+        {
+            continue;
+        }
+        
+        TSharedPtr<FJsonValue> Value = LookupBatchReference(Reference, Results);
+        if (!Value.IsValid())
+        {
+            OutError = FString::Printf(TEXT("Unresolved batch reference '%s'"), *Reference);
+            return nullptr;
+        }
+        
+        // Copy on the first reference so ops without any share the request's params object
+        if (Resolved == OpParams)
+        {
+            Resolved = MakeShareable(new FJsonObject);
+            Resolved->Values = OpParams->Values;
+        }
+        Resolved->SetField(Field.Key, Value);
+    }
+    return Resolved;
+}
+
+// Execute every op of a batch in order and collect their responses by index.
+// Op params may refer to earlier responses with {"$ref": "<op index>.<path>"}, and with
+// "stop_on_error" the ops after a failed one (unless it is marked "optional") are skipped.
+TSharedPtr<FJsonObject> UUnrealMCPBridge::HandleBatch(const TSharedPtr<FJsonObject>& Params)
+{
+    TSharedPtr<FJsonObject> ResultJson = MakeShareable(new FJsonObject);
+    
+    const TArray<TSharedPtr<FJsonValue>>* Ops = nullptr;
+    if (!Params.IsValid() || !Params->TryGetArrayField(TEXT("ops"), Ops))
+    {
+        ResultJson->SetBoolField(TEXT("success"), false);
+        ResultJson->SetStringField(TEXT("error"), TEXT("Missing 'ops' parameter"));
+        return ResultJson;
+    }
+    
+    bool bStopOnError = false;
+    Params->TryGetBoolField(TEXT("stop_on_error"), bStopOnError);
+    bool bStopped = false;
+    
+    TArray<TSharedPtr<FJsonValue>> Results;
+    Results.Reserve(Ops->Num());
+    
+    for (const TSharedPtr<FJsonValue>& OpValue : *Ops)
+    {
+        const TSharedPtr<FJsonObject>* Op = nullptr;
+        FString OpType;
+        TSharedPtr<FJsonObject> OpResponse;
+        bool bOptional = false;
+        
+        if (!OpValue->TryGetObject(Op) || !(*Op)->TryGetStringField(TEXT("type"), OpType))
+        {
+            OpResponse = MakeShareable(new FJsonObject);
+            OpResponse->SetStringField(TEXT("status"), TEXT("error"));
+            OpResponse->SetStringField(TEXT("error"), TEXT("Batch op is missing 'type'"));
+        }
+        else if (OpType == TEXT("batch"))
+        {
+            OpResponse = MakeShareable(new FJsonObject);
+            OpResponse->SetStringField(TEXT("status"), TEXT("error"));
+            OpResponse->SetStringField(TEXT("error"), TEXT("Nested batches are not supported"));
+        }
+        else if (bStopped)
+        {
+            OpResponse = MakeShareable(new FJsonObject);
+            OpResponse->SetStringField(TEXT("status"), TEXT("error"));
+            OpResponse->SetStringField(TEXT("error"), TEXT("Skipped after an earlier batch op failed"));
+        }
+        else
+        {
+            (*Op)->TryGetBoolField(TEXT("optional"), bOptional);
+            
+            const TSharedPtr<FJsonObject>* OpParams = nullptr;
+            TSharedPtr<FJsonObject> ParamsObject;
+            FString ReferenceError;
+            if ((*Op)->TryGetObjectField(TEXT("params"), OpParams))
             {
-                ResultJson = UMGCommands->HandleCommand(CommandType, Params);
+                ParamsObject = ResolveBatchReferences(*OpParams, Results, ReferenceError);
             }
             else
             {
-                ResponseJson->SetStringField(TEXT("status"), TEXT("error"));
-                ResponseJson->SetStringField(TEXT("error"), FString::Printf(TEXT("Unknown command: %s"), *CommandType));
-                
-                FString ResultString;
-                TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&ResultString);
-                FJsonSerializer::Serialize(ResponseJson.ToSharedRef(), Writer);
-                Promise.SetValue(ResultString);
-                return;
+                ParamsObject = MakeShareable(new FJsonObject);
             }
             
-            // Check if the result contains an error
-            bool bSuccess = true;
-            FString ErrorMessage;
-            
-            if (ResultJson->HasField(TEXT("success")))
-            {
-                bSuccess = ResultJson->GetBoolField(TEXT("success"));
-                if (!bSuccess && ResultJson->HasField(TEXT("error")))
-                {
-                    ErrorMessage = ResultJson->GetStringField(TEXT("error"));
-                }
-            }
-            
-            if (bSuccess)
+            if (ParamsObject.IsValid())
             {
-                // Set success status and include the result
-                ResponseJson->SetStringField(TEXT("status"), TEXT("success"));
-                ResponseJson->SetObjectField(TEXT("result"), ResultJson);
+                OpResponse = ExecuteCommandInternal(OpType, ParamsObject);
             }
             else
             {
-                // Set error status and include the error message
-                ResponseJson->SetStringField(TEXT("status"), TEXT("error"));
-                ResponseJson->SetStringField(TEXT("error"), ErrorMessage);
+                OpResponse = MakeShareable(new FJsonObject);
+                OpResponse->SetStringField(TEXT("status"), TEXT("error"));
+                OpResponse->SetStringField(TEXT("error"), ReferenceError);
             }
         }
-        catch (const std::exception& e)
+        
+        if (bStopOnError && !bOptional && OpResponse->GetStringField(TEXT("status")) != TEXT("success"))
         {
-            ResponseJson->SetStringField(TEXT("status"), TEXT("error"));
-            ResponseJson->SetStringField(TEXT("error"), UTF8_TO_TCHAR(e.what()));
+            bStopped = true;
         }
         
-        FString ResultString;
-        TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&ResultString);
-        FJsonSerializer::Serialize(ResponseJson.ToSharedRef(), Writer);
-        Promise.SetValue(ResultString);
-    });
+        Results.Add(MakeShareable(new FJsonValueObject(OpResponse)));
+    }
     
-    return Future.Get();
-}
\ No newline at end of file
+    ResultJson->SetArrayField(TEXT("results"), Results);
+    return ResultJson;
+}
@@ -31,4 +31,11 @@ private:
     // Editor viewport commands
     TSharedPtr<FJsonObject> HandleFocusViewport(const TSharedPtr<FJsonObject>& Params);
     TSharedPtr<FJsonObject> HandleTakeScreenshot(const TSharedPtr<FJsonObject>& Params);
+
+    // Blueprint edit batches
+    TSharedPtr<FJsonObject> HandleBeginBlueprintEditBatch(const TSharedPtr<FJsonObject>& Params);
+    TSharedPtr<FJsonObject> HandleEndBlueprintEditBatch(const TSharedPtr<FJsonObject>& Params);
+
+    // Number of open Blueprint edit batches; level viewports stay non-realtime while it is above zero
+    int32 BlueprintEditBatchDepth = 0;
 }; 
\ No newline at end of file
@@ -2,6 +2,8 @@
 
 #include "CoreMinimal.h"
 #include "HAL/Runnable.h"
+#include "HAL/ThreadSafeCounter.h"
+#include "Dom/JsonObject.h"
 #include "Sockets.h"
 #include "Interfaces/IPv4/IPv4Address.h"
 
@@ -25,10 +27,15 @@ public:
 protected:
 	void HandleClientConnection(TSharedPtr<FSocket> ClientSocket);
 	void ProcessMessage(TSharedPtr<FSocket> Client, const FString& Message);
+	
+	// Per-client receive loop and message handling
+	void ServeClient(TSharedPtr<FSocket> ClientSocket);
+	bool ExtractMessage(TArray<uint8>& MessageBytes, bool bFramed, TSharedPtr<FJsonObject>& OutMessage, bool& bOutCorrupt);
+	void ProcessCommand(TSharedPtr<FSocket> ClientSocket, const TSharedPtr<FJsonObject>& JsonObject, bool bFramed);
 
 private:
 	UUnrealMCPBridge* Bridge;
 	TSharedPtr<FSocket> ListenerSocket;
-	TSharedPtr<FSocket> ClientSocket;
 	bool bRunning;
+	FThreadSafeCounter ActiveClients;
 }; 
\ No newline at end of file
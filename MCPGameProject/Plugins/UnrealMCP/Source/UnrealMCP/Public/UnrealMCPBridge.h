@@ -42,9 +42,13 @@ public:
 	bool IsRunning() const { return bIsRunning; }
 
 	// Command execution
-	FString ExecuteCommand(const FString& CommandType, const TSharedPtr<FJsonObject>& Params);
+	FString ExecuteCommand(const FString& CommandType, const TSharedPtr<FJsonObject>& Params, const TSharedPtr<FJsonValue>& RequestId = nullptr);
 
 private:
+	// Command dispatch, run on the Game Thread
+	TSharedPtr<FJsonObject> ExecuteCommandInternal(const FString& CommandType, const TSharedPtr<FJsonObject>& Params);
+	TSharedPtr<FJsonObject> HandleBatch(const TSharedPtr<FJsonObject>& Params);
+
 	// Server state
 	bool bIsRunning;
 	TSharedPtr<FSocket> ListenerSocket;
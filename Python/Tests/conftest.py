@@ -0,0 +1,35 @@
+import uuid
+
+import pytest
+import requests
+
+from mcp_server import MCP_SERVER_URL
+
+
+def _assert_created(resp):
+    """Fail setup unless the call succeeded or found what it was creating already there."""
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data.get("success", True) or "already exists" in data.get("error", ""), data
+
+
+@pytest.fixture(scope="session")
+def http():
+    """One keep-alive HTTP session shared by every test that talks to the MCP server."""
+    session = requests.Session()
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def rotating_cube_bp(http):
+    """Provision a RotatingCubeBP with its CubeMesh component once per session and yield its name."""
+    # Unique per session, so parallel workers (-n auto) don't share or race on one Blueprint
+    name = f"RotatingCubeBP_{uuid.uuid4().hex[:8]}"
+    _assert_created(http.post(f"{MCP_SERVER_URL}/create_blueprint", json={"name": name, "parent_class": "Actor"}))
+    _assert_created(http.post(f"{MCP_SERVER_URL}/add_component_to_blueprint", json={
+        "blueprint_name": name,
+        "component_type": "StaticMeshComponent",
+        "component_name": "CubeMesh"
+    }))
+    yield name
@@ -0,0 +1,2 @@
+# Adjust this URL if your MCP server runs on a different port
+MCP_SERVER_URL = "http://localhost:8000"
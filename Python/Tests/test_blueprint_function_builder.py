@@ -0,0 +1,210 @@
+import json
+import time
+
+from ai_service import AIService, AIServiceConfig, _JsonMemberScanner
+from blueprint_function_tools import _FunctionBuilder
+
+FUNCTION_DATA = {
+    "function_name": "SpawnWave",
+    "return_type": "None",
+    "parameters": [],
+    "required_structs": [{"name": "FWaveInfo", "properties": [{"name": "Count {a}\"", "type": "int"}]}],
+    "required_enums": [{"name": "EWaveKind", "values": ["Small", "Large"]}],
+    "local_variables": [{"name": "Index", "type": "Integer"}],
+    "nodes": [
+        {"id": "start", "type": "FunctionEntry"},
+        {"id": "print", "type": "FunctionCall", "function": "PrintString"}
+    ],
+    "connections": [
+        {"from_node": "start", "from_pin": "then", "to_node": "print", "to_pin": "execute"}
+    ]
+}
+FUNCTION_TEXT = json.dumps(FUNCTION_DATA)
+
+
+class FakeHandle:
+    def __init__(self, index):
+        self.index = index
+        self.response = None
+
+    def ref(self, path="result.node_id"):
+        return {"$ref": f"{self.index}.{path}"}
+
+
+class FakeBatch:
+    def __init__(self, unreal):
+        self.unreal = unreal
+        self.ops = []
+
+    def add(self, command, params=None, required=True):
+        handle = FakeHandle(len(self.ops))
+        self.ops.append((command, params or {}, handle))
+        return handle
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.unreal.run(self.ops)
+
+
+class FakeUnreal:
+    """Runs batches the way the plugin does, resolving references to earlier ops in the same batch."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.batches = []
+
+    def batch(self):
+        return FakeBatch(self)
+
+    def run(self, ops):
+        results = []
+        self.batches.append(results)
+        for command, params, handle in ops:
+            params = {key: self._resolve(value, results) for key, value in params.items()}
+            if command in self.failing:
+                handle.response = {"status": "error", "error": f"{command} failed"}
+            else:
+                handle.response = {"status": "success", "result": {"node_id": f"N{len(results)}"}}
+            results.append((command, params, handle.response))
+
+    @staticmethod
+    def _resolve(value, results):
+        if isinstance(value, dict) and "$ref" in value:
+            index, _, _ = value["$ref"].partition(".")
+            return results[int(index)][2]["result"]["node_id"]
+        return value
+
+    def commands(self):
+        return [command for batch in self.batches for command, _, _ in batch]
+
+
+def _stream(builder, text, chunk_size):
+    """Feed text to the builder the way a streamed generation does, chunk_size characters at a time."""
+    scanner = _JsonMemberScanner()
+    for start in range(0, len(text), chunk_size):
+        AIService._emit_parts(scanner.feed(text[start:start + chunk_size]), builder.add_part)
+
+
+def test_member_scanner_whole_object():
+    parts = _JsonMemberScanner().feed(FUNCTION_TEXT + ' and {"extra": 1}')
+    keys = [(key, index) for key, index, _ in parts]
+    assert keys == [
+        ("function_name", None), ("return_type", None), ("parameters", None),
+        ("required_structs", 0), ("required_structs", None),
+        ("required_enums", 0), ("required_enums", None),
+        ("local_variables", 0), ("local_variables", None),
+        ("nodes", 0), ("nodes", 1), ("nodes", None),
+        ("connections", 0), ("connections", None)
+    ]
+    for key, index, text in parts:
+        expected = FUNCTION_DATA[key] if index is None else FUNCTION_DATA[key][index]
+        assert json.loads(text) == expected
+
+
+def test_member_scanner_split_anywhere():
+    whole = _JsonMemberScanner().feed(FUNCTION_TEXT)
+    for chunk_size in (1, 2, 7, 64):
+        scanner = _JsonMemberScanner()
+        parts = []
+        for start in range(0, len(FUNCTION_TEXT), chunk_size):
+            parts.extend(scanner.feed(FUNCTION_TEXT[start:start + chunk_size]))
+        assert parts == whole
+
+
+def test_member_scanner_stops_after_object():
+    scanner = _JsonMemberScanner()
+    scanner.feed(FUNCTION_TEXT)
+    assert scanner.feed(' {"extra": {"nested": 1}}') == []
+
+
+def test_member_scanner_truncated():
+    cut = FUNCTION_TEXT.index('{"id": "print"') + 5
+    parts = _JsonMemberScanner().feed(FUNCTION_TEXT[:cut])
+    assert ("nodes", 0) in [(key, index) for key, index, _ in parts]
+    assert all(not (key == "nodes" and index in (1, None)) for key, index, _ in parts)
+    assert "connections" not in [key for key, _, _ in parts]
+
+
+def test_builder_streams_only_prerequisites():
+    unreal = FakeUnreal()
+    builder = _FunctionBuilder(unreal, "BP_Waves")
+    _stream(builder, FUNCTION_TEXT, 5)
+    # Only the struct and enum may reach Unreal before the whole generation is validated
+    if builder._executor is not None:
+        builder._executor.shutdown(wait=True)
+    assert set(unreal.commands()) <= {"create_struct", "create_enum"}
+
+    assert builder.finish(FUNCTION_DATA)
+    commands = unreal.commands()
+    assert commands.count("create_struct") == 1
+    assert commands.count("create_enum") == 1
+    # The function and its whole body go out together, after the prerequisites
+    assert unreal.batches[-1][0][0] == "create_blueprint_function"
+    assert [command for command, _, _ in unreal.batches[-1]] == [
+        "create_blueprint_function", "add_local_variable",
+        "add_blueprint_node", "add_blueprint_node", "connect_blueprint_nodes"
+    ]
+
+
+def test_builder_truncated_stream_sends_no_function():
+    unreal = FakeUnreal()
+    builder = _FunctionBuilder(unreal, "BP_Waves")
+    _stream(builder, FUNCTION_TEXT[:FUNCTION_TEXT.index('"connections"')], 3)
+    assert not builder.finish(None)
+    assert set(unreal.commands()) == {"create_struct", "create_enum"}
+
+
+def test_builder_connection_uses_batch_references():
+    unreal = FakeUnreal()
+    builder = _FunctionBuilder(unreal, "BP_Waves")
+    _stream(builder, FUNCTION_TEXT, 11)
+    data = dict(FUNCTION_DATA, connections=FUNCTION_DATA["connections"] + [
+        {"from_node": "print", "from_pin": "then", "to_node": "missing", "to_pin": "execute"}
+    ])
+    assert builder.finish(data)
+
+    final = unreal.batches[-1]
+    nodes = {params["function"] if "function" in params else params["node_type"]: response["result"]["node_id"]
+             for command, params, response in final if command == "add_blueprint_node"}
+    connects = [params for command, params, _ in final if command == "connect_blueprint_nodes"]
+    # The connection to a node the function doesn't have is skipped
+    assert len(connects) == 1
+    assert connects[0]["source_node_id"] == nodes["FunctionEntry"]
+    assert connects[0]["target_node_id"] == nodes["PrintString"]
+
+
+def test_builder_function_failure():
+    unreal = FakeUnreal(failing={"create_blueprint_function"})
+    builder = _FunctionBuilder(unreal, "BP_Waves")
+    assert not builder.finish(FUNCTION_DATA)
+    assert len(unreal.batches) == 1
+
+
+def test_invalid_generation_sends_no_function():
+    # The connection is missing its target pin, so the generation as a whole fails validation
+    data = dict(FUNCTION_DATA, connections=[{"from_node": "start", "from_pin": "then", "to_node": "print"}])
+    text = json.dumps(data)
+    unreal = FakeUnreal()
+    builder = _FunctionBuilder(unreal, "BP_Waves")
+    _stream(builder, text, 9)
+    function_data = AIService(AIServiceConfig())._parse_generated_code(text)
+    assert function_data is None
+    assert not builder.finish(function_data)
+    assert set(unreal.commands()) == {"create_struct", "create_enum"}
+
+
+def test_invalid_disk_cache_entry_is_a_miss(tmp_path):
+    service = AIService(AIServiceConfig(), cache_path=str(tmp_path / "cache.db"))
+    service._disk_cache.execute(
+        "INSERT INTO results (key, value, created) VALUES (?, ?, ?)",
+        ("stale", json.dumps({"function_name": "Old"}), time.time())
+    )
+    service._disk_cache.execute(
+        "INSERT INTO results (key, value, created) VALUES (?, ?, ?)",
+        ("good", FUNCTION_TEXT, time.time())
+    )
+    assert service._cache_get("stale") is None
+    assert service._cache_get("good") == FUNCTION_DATA
@@ -1,34 +1,56 @@
 import pytest
-import requests
 
-# Adjust this URL if your MCP server runs on a different port
-MCP_SERVER_URL = "http://localhost:8000"
+from mcp_server import MCP_SERVER_URL
 
-@pytest.mark.parametrize("payload,expected_error", [
+# Stands in for the name of the session's rotating_cube_bp Blueprint
+ROTATING_CUBE_BP = object()
+
+SET_COMPONENT_PROPERTY_ERROR_CASES = [
     ({"component_name": "CubeMesh", "property_name": "Mobility", "property_value": "Movable"}, "Missing 'blueprint_name' parameter"),
     ({"blueprint_name": "NonExistentBP", "component_name": "CubeMesh", "property_name": "Mobility", "property_value": "Movable"}, "Blueprint not found"),
-    ({"blueprint_name": "RotatingCubeBP", "property_name": "Mobility", "property_value": "Movable"}, "Missing 'component_name' parameter"),
-    ({"blueprint_name": "RotatingCubeBP", "component_name": "NonExistentComponent", "property_name": "Mobility", "property_value": "Movable"}, "Component not found"),
-    ({"blueprint_name": "RotatingCubeBP", "component_name": "CubeMesh", "property_value": "Movable"}, "Missing 'property_name' parameter"),
-    ({"blueprint_name": "RotatingCubeBP", "component_name": "CubeMesh", "property_name": "NonExistentProperty", "property_value": "Movable"}, "Property NonExistentProperty not found"),
-])
-def test_set_component_property_errors(payload, expected_error):
-    resp = requests.post(f"{MCP_SERVER_URL}/set_component_property", json=payload)
+    ({"blueprint_name": ROTATING_CUBE_BP, "property_name": "Mobility", "property_value": "Movable"}, "Missing 'component_name' parameter"),
+    ({"blueprint_name": ROTATING_CUBE_BP, "component_name": "NonExistentComponent", "property_name": "Mobility", "property_value": "Movable"}, "Component not found"),
+    ({"blueprint_name": ROTATING_CUBE_BP, "component_name": "CubeMesh", "property_value": "Movable"}, "Missing 'property_name' parameter"),
+    ({"blueprint_name": ROTATING_CUBE_BP, "component_name": "CubeMesh", "property_name": "NonExistentProperty", "property_value": "Movable"}, "Property NonExistentProperty not found"),
+]
+
+def _with_blueprint(payload, blueprint_name):
+    """Fill the session's Blueprint name into a payload."""
+    return {key: blueprint_name if value is ROTATING_CUBE_BP else value for key, value in payload.items()}
+
+@pytest.mark.parametrize("payload,expected_error", SET_COMPONENT_PROPERTY_ERROR_CASES)
+def test_set_component_property_errors(http, rotating_cube_bp, payload, expected_error):
+    resp = http.post(f"{MCP_SERVER_URL}/set_component_property", json=_with_blueprint(payload, rotating_cube_bp))
     assert resp.status_code == 200
     data = resp.json()
     assert not data.get("success", True)
     assert expected_error in data.get("error", "")
 
-def test_add_component_to_blueprint_missing_params():
-    resp = requests.post(f"{MCP_SERVER_URL}/add_component_to_blueprint", json={"blueprint_name": "RotatingCubeBP"})
+def test_set_component_property_errors_batched(http, rotating_cube_bp):
+    calls = [
+        {"tool": "set_component_property", "args": _with_blueprint(payload, rotating_cube_bp)}
+        for payload, _ in SET_COMPONENT_PROPERTY_ERROR_CASES
+    ]
+    resp = http.post(f"{MCP_SERVER_URL}/batch", json={"calls": calls})
+    if resp.status_code == 404:
+        pytest.skip("MCP server has no /batch endpoint")
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert len(results) == len(SET_COMPONENT_PROPERTY_ERROR_CASES)
+    for data, (_, expected_error) in zip(results, SET_COMPONENT_PROPERTY_ERROR_CASES):
+        assert not data.get("success", True)
+        assert expected_error in data.get("error", "")
+
+def test_add_component_to_blueprint_missing_params(http, rotating_cube_bp):
+    resp = http.post(f"{MCP_SERVER_URL}/add_component_to_blueprint", json={"blueprint_name": rotating_cube_bp})
     assert resp.status_code == 200
     data = resp.json()
     assert not data.get("success", True)
     assert "Missing 'type' parameter" in data.get("error", "")
 
-def test_add_component_to_blueprint_invalid_blueprint():
+def test_add_component_to_blueprint_invalid_blueprint(http):
     payload = {"blueprint_name": "NonExistentBP", "component_type": "StaticMeshComponent", "component_name": "TestMesh"}
-    resp = requests.post(f"{MCP_SERVER_URL}/add_component_to_blueprint", json=payload)
+    resp = http.post(f"{MCP_SERVER_URL}/add_component_to_blueprint", json=payload)
     assert resp.status_code == 200
     data = resp.json()
     assert not data.get("success", True)
@@ -0,0 +1,314 @@
+import asyncio
+import json
+import socket
+import struct
+import threading
+
+import pytest
+
+import unreal_mcp_server as server
+from unreal_mcp_server import AsyncUnrealConnection, CommandBatch, UnrealConnection
+
+
+def read_frame(sock):
+    """Read one length-prefixed JSON frame, or None once the peer has closed."""
+    header = _read_exactly(sock, 4)
+    if header is None:
+        return None
+    (length,) = struct.unpack(">I", header)
+    return json.loads(_read_exactly(sock, length))
+
+
+def _read_exactly(sock, size):
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def frame(obj):
+    payload = json.dumps(obj).encode("utf-8")
+    return struct.pack(">I", len(payload)) + payload
+
+
+def reply(request, **result):
+    return frame({"id": request["id"], "status": "success", "result": {"echo": request["type"], **result}})
+
+
+class StubUnreal:
+    """TCP server standing in for the plugin; handle(conn, index) serves the index-th connection."""
+
+    def __init__(self, handle):
+        self.handle = handle
+        self.requests = []
+        self.connections = 0
+        self.listener = socket.create_server(("127.0.0.1", 0))
+        self.port = self.listener.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self.listener.accept()
+            except OSError:
+                return
+            index = self.connections
+            self.connections += 1
+            threading.Thread(target=self._run, args=(conn, index), daemon=True).start()
+
+    def _run(self, conn, index):
+        with conn:
+            self.handle(self, conn, index)
+
+    def read(self, conn):
+        request = read_frame(conn)
+        if request is not None:
+            self.requests.append(request)
+        return request
+
+    def close(self):
+        self.listener.close()
+
+
+@pytest.fixture
+def stub_factory():
+    stubs = []
+
+    def make(handle):
+        stub = StubUnreal(handle)
+        stubs.append(stub)
+        return stub
+
+    yield make
+    for stub in stubs:
+        stub.close()
+
+
+def _echo_forever(stub, conn, index):
+    while True:
+        request = stub.read(conn)
+        if request is None:
+            return
+        conn.sendall(reply(request, connection=index))
+
+
+def _paired_connection():
+    client, peer = socket.socketpair()
+    connection = UnrealConnection()
+    connection.socket = client
+    connection.connected = True
+    return connection, peer
+
+
+def test_frame_round_trip():
+    connection, peer = _paired_connection()
+    big = "x" * (server.RECV_BUFFER_SIZE * 3)
+
+    def serve():
+        request = read_frame(peer)
+        peer.sendall(frame({"id": request["id"], "status": "success", "result": {"params": request["params"], "big": big}}))
+
+    thread = threading.Thread(target=serve)
+    thread.start()
+    response = connection.send_command("create_material", {"asset_name": "M", "path": "/Game/ü"})
+    thread.join()
+
+    assert response["status"] == "success"
+    assert response["result"]["params"] == {"asset_name": "M", "path": "/Game/ü"}
+    # Larger than the receive buffer, which grows to fit it
+    assert response["result"]["big"] == big
+    assert "id" not in response
+
+
+def test_encode_command_with_preencoded_params():
+    encoded = UnrealConnection._encode_command(7, "create_material", b'{"asset_name":"M"}')
+    (length,) = struct.unpack(">I", encoded[:4])
+    assert length == len(encoded) - 4
+    assert json.loads(encoded[4:]) == {"id": 7, "type": "create_material", "params": {"asset_name": "M"}}
+
+
+def test_stale_and_split_frames():
+    connection, peer = _paired_connection()
+
+    def serve():
+        requests = [read_frame(peer) for _ in range(3)]
+        # A stale response to an earlier request, then all three answers, arriving in uneven pieces
+        data = frame({"id": requests[0]["id"] - 100, "status": "success", "result": {}})
+        data += b"".join(reply(request) for request in requests)
+        for start in range(0, len(data), 5):
+            peer.sendall(data[start:start + 5])
+
+    thread = threading.Thread(target=serve)
+    thread.start()
+    responses = connection.send_pipelined([("a", {}), ("b", {}), ("c", {})])
+    thread.join()
+
+    assert [response["result"]["echo"] for response in responses] == ["a", "b", "c"]
+
+
+def test_reused_connection_is_retried_once_if_nothing_answered(stub_factory):
+    def handle(stub, conn, index):
+        if index == 0:
+            # Answer the first command, then drop the connection on the second without answering
+            conn.sendall(reply(stub.read(conn), connection=index))
+            stub.read(conn)
+            return
+        _echo_forever(stub, conn, index)
+
+    stub = stub_factory(handle)
+    connection = UnrealConnection("127.0.0.1", stub.port)
+    assert connection.send_command("first", {})["result"]["connection"] == 0
+
+    response = connection.send_command("second", {})
+    assert response["status"] == "success"
+    assert response["result"]["connection"] == 1
+    assert [request["type"] for request in stub.requests] == ["first", "second", "second"]
+
+
+def test_no_retry_once_a_response_arrived(stub_factory):
+    def handle(stub, conn, index):
+        if index == 1:
+            # Answer only the first of the pipelined commands, then drop the connection
+            requests = [stub.read(conn), stub.read(conn)]
+            conn.sendall(reply(requests[0]))
+            return
+        _echo_forever(stub, conn, index)
+
+    stub = stub_factory(handle)
+    connection = UnrealConnection("127.0.0.1", stub.port)
+    # Open the first connection and close it from our side, so the next call reconnects to connection 1
+    assert connection.send_command("warm", {})["status"] == "success"
+    connection.disconnect()
+
+    responses = connection.send_pipelined([("a", {}), ("b", {})])
+    assert responses[0]["status"] == "success"
+    assert responses[1]["status"] == "error"
+    assert [request["type"] for request in stub.requests] == ["warm", "a", "b"]
+
+
+def test_fresh_connection_is_not_retried(stub_factory):
+    def handle(stub, conn, index):
+        stub.read(conn)
+
+    stub = stub_factory(handle)
+    connection = UnrealConnection("127.0.0.1", stub.port)
+    response = connection.send_command("lost", {})
+    assert response["status"] == "error"
+    assert stub.connections == 1
+
+
+def test_split_batch_response():
+    split = UnrealConnection._split_batch_response
+    assert split(None, 2) == [{"status": "error", "error": "No response from Unreal Engine"}] * 2
+    assert split({"status": "error", "error": "bad"}, 1) == [{"status": "error", "error": "bad"}]
+
+    mismatched = split({"status": "success", "result": {"results": [{"status": "success"}]}}, 2)
+    assert [response["status"] for response in mismatched] == ["error", "error"]
+
+    responses = split({"status": "success", "result": {"results": [
+        {"status": "success", "result": {"node_id": "N1"}},
+        {"success": False, "message": "no such node"},
+        {"status": "error", "message": "skipped"}
+    ]}}, 3)
+    assert responses[0] == {"status": "success", "result": {"node_id": "N1"}}
+    assert responses[1] == {"status": "error", "error": "no such node"}
+    assert responses[2]["error"] == "skipped"
+
+
+class RecordingConnection:
+    def __init__(self, response):
+        self.response = response
+        self.sent = []
+
+    def send_command(self, command, params):
+        self.sent.append((command, json.loads(params)))
+        return self.response
+
+
+def test_command_batch_payload_and_responses():
+    connection = RecordingConnection({"status": "success", "result": {"results": [
+        {"status": "success", "result": {"node_id": "N1"}},
+        {"status": "success", "result": {}}
+    ]}})
+    with CommandBatch(connection) as batch:
+        node = batch.add("add_blueprint_event_node", {"blueprint_name": "BP"})
+        link = batch.add("connect_blueprint_nodes", b'{"source_node_id":{"$ref":"0.result.node_id"}}', required=False)
+        assert node.ref() == {"$ref": "0.result.node_id"}
+
+    assert connection.sent == [("batch", {"ops": [
+        {"type": "add_blueprint_event_node", "params": {"blueprint_name": "BP"}},
+        {"type": "connect_blueprint_nodes", "params": {"source_node_id": {"$ref": "0.result.node_id"}}, "optional": True}
+    ], "stop_on_error": True})]
+    assert node.response["result"]["node_id"] == "N1"
+    assert link.response["status"] == "success"
+
+
+def test_send_batch_payload():
+    connection, peer = _paired_connection()
+
+    def serve():
+        request = read_frame(peer)
+        results = [{"status": "success", "result": {"echo": op["type"]}} for op in request["params"]["ops"]]
+        peer.sendall(frame({"id": request["id"], "status": "success", "result": {"results": results}}))
+        return request
+
+    thread = threading.Thread(target=serve)
+    thread.start()
+    responses = connection.send_batch([("a", {"x": 1}), ("b", b'{"y":2}')])
+    thread.join()
+    assert [response["result"]["echo"] for response in responses] == ["a", "b"]
+
+
+def test_async_coalesced_writes_and_out_of_order_responses(stub_factory, monkeypatch):
+    def handle(stub, conn, index):
+        requests = [stub.read(conn) for _ in range(3)]
+        # Answer in reverse order; each response must still reach its own command
+        conn.sendall(b"".join(reply(request) for request in reversed(requests)))
+        _echo_forever(stub, conn, index)
+
+    stub = stub_factory(handle)
+    monkeypatch.setattr(server, "UNREAL_PORT", stub.port)
+
+    async def run():
+        connection = AsyncUnrealConnection()
+        assert await connection.connect()
+        writes = []
+        writelines = connection.writer.writelines
+
+        def record(frames):
+            frames = list(frames)
+            writes.append(len(frames))
+            writelines(frames)
+
+        connection.writer.writelines = record
+        responses = await asyncio.gather(*(connection.send_command(name, {}) for name in ("a", "b", "c")))
+        await connection.disconnect()
+        return writes, responses
+
+    writes, responses = asyncio.run(run())
+    # Frames queued in the same loop iteration go out in a single write
+    assert writes == [3]
+    assert [response["result"]["echo"] for response in responses] == ["a", "b", "c"]
+
+
+def test_async_connection_lost_fails_pending_at_once(stub_factory, monkeypatch):
+    def handle(stub, conn, index):
+        stub.read(conn)
+
+    stub = stub_factory(handle)
+    monkeypatch.setattr(server, "UNREAL_PORT", stub.port)
+    monkeypatch.setattr(server, "UNREAL_COMMAND_TIMEOUT", 5.0)
+
+    async def run():
+        connection = AsyncUnrealConnection()
+        assert await connection.connect()
+        response = await asyncio.wait_for(connection.send_command("lost", {}), timeout=2.0)
+        return connection, response
+
+    connection, response = asyncio.run(run())
+    assert response["status"] == "error"
+    assert not connection.connected
+    assert connection.writer is None
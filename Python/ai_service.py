@@ -5,18 +5,241 @@ This module provides integration with AI services like OpenAI, Google Gemini,
 and local LLM agents for generating Blueprint functions from natural language descriptions.
 """
 
+import asyncio
+import copy
+import hashlib
 import logging
 import json
+import fastjsonschema
 import requests
 import os
-from typing import Dict, Any, Optional, List
+import random
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import TYPE_CHECKING, Callable, Dict, Any, Optional, List, Tuple
+
+if TYPE_CHECKING:
+    import aiohttp
+
+# Prefer orjson for (de)serialization when it is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+    
+    def _json_dumps_pretty(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+    
+    def _json_dumps_pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+# Sentence embeddings let near-identical descriptions share a cached result; without
+# sentence-transformers only exact prompt matches hit the cache
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
 
 # Get logger
 logger = logging.getLogger("UnrealMCP")
 
+# Connect timeout in seconds for calls to the AI providers (read timeout is configurable)
+CONNECT_TIMEOUT = 5
+
+# Base delay in seconds for retrying async calls rejected with HTTP 429
+RATE_LIMIT_BACKOFF_BASE = 1.0
+
+# Number of parsed generation results kept in memory, keyed by service and prompt
+RESULT_CACHE_SIZE = 256
+
+# Embedding model for matching similar descriptions in the result cache
+SEMANTIC_CACHE_MODEL = "all-MiniLM-L6-v2"
+
+# Limits for the persistent result cache, enforced each time it is opened
+DISK_CACHE_TTL_S = 30 * 24 * 3600
+DISK_CACHE_MAX_BYTES = 500 * 1024 * 1024
+
+# Parsed config files keyed by path, stored with the mtime they were read at
+_CONFIG_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+# Callback for the parts of a generated function as they stream in:
+# (top-level key, element index for an item of an array member or None for a whole member, value)
+PartCallback = Callable[[str, Optional[int], Any], None]
+
+# Shape of a generated function, limited to the fields the Blueprint builder reads
+_NAMED_TYPED = {
+    "type": "object",
+    "required": ["name", "type"],
+    "properties": {"name": {"type": "string"}, "type": {"type": "string"}}
+}
+
+_FUNCTION_DATA_SCHEMA = {
+    "type": "object",
+    "required": ["function_name", "nodes", "connections"],
+    "properties": {
+        "function_name": {"type": "string", "minLength": 1},
+        "return_type": {"type": "string"},
+        "parameters": {"type": "array", "items": _NAMED_TYPED},
+        "local_variables": {"type": "array", "items": _NAMED_TYPED},
+        "nodes": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["id", "type"],
+                "properties": {
+                    "id": {"type": "string"},
+                    "type": {"type": "string"},
+                    "function": {"type": "string"},
+                    "parameters": {"type": "object"},
+                    "position": {"type": "array", "items": {"type": "number"}}
+                }
+            }
+        },
+        "connections": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["from_node", "from_pin", "to_node", "to_pin"],
+                "properties": {
+                    "from_node": {"type": "string"},
+                    "from_pin": {"type": "string"},
+                    "to_node": {"type": "string"},
+                    "to_pin": {"type": "string"}
+                }
+            }
+        },
+        "required_structs": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["name", "properties"],
+                "properties": {"name": {"type": "string"}, "properties": {"type": "array", "items": _NAMED_TYPED}}
+            }
+        },
+        "required_enums": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["name", "values"],
+                "properties": {"name": {"type": "string"}, "values": {"type": "array", "items": {"type": "string"}}}
+            }
+        }
+    }
+}
+
+# Compiled once at import; raises fastjsonschema.JsonSchemaException on invalid data
+_validate_function_data = fastjsonschema.compile(_FUNCTION_DATA_SCHEMA)
+
+# Validators for streamed parts, compiled on first use, by (top-level key, whether the part is one array item)
+_part_validators: Dict[Tuple[str, bool], Callable[[Any], Any]] = {}
+
+def _validate_part(key: str, item: bool, value: Any):
+    """Check a streamed part against its piece of the function schema; raises JsonSchemaException."""
+    schema = _FUNCTION_DATA_SCHEMA["properties"].get(key)
+    if schema is not None and item:
+        schema = schema.get("items")
+    if schema is None:
+        return
+    validator = _part_validators.get((key, item))
+    if validator is None:
+        validator = _part_validators[(key, item)] = fastjsonschema.compile(schema)
+    validator(value)
+
+SYSTEM_PROMPT = "You are an expert Unreal Engine Blueprint developer. Generate Blueprint function code based on the description."
+
+# Static parts of the generation prompt, built once at import rather than on every call. The
+# prompt runs from the most to the least stable part (format, Blueprint context, description),
+# so repeated requests share a long byte-identical prefix that providers can cache
+_PROMPT_HEAD = """Please provide your response in the following JSON format:
+
+```json
+{
+  "required_structs": [
+    {
+      "name": "MyCustomStruct",
+      "properties": [
+        {"name": "Property1", "type": "Float"},
+        {"name": "Property2", "type": "String"}
+      ]
+    }
+  ],
+  "required_enums": [
+    {
+      "name": "MyCustomEnum",
+      "values": ["Value1", "Value2", "Value3"]
+    }
+  ],
+  "function_name": "YourFunctionName",
+  "description": "Brief description of what the function does",
+  "return_type": "ReturnType",
+  "parameters": [
+    {"name": "param1", "type": "Type1", "description": "Description of param1"},
+    {"name": "param2", "type": "Type2", "description": "Description of param2"}
+  ],
+  "local_variables": [
+    {"name": "localVar1", "type": "Type1", "description": "Description of localVar1"}
+  ],
+  "nodes": [
+    {
+      "type": "FunctionEntry",
+      "id": "node1",
+      "position": [0, 0]
+    },
+    {
+      "type": "FunctionCall",
+      "id": "node2",
+      "function": "PrintString",
+      "target": "self",
+      "parameters": {"InString": "Hello World"},
+      "position": [200, 0]
+    }
+  ],
+  "connections": [
+    {"from_node": "node1", "from_pin": "Then", "to_node": "node2", "to_pin": "execute"}
+  ]
+}
+```
+
+Keep the fields in this order, with every node listed before the connections that use it.
+
+Focus on creating a practical, efficient implementation that follows Unreal Engine best practices.
+
+"""
+
+_PROMPT_TASK = "Create an Unreal Engine Blueprint function that does the following:\n\n"
+
+def _by_name(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Sort Blueprint context entries by name."""
+    return sorted(entries, key=lambda entry: entry['name'])
+
 class AIServiceConfig:
     """Configuration for AI services."""
     
+    # Attributes persisted to and loaded from the config file
+    _FIELDS = (
+        "openai_api_key",
+        "gemini_api_key",
+        "local_agent_url",
+        "selected_service",
+        "temperature",
+        "max_tokens",
+        "max_concurrent_requests",
+        "request_timeout_s",
+        "max_retries",
+        "semantic_cache_threshold"
+    )
+    
     def __init__(self):
         """Initialize with default configuration."""
         self.openai_api_key = ""
@@ -25,27 +248,34 @@ class AIServiceConfig:
         self.selected_service = "local_agent"  # Default to local agent
         self.temperature = 0.7
         self.max_tokens = 2048
+        self.max_concurrent_requests = 8  # Cap on in-flight async provider calls
+        self.request_timeout_s = 60.0  # Read timeout for a single provider call
+        self.max_retries = 3  # Retries for transient provider errors (429/5xx)
+        self.semantic_cache_threshold = 0.95  # Cosine similarity for reusing a cached result; None disables
         
     def load_from_file(self, file_path: str) -> bool:
-        """Load configuration from a JSON file."""
+        """
+        Load configuration from a JSON file, reusing the last parse if the file is unchanged.
+        
+        Raises FileNotFoundError if the file does not exist; other errors are logged and return False.
+        """
         try:
-            with open(file_path, 'r') as f:
-                config = json.load(f)
+            mtime = os.stat(file_path).st_mtime_ns
+            cached = _CONFIG_CACHE.get(file_path)
+            if cached is not None and cached[0] == mtime:
+                config = cached[1]
+            else:
+                with open(file_path, 'r') as f:
+                    config = _json_loads(f.read())
+                _CONFIG_CACHE[file_path] = (mtime, config)
                 
-            if 'openai_api_key' in config:
-                self.openai_api_key = config['openai_api_key']
-            if 'gemini_api_key' in config:
-                self.gemini_api_key = config['gemini_api_key']
-            if 'local_agent_url' in config:
-                self.local_agent_url = config['local_agent_url']
-            if 'selected_service' in config:
-                self.selected_service = config['selected_service']
-            if 'temperature' in config:
-                self.temperature = config['temperature']
-            if 'max_tokens' in config:
-                self.max_tokens = config['max_tokens']
+            for field in self._FIELDS:
+                if field in config:
+                    setattr(self, field, config[field])
                 
             return True
+        except FileNotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Error loading AI service config: {e}")
             return False
@@ -53,96 +283,435 @@ class AIServiceConfig:
     def save_to_file(self, file_path: str) -> bool:
         """Save configuration to a JSON file."""
         try:
-            config = {
-                'openai_api_key': self.openai_api_key,
-                'gemini_api_key': self.gemini_api_key,
-                'local_agent_url': self.local_agent_url,
-                'selected_service': self.selected_service,
-                'temperature': self.temperature,
-                'max_tokens': self.max_tokens
-            }
+            config = {field: getattr(self, field) for field in self._FIELDS}
             
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
             
             with open(file_path, 'w') as f:
-                json.dump(config, f, indent=4)
+                f.write(_json_dumps_pretty(config))
+            
+            # Keep the cache in step with what was just written
+            _CONFIG_CACHE[file_path] = (os.stat(file_path).st_mtime_ns, config)
                 
             return True
         except Exception as e:
             logger.error(f"Error saving AI service config: {e}")
             return False
 
+class _JsonObjectScanner:
+    """
+    Incrementally track brace depth to detect when a complete JSON object has been seen.
+    
+    Braces inside string literals are ignored. Once the first top-level object
+    closes, ``start`` and ``end`` hold its offsets in the text fed so far.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escape = False
+        self.pos = 0
+        self.start = -1
+        self.end = -1
+
+    def feed(self, text: str) -> bool:
+        """Consume more text; return True once the first top-level object has closed."""
+        for i, ch in enumerate(text, self.pos):
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif ch == '\\':
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '{':
+                if not self.started:
+                    self.started = True
+                    self.start = i
+                self.depth += 1
+            elif not self.started:
+                continue
+            elif ch == '"':
+                self.in_string = True
+            elif ch == '}':
+                self.depth -= 1
+                if self.depth == 0:
+                    self.end = i + 1
+                    self.pos = self.end
+                    return True
+        self.pos += len(text)
+        return False
+
+class _JsonMemberScanner:
+    """
+    Incrementally split the first top-level JSON object into its members as they complete.
+    
+    Each feed() returns the parts the new text completed, as (key, index, text):
+    every object in an array member as (key, position in the array, text), and
+    every member as (key, None, value text) once the text after it has arrived.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.stack = []
+        self.in_string = False
+        self.escape = False
+        self.string_start = -1
+        self.key = None
+        self.value_start = -1
+        self.element_start = -1
+        self.element_index = 0
+        self.done = False
+
+    def feed(self, text: str) -> List[Tuple[str, Optional[int], str]]:
+        """Consume more text; return the parts it completed, and none once the object has ended."""
+        parts = []
+        if self.done:
+            return parts
+        pos = len(self.text)
+        self.text += text
+        stack = self.stack
+        for i, ch in enumerate(text, pos):
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif ch == '\\':
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+                    # A string directly inside the top-level object before its colon is a key
+                    if len(stack) == 1 and self.value_start < 0:
+                        self.key = _json_loads(self.text[self.string_start:i + 1])
+            elif ch == '"':
+                if stack:
+                    self.in_string = True
+                    self.string_start = i
+            elif ch == '{' or ch == '[':
+                if not stack and ch == '[':
+                    continue
+                stack.append(ch)
+                if ch == '{' and stack == ['{', '[', '{']:
+                    self.element_start = i
+            elif not stack:
+                continue
+            elif ch == '}' or ch == ']':
+                stack.pop()
+                if ch == '}' and stack == ['{', '[']:
+                    parts.append((self.key, self.element_index, self.text[self.element_start:i + 1]))
+                    self.element_index += 1
+                elif not stack:
+                    self._end_member(i, parts)
+                    self.done = True
+                    return parts
+            elif len(stack) == 1:
+                if ch == ':':
+                    self.value_start = i + 1
+                elif ch == ',':
+                    self._end_member(i, parts)
+        return parts
+
+    def _end_member(self, end: int, parts: List[Tuple[str, Optional[int], str]]):
+        """Record the member whose value ends just before end, if any."""
+        if self.key is not None and self.value_start >= 0:
+            parts.append((self.key, None, self.text[self.value_start:end]))
+        self.key = None
+        self.value_start = -1
+        self.element_index = 0
+
 class AIService:
     """Service for generating Blueprint code using AI."""
     
-    def __init__(self, config: AIServiceConfig):
-        """Initialize with the provided configuration."""
+    def __init__(self, config: AIServiceConfig, cache_path: Optional[str] = None):
+        """
+        Initialize with the provided configuration.
+        
+        Args:
+            config: AI service configuration
+            cache_path: Optional SQLite file used to persist generation results across restarts
+        """
         self.config = config
         
+        # Reuse one session for the lifetime of the service so repeated generations
+        # keep their TCP/TLS connections alive instead of handshaking on every call.
+        # Transient provider errors are retried a bounded number of times.
+        self._session = requests.Session()
+        retry = Retry(
+            total=config.max_retries,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=["POST"]
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        
+        # aiohttp sessions are bound to the event loop they were created on,
+        # so the async session is created lazily from inside a running loop
+        self._aio_session = None
+        self._aio_loop = None
+        self._sem = None
+        
+        # LRU of parsed results so repeated prompts skip the remote round-trip
+        self._result_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        self._disk_cache = self._open_disk_cache(cache_path) if cache_path else None
+        
+        # Description embeddings of the results in the in-memory LRU, by cache key, with the
+        # key of the rest of their prompt; loaded lazily, as the model takes a while to load
+        self._embedding_model = None
+        self._embedding_model_lock = threading.Lock()
+        self._embeddings: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        
+        # Provider implementations keyed by the selected_service value
+        self._providers = {
+            "openai": self._generate_with_openai,
+            "gemini": self._generate_with_gemini,
+            "local": self._generate_with_local_agent
+        }
+        self._async_providers = {
+            "openai": self._agenerate_with_openai,
+            "gemini": self._agenerate_with_gemini,
+            "local": self._agenerate_with_local_agent
+        }
+        
     def generate_blueprint_function(self, 
                                    function_description: str,
-                                   blueprint_context: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+                                   blueprint_context: Dict[str, Any] = None,
+                                   on_part: Optional[PartCallback] = None) -> Optional[Dict[str, Any]]:
         """
         Generate a Blueprint function from a natural language description.
         
         Args:
             function_description: Natural language description of the function
             blueprint_context: Optional context about the Blueprint (existing functions, variables, etc.)
+            on_part: Optional callback for the parts of the function as they stream in, before
+                the whole is validated; not called for cached results or the local agent
             
         Returns:
             Dict containing the generated function details, or None if generation failed
         """
-        if self.config.selected_service == "openai":
-            return self._generate_with_openai(function_description, blueprint_context)
-        elif self.config.selected_service == "gemini":
-            return self._generate_with_gemini(function_description, blueprint_context)
-        elif self.config.selected_service == "local":
-            return self._generate_with_local_agent(function_description, blueprint_context)
-        else:
+        prompt, cache_key, cached, similar = self._cached_generation(function_description, blueprint_context)
+        if cached is not None:
+            return cached
+        
+        generate = self._providers.get(self.config.selected_service)
+        if generate is None:
             logger.error(f"Unsupported AI service: {self.config.selected_service}")
             return None
             
-    def _generate_with_openai(self, 
-                             function_description: str,
-                             blueprint_context: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+        function_data = generate(prompt, on_part)
+        self._cache_put(cache_key, function_data, similar)
+        return function_data
+            
+    async def agenerate_blueprint_function(self, 
+                                          function_description: str,
+                                          blueprint_context: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+        """
+        Asynchronously generate a Blueprint function from a natural language description.
+        
+        Several generations can be awaited together with asyncio.gather() so their
+        network waits overlap instead of running one after another.
+        
+        Args:
+            function_description: Natural language description of the function
+            blueprint_context: Optional context about the Blueprint (existing functions, variables, etc.)
+            
+        Returns:
+            Dict containing the generated function details, or None if generation failed
+        """
+        # The lookup may load the embedding model and encode the description, so keep it off the event loop
+        prompt, cache_key, cached, similar = await asyncio.to_thread(
+            self._cached_generation, function_description, blueprint_context)
+        if cached is not None:
+            return cached
+        
+        agenerate = self._async_providers.get(self.config.selected_service)
+        if agenerate is None:
+            logger.error(f"Unsupported AI service: {self.config.selected_service}")
+            return None
+            
+        function_data = await agenerate(prompt)
+        self._cache_put(cache_key, function_data, similar)
+        return function_data
+            
+    async def aclose(self):
+        """Close the async HTTP session if one was opened."""
+        if self._aio_session is not None and not self._aio_session.closed:
+            await self._aio_session.close()
+        self._aio_session = None
+        self._aio_loop = None
+        self._sem = None
+        
+    def _open_disk_cache(self, cache_path: str) -> Optional[sqlite3.Connection]:
+        """Open (creating if needed) the persistent result cache and prune expired or excess entries."""
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            db = sqlite3.connect(cache_path, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            db.execute("DELETE FROM results WHERE created < ?", (time.time() - DISK_CACHE_TTL_S,))
+            
+            # Keep the newest entries that fit under the size cap
+            db.execute(
+                "DELETE FROM results WHERE key IN ("
+                "SELECT key FROM (SELECT key, SUM(LENGTH(value)) OVER (ORDER BY created DESC) AS total "
+                "FROM results) WHERE total > ?)",
+                (DISK_CACHE_MAX_BYTES,)
+            )
+            return db
+        except Exception as e:
+            logger.error(f"Error opening AI result cache {cache_path}: {e}")
+            return None
+            
+    def _cache_key(self, prompt: str) -> str:
+        """Build the result cache key for a prompt sent to the selected service."""
+        # Collapse whitespace so cosmetic differences in the prompt share an entry
+        normalized = " ".join(prompt.split())
+        key = f"{self.config.selected_service}|{normalized}".encode("utf-8")
+        return hashlib.blake2b(key, digest_size=16).hexdigest()
+        
+    def _cached_generation(self,
+                           function_description: str,
+                           blueprint_context: Optional[Dict[str, Any]]) -> Tuple[str, str, Optional[Dict[str, Any]], Optional[Tuple[str, Any]]]:
+        """
+        Look a generation up in the result cache, first by exact prompt and then by similar description.
+        
+        Args:
+            function_description: Natural language description of the function
+            blueprint_context: Optional context about the Blueprint
+            
+        Returns:
+            (prompt, cache key, cached result or None, embedding to store the result under or None)
+        """
+        prompt = self._prepare_prompt(function_description, blueprint_context)
+        cache_key = self._cache_key(prompt)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info("Using cached Blueprint function generation result")
+            return prompt, cache_key, cached, None
+        
+        model = self._load_embedding_model()
+        if model is None:
+            return prompt, cache_key, None, None
+        
+        # Only results generated for the same service and Blueprint context are candidates
+        scope = self._cache_key(self._prepare_prompt("", blueprint_context))
+        embedding = model.encode(function_description, normalize_embeddings=True)
+        with self._result_cache_lock:
+            scores = [
+                (float(embedding @ other), key)
+                for key, (other_scope, other) in self._embeddings.items()
+                if other_scope == scope
+            ]
+        score, similar_key = max(scores, default=(0.0, None))
+        if similar_key is not None and score >= self.config.semantic_cache_threshold:
+            cached = self._cache_get(similar_key)
+            if cached is not None:
+                logger.info("Using cached result of a similar Blueprint function description (similarity %.3f)", score)
+                return prompt, cache_key, cached, None
+        return prompt, cache_key, None, (scope, embedding)
+        
+    def _load_embedding_model(self):
+        """Return the description embedding model, loading it on first use; None if unavailable or disabled."""
+        if SentenceTransformer is None or self.config.semantic_cache_threshold is None:
+            return None
+        # Generations now run the lookup on worker threads; load the model only once between them
+        with self._embedding_model_lock:
+            if self._embedding_model is None:
+                try:
+                    self._embedding_model = SentenceTransformer(SEMANTIC_CACHE_MODEL)
+                except Exception as e:
+                    logger.error(f"Error loading embedding model {SEMANTIC_CACHE_MODEL}, using exact matches only: {e}")
+                    self._embedding_model = False
+        return self._embedding_model or None
+        
+    def _cache_get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached result from memory or disk, or None on a miss."""
+        with self._result_cache_lock:
+            function_data = self._result_cache.get(cache_key)
+            if function_data is not None:
+                self._result_cache.move_to_end(cache_key)
+                return copy.deepcopy(function_data)
+                
+            if self._disk_cache is None:
+                return None
+            try:
+                row = self._disk_cache.execute(
+                    "SELECT value FROM results WHERE key = ?", (cache_key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.error(f"Error reading AI result cache: {e}")
+                return None
+            if row is None:
+                return None
+                
+            # Entries written by an older version may not match the current schema; they
+            # would otherwise reach Unreal without ever being validated
+            function_data = _json_loads(row[0])
+            try:
+                _validate_function_data(function_data)
+            except fastjsonschema.JsonSchemaException as e:
+                logger.warning(f"Ignoring invalid cached Blueprint function: {e.message}")
+                return None
+                
+            # Promote the disk hit into memory for subsequent lookups
+            self._remember(cache_key, copy.deepcopy(function_data))
+        return function_data
+        
+    def _cache_put(self, cache_key: str, function_data: Optional[Dict[str, Any]],
+                   embedding: Optional[Tuple[str, Any]] = None):
+        """Store a successful result in memory and, if enabled, on disk, along with its description embedding."""
+        if function_data is None:
+            return
+        with self._result_cache_lock:
+            self._remember(cache_key, copy.deepcopy(function_data))
+            if embedding is not None:
+                self._embeddings[cache_key] = embedding
+            if self._disk_cache is None:
+                return
+            try:
+                self._disk_cache.execute(
+                    "INSERT OR REPLACE INTO results (key, value, created) VALUES (?, ?, ?)",
+                    (cache_key, _json_dumps(function_data), time.time())
+                )
+            except sqlite3.Error as e:
+                logger.error(f"Error writing AI result cache: {e}")
+                
+    def _remember(self, cache_key: str, function_data: Dict[str, Any]):
+        """Insert into the in-memory LRU, evicting the least recently used entry when full."""
+        self._result_cache[cache_key] = function_data
+        self._result_cache.move_to_end(cache_key)
+        if len(self._result_cache) > RESULT_CACHE_SIZE:
+            evicted, _ = self._result_cache.popitem(last=False)
+            self._embeddings.pop(evicted, None)
+            
+    def _generate_with_openai(self, prompt: str, on_part: Optional[PartCallback] = None) -> Optional[Dict[str, Any]]:
         """Generate Blueprint function using OpenAI API."""
         try:
             if not self.config.openai_api_key:
                 logger.error("OpenAI API key not configured")
                 return None
                 
-            # Prepare the prompt
-            prompt = self._prepare_prompt(function_description, blueprint_context)
-            
-            # Call OpenAI API
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.config.openai_api_key}"
-            }
+            # Call OpenAI API, streaming the completion as server-sent events
+            url, headers, payload = self._openai_request(prompt, stream=True)
             
-            payload = {
-                "model": "gpt-4",  # Use GPT-4 for best results
-                "messages": [
-                    {"role": "system", "content": "You are an expert Unreal Engine Blueprint developer. Generate Blueprint function code based on the description."},
-                    {"role": "user", "content": prompt}
-                ],
-                "temperature": self.config.temperature,
-                "max_tokens": self.config.max_tokens
-            }
-            
-            response = requests.post(
-                "https://api.openai.com/v1/chat/completions",
+            with self._session.post(
+                url,
                 headers=headers,
-                json=payload
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"OpenAI API error: {response.status_code} - {response.text}")
-                return None
-                
-            result = response.json()
-            function_code = result['choices'][0]['message']['content']
+                json=payload,
+                timeout=(CONNECT_TIMEOUT, self.config.request_timeout_s),
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    logger.error(f"OpenAI API error: {response.status_code} - {response.text}")
+                    return None
+                    
+                function_code = self._read_sse_text(response, self._openai_delta_text, on_part)
             
             # Parse the generated code
             return self._parse_generated_code(function_code)
@@ -151,50 +720,28 @@ class AIService:
             logger.error(f"Error generating with OpenAI: {e}")
             return None
             
-    def _generate_with_gemini(self, 
-                             function_description: str,
-                             blueprint_context: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+    def _generate_with_gemini(self, prompt: str, on_part: Optional[PartCallback] = None) -> Optional[Dict[str, Any]]:
         """Generate Blueprint function using Google Gemini API."""
         try:
             if not self.config.gemini_api_key:
                 logger.error("Gemini API key not configured")
                 return None
                 
-            # Prepare the prompt
-            prompt = self._prepare_prompt(function_description, blueprint_context)
-            
-            # Call Gemini API
-            headers = {
-                "Content-Type": "application/json"
-            }
-            
-            payload = {
-                "contents": [
-                    {
-                        "parts": [
-                            {"text": "You are an expert Unreal Engine Blueprint developer. Generate Blueprint function code based on the description."},
-                            {"text": prompt}
-                        ]
-                    }
-                ],
-                "generationConfig": {
-                    "temperature": self.config.temperature,
-                    "maxOutputTokens": self.config.max_tokens
-                }
-            }
+            # Call Gemini API, streaming the candidates as server-sent events
+            url, headers, payload = self._gemini_request(prompt, stream=True)
             
-            response = requests.post(
-                f"https://generativelanguage.googleapis.com/v1beta/models/gemini-pro:generateContent?key={self.config.gemini_api_key}",
+            with self._session.post(
+                url,
                 headers=headers,
-                json=payload
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"Gemini API error: {response.status_code} - {response.text}")
-                return None
-                
-            result = response.json()
-            function_code = result['candidates'][0]['content']['parts'][0]['text']
+                json=payload,
+                timeout=(CONNECT_TIMEOUT, self.config.request_timeout_s),
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    logger.error(f"Gemini API error: {response.status_code} - {response.text}")
+                    return None
+                    
+                function_code = self._read_sse_text(response, self._gemini_delta_text, on_part)
             
             # Parse the generated code
             return self._parse_generated_code(function_code)
@@ -203,40 +750,29 @@ class AIService:
             logger.error(f"Error generating with Gemini: {e}")
             return None
             
-    def _generate_with_local_agent(self, 
-                                  function_description: str,
-                                  blueprint_context: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
-        """Generate Blueprint function using a local LLM agent."""
+    def _generate_with_local_agent(self, prompt: str, on_part: Optional[PartCallback] = None) -> Optional[Dict[str, Any]]:
+        """Generate Blueprint function using a local LLM agent; its response isn't streamed, so on_part is unused."""
         try:
             if not self.config.local_agent_url:
                 logger.error("Local agent URL not configured")
                 return None
                 
-            # Prepare the prompt
-            prompt = self._prepare_prompt(function_description, blueprint_context)
-            
             # Call local agent API
-            headers = {
-                "Content-Type": "application/json"
-            }
+            url, headers, payload = self._local_agent_request(prompt)
             
-            payload = {
-                "prompt": "You are an expert Unreal Engine Blueprint developer. Generate Blueprint function code based on the description.\n\n" + prompt,
-                "temperature": self.config.temperature,
-                "max_tokens": self.config.max_tokens
-            }
-            
-            response = requests.post(
-                f"{self.config.local_agent_url}/generate",
+            response = self._session.post(
+                url,
                 headers=headers,
-                json=payload
+                json=payload,
+                timeout=(CONNECT_TIMEOUT, self.config.request_timeout_s)
             )
             
             if response.status_code != 200:
                 logger.error(f"Local agent API error: {response.status_code} - {response.text}")
                 return None
                 
-            result = response.json()
+            result = _json_loads(response.content)
+            self._log_token_usage(result)
             function_code = result['generated_text']
             
             # Parse the generated code
@@ -246,138 +782,352 @@ class AIService:
             logger.error(f"Error generating with local agent: {e}")
             return None
             
+    async def _agenerate_with_openai(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """Asynchronously generate Blueprint function using OpenAI API."""
+        try:
+            if not self.config.openai_api_key:
+                logger.error("OpenAI API key not configured")
+                return None
+                
+            url, headers, payload = self._openai_request(prompt)
+            
+            result = await self._apost_json(url, headers, payload, "OpenAI")
+            if result is None:
+                return None
+                
+            function_code = result['choices'][0]['message']['content']
+            return self._parse_generated_code(function_code)
+            
+        except Exception as e:
+            logger.error(f"Error generating with OpenAI: {e}")
+            return None
+            
+    async def _agenerate_with_gemini(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """Asynchronously generate Blueprint function using Google Gemini API."""
+        try:
+            if not self.config.gemini_api_key:
+                logger.error("Gemini API key not configured")
+                return None
+                
+            url, headers, payload = self._gemini_request(prompt)
+            
+            result = await self._apost_json(url, headers, payload, "Gemini")
+            if result is None:
+                return None
+                
+            function_code = result['candidates'][0]['content']['parts'][0]['text']
+            return self._parse_generated_code(function_code)
+            
+        except Exception as e:
+            logger.error(f"Error generating with Gemini: {e}")
+            return None
+            
+    async def _agenerate_with_local_agent(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """Asynchronously generate Blueprint function using a local LLM agent."""
+        try:
+            if not self.config.local_agent_url:
+                logger.error("Local agent URL not configured")
+                return None
+                
+            url, headers, payload = self._local_agent_request(prompt)
+            
+            result = await self._apost_json(url, headers, payload, "Local agent")
+            if result is None:
+                return None
+                
+            function_code = result['generated_text']
+            return self._parse_generated_code(function_code)
+            
+        except Exception as e:
+            logger.error(f"Error generating with local agent: {e}")
+            return None
+            
+    async def _get_aio_session(self) -> "aiohttp.ClientSession":
+        """Get the shared aiohttp session, creating it on the running event loop if needed."""
+        # Imported on first async use; it is the slowest import here and most servers never use it
+        import aiohttp
+        
+        loop = asyncio.get_running_loop()
+        if self._aio_session is None or self._aio_session.closed or self._aio_loop is not loop:
+            self._aio_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32),
+                json_serialize=_json_dumps
+            )
+            self._aio_loop = loop
+            self._sem = asyncio.Semaphore(max(1, self.config.max_concurrent_requests))
+        return self._aio_session
+            
+    async def _apost_json(self,
+                          url: str,
+                          headers: Dict[str, str],
+                          payload: Dict[str, Any],
+                          service_name: str) -> Optional[Dict[str, Any]]:
+        """
+        POST a JSON payload with the shared aiohttp session and return the decoded response.
+        
+        At most config.max_concurrent_requests calls are in flight at once, and
+        rate-limited (429) responses are retried with randomized exponential backoff.
+        """
+        import aiohttp
+        
+        session = await self._get_aio_session()
+        timeout = aiohttp.ClientTimeout(total=self.config.request_timeout_s, connect=CONNECT_TIMEOUT)
+        attempts = max(0, self.config.max_retries) + 1
+        
+        async with self._sem:
+            for attempt in range(attempts):
+                async with session.post(url, json=payload, headers=headers, timeout=timeout) as resp:
+                    if resp.status == 200:
+                        result = _json_loads(await resp.read())
+                        self._log_token_usage(result)
+                        return result
+                    if resp.status != 429 or attempt + 1 == attempts:
+                        logger.error(f"{service_name} API error: {resp.status} - {await resp.text()}")
+                        return None
+                        
+                delay = RATE_LIMIT_BACKOFF_BASE * 2 ** attempt + random.random()
+                logger.warning(f"{service_name} API rate limited, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+            
+    def _log_token_usage(self, result: Dict[str, Any]):
+        """Log the token usage reported by the provider, if any."""
+        usage = result.get("usage") or result.get("usageMetadata")
+        if usage:
+            logger.info(f"{self.config.selected_service} token usage: {usage}")
+            
+    def _read_sse_text(self, response: requests.Response, delta_text,
+                       on_part: Optional[PartCallback] = None) -> str:
+        """
+        Concatenate the text deltas of a server-sent event stream.
+        
+        Reading stops as soon as a complete top-level JSON object has arrived,
+        so trailing commentary from the model is never waited for.
+        
+        Args:
+            response: Streaming response from the provider
+            delta_text: Callable returning the text carried by one event payload
+            on_part: Optional callback for each part of the object as it completes
+            
+        Returns:
+            The generated text received so far
+        """
+        response.encoding = "utf-8"
+        scanner = _JsonObjectScanner()
+        members = _JsonMemberScanner() if on_part else None
+        parts = []
+        usage = None
+        
+        for line in response.iter_lines(decode_unicode=True):
+            if not line or not line.startswith("data:"):
+                continue
+                
+            data = line[5:].strip()
+            if data == "[DONE]":
+                break
+                
+            event = _json_loads(data)
+            usage = event.get("usage") or event.get("usageMetadata") or usage
+            text = delta_text(event)
+            if text:
+                parts.append(text)
+                if members:
+                    self._emit_parts(members.feed(text), on_part)
+                if scanner.feed(text):
+                    break
+                    
+        if usage:
+            self._log_token_usage({"usage": usage})
+            
+        return "".join(parts)
+        
+    @staticmethod
+    def _emit_parts(parts: List[Tuple[str, Optional[int], str]], on_part: PartCallback):
+        """
+        Decode and validate streamed parts and pass them on.
+        
+        A part that doesn't match its piece of the schema is dropped, so nothing
+        malformed reaches Unreal; a failing part or callback doesn't stop the stream.
+        """
+        for key, index, text in parts:
+            try:
+                value = _json_loads(text)
+                _validate_part(key, index is not None, value)
+                on_part(key, index, value)
+            except fastjsonschema.JsonSchemaException as e:
+                logger.warning(f"Skipping invalid streamed part '{key}': {e.message}")
+            except Exception as e:
+                logger.warning(f"Error handling streamed part '{key}': {e}")
+        
+    @staticmethod
+    def _openai_delta_text(event: Dict[str, Any]) -> Optional[str]:
+        """Extract the content delta from an OpenAI chat completion chunk."""
+        choices = event.get("choices")
+        if not choices:
+            return None
+        return choices[0].get("delta", {}).get("content")
+        
+    @staticmethod
+    def _gemini_delta_text(event: Dict[str, Any]) -> Optional[str]:
+        """Extract the text from a Gemini streamGenerateContent chunk."""
+        candidates = event.get("candidates")
+        if not candidates:
+            return None
+        parts = candidates[0].get("content", {}).get("parts", [])
+        return "".join(part.get("text", "") for part in parts)
+        
+    def _openai_request(self, prompt: str, stream: bool = False) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+        """Build the URL, headers and payload for an OpenAI chat completion."""
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.config.openai_api_key}"
+        }
+        
+        payload = {
+            "model": "gpt-4",  # Use GPT-4 for best results
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": self.config.temperature,
+            "max_tokens": self.config.max_tokens
+        }
+        
+        if stream:
+            payload["stream"] = True
+            payload["stream_options"] = {"include_usage": True}
+        
+        return "https://api.openai.com/v1/chat/completions", headers, payload
+        
+    def _gemini_request(self, prompt: str, stream: bool = False) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+        """Build the URL, headers and payload for a Gemini generateContent call."""
+        headers = {
+            "Content-Type": "application/json"
+        }
+        
+        payload = {
+            "contents": [
+                {
+                    "parts": [
+                        {"text": SYSTEM_PROMPT},
+                        {"text": prompt}
+                    ]
+                }
+            ],
+            "generationConfig": {
+                "temperature": self.config.temperature,
+                "maxOutputTokens": self.config.max_tokens
+            }
+        }
+        
+        base_url = "https://generativelanguage.googleapis.com/v1beta/models/gemini-pro"
+        if stream:
+            url = f"{base_url}:streamGenerateContent?alt=sse&key={self.config.gemini_api_key}"
+        else:
+            url = f"{base_url}:generateContent?key={self.config.gemini_api_key}"
+        return url, headers, payload
+        
+    def _local_agent_request(self, prompt: str) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+        """Build the URL, headers and payload for the local agent's /generate endpoint."""
+        headers = {
+            "Content-Type": "application/json"
+        }
+        
+        payload = {
+            "prompt": SYSTEM_PROMPT + "\n\n" + prompt,
+            "temperature": self.config.temperature,
+            "max_tokens": self.config.max_tokens
+        }
+        
+        return f"{self.config.local_agent_url}/generate", headers, payload
+            
     def _prepare_prompt(self, 
                        function_description: str,
                        blueprint_context: Dict[str, Any] = None) -> str:
         """Prepare a prompt for the AI service."""
-        prompt = f"Create an Unreal Engine Blueprint function that does the following:\n\n{function_description}\n\n"
+        parts = [_PROMPT_HEAD]
+        parts.extend(self._format_context(blueprint_context))
+        parts.append(_PROMPT_TASK)
+        parts.append(function_description)
+        return "".join(parts)
         
+    def _format_context(self, blueprint_context: Optional[Dict[str, Any]]) -> List[str]:
+        """Render the Blueprint context section of the prompt as a list of string parts."""
+        parts = []
+        
+        # Entries are sorted by name, so the same Blueprint always renders the same text
+        # whatever order Unreal lists them in
         if blueprint_context:
-            prompt += "Here is the context of the Blueprint:\n\n"
+            parts.append("Here is the context of the Blueprint:\n\n")
             
             if 'variables' in blueprint_context:
-                prompt += "Existing variables:\n"
-                for var in blueprint_context['variables']:
-                    prompt += f"- {var['name']} ({var['type']})\n"
-                prompt += "\n"
+                parts.append("Existing variables:\n")
+                parts.extend(f"- {var['name']} ({var['type']})\n" for var in _by_name(blueprint_context['variables']))
+                parts.append("\n")
                 
             if 'functions' in blueprint_context:
-                prompt += "Existing functions:\n"
-                for func in blueprint_context['functions']:
-                    prompt += f"- {func['name']} ({', '.join(func['parameters'])})\n"
-                prompt += "\n"
+                parts.append("Existing functions:\n")
+                parts.extend(f"- {func['name']} ({', '.join(func['parameters'])})\n" for func in _by_name(blueprint_context['functions']))
+                parts.append("\n")
                 
             if 'components' in blueprint_context:
-                prompt += "Blueprint components:\n"
-                for comp in blueprint_context['components']:
-                    prompt += f"- {comp['name']} ({comp['type']})\n"
-                prompt += "\n"
-        
-        prompt += """
-Please provide your response in the following JSON format:
-
-```json
-{
-  "function_name": "YourFunctionName",
-  "description": "Brief description of what the function does",
-  "return_type": "ReturnType",
-  "parameters": [
-    {"name": "param1", "type": "Type1", "description": "Description of param1"},
-    {"name": "param2", "type": "Type2", "description": "Description of param2"}
-  ],
-  "local_variables": [
-    {"name": "localVar1", "type": "Type1", "description": "Description of localVar1"}
-  ],
-  "nodes": [
-    {
-      "type": "FunctionEntry",
-      "id": "node1",
-      "position": [0, 0]
-    },
-    {
-      "type": "FunctionCall",
-      "id": "node2",
-      "function": "PrintString",
-      "target": "self",
-      "parameters": {"InString": "Hello World"},
-      "position": [200, 0]
-    }
-  ],
-  "connections": [
-    {"from_node": "node1", "from_pin": "Then", "to_node": "node2", "to_pin": "execute"}
-  ],
-  "required_structs": [
-    {
-      "name": "MyCustomStruct",
-      "properties": [
-        {"name": "Property1", "type": "Float"},
-        {"name": "Property2", "type": "String"}
-      ]
-    }
-  ],
-  "required_enums": [
-    {
-      "name": "MyCustomEnum",
-      "values": ["Value1", "Value2", "Value3"]
-    }
-  ]
-}
-```
-
-Focus on creating a practical, efficient implementation that follows Unreal Engine best practices.
-"""
-        
-        return prompt
+                parts.append("Blueprint components:\n")
+                parts.extend(f"- {comp['name']} ({comp['type']})\n" for comp in _by_name(blueprint_context['components']))
+                parts.append("\n")
+                
+        return parts
         
     def _parse_generated_code(self, function_code: str) -> Dict[str, Any]:
         """Parse the generated code from the AI service."""
         try:
             # Extract JSON from the response (it might be wrapped in markdown code blocks)
-            json_start = function_code.find('```json')
-            if json_start != -1:
-                json_start = function_code.find('{', json_start)
-            else:
-                json_start = function_code.find('{')
+            fence = function_code.find('```json')
+            if fence != -1:
+                function_code = function_code[fence:]
                 
-            json_end = function_code.rfind('}')
-            
-            if json_start == -1 or json_end == -1:
+            # Match the first balanced object in one pass, so braces in trailing commentary are ignored
+            scanner = _JsonObjectScanner()
+            if not scanner.feed(function_code):
                 logger.error("Could not find JSON in generated code")
                 return None
                 
-            json_str = function_code[json_start:json_end+1]
+            json_str = function_code[scanner.start:scanner.end]
             
             # Parse the JSON
-            function_data = json.loads(json_str)
+            function_data = _json_loads(json_str)
             
-            # Validate the required fields
-            required_fields = ['function_name', 'nodes', 'connections']
-            for field in required_fields:
-                if field not in function_data:
-                    logger.error(f"Generated function data missing required field: {field}")
-                    return None
-                    
+            # Validate the structure
+            try:
+                _validate_function_data(function_data)
+            except fastjsonschema.JsonSchemaException as e:
+                logger.error(f"Generated function data is invalid: {e.message}")
+                return None
+                
             return function_data
             
         except Exception as e:
             logger.error(f"Error parsing generated code: {e}")
             return None
 
-# Create config directory if it doesn't exist
-config_dir = os.path.expanduser("~/.unreal_mcp")
-if not os.path.exists(config_dir):
-    os.makedirs(config_dir)
+# Default location of the persisted AI service configuration
+CONFIG_FILE = os.path.expanduser("~/.unreal_mcp/ai_config.json")
 
-# Config file path
-config_file = os.path.join(config_dir, "ai_config.json")
+# Persistent cache of generation results shared across server restarts
+RESULT_CACHE_FILE = os.path.expanduser("~/.unreal_mcp/llm_cache.sqlite")
 
-# Initialize configuration
-config = AIServiceConfig()
-if os.path.exists(config_file):
-    config.load_from_file(config_file)
-else:
-    # Create default config
-    config.save_to_file(config_file)
+# Shared AI service, created on first use so importing this module does no disk I/O
+_ai_service: Optional[AIService] = None
 
-# Create AI service
-ai_service = AIService(config)
+def get_ai_service() -> AIService:
+    """Get the shared AI service, loading (or creating) its configuration on first use."""
+    global _ai_service
+    
+    if _ai_service is None:
+        config = AIServiceConfig()
+        try:
+            config.load_from_file(CONFIG_FILE)
+        except FileNotFoundError:
+            # Create default config
+            config.save_to_file(CONFIG_FILE)
+        _ai_service = AIService(config, cache_path=RESULT_CACHE_FILE)
+        
+    return _ai_service
@@ -14,8 +14,378 @@ from mcp.server.fastmcp import FastMCP, Context
 # Get logger
 logger = logging.getLogger("UnrealMCP")
 
+# Blueprint graphs built by the tools below, as (step, command, params, failure label) entries
+# sent to Unreal in order as one batch. In params, "$name" strings are filled in from the
+# tool's arguments and {"$ref": "step[.path]"} stands for an earlier step's result, its
+# node_id unless a path is given, which Unreal resolves as it runs the batch. Steps with
+# no failure label are best-effort and don't stop the rest of the graph.
+_FUNCTION_ID = {"$ref": "function.result.function_id"}
+
+GraphStep = Tuple[str, str, Dict[str, Any], Optional[str], Tuple[str, ...]]
+
+def _has_placeholder(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.startswith("$")
+    if isinstance(value, dict):
+        return "$ref" in value or any(map(_has_placeholder, value.values()))
+    if isinstance(value, list):
+        return any(map(_has_placeholder, value))
+    return False
+
+def _graph_template(entries: List[Tuple[str, str, Dict[str, Any], Optional[str]]]) -> List[GraphStep]:
+    """Note which top-level params of each step need filling in, so the rest are reused as is per call."""
+    return [
+        (step, command, params, label, tuple(key for key, value in params.items() if _has_placeholder(value)))
+        for step, command, params, label in entries
+    ]
+
+def _maze_variable(variable_name: str, variable_type: str, default_value: Optional[str]) -> Dict[str, Any]:
+    params = {
+        "blueprint_name": "$blueprint_name",
+        "variable_name": variable_name,
+        "variable_type": variable_type,
+        "category": "Maze Generation"
+    }
+    if default_value is not None:
+        params["default_value"] = default_value
+    return params
+
+def _comment(comment: str, y: int) -> Dict[str, Any]:
+    return {
+        "blueprint_name": "$blueprint_name",
+        "function_id": _FUNCTION_ID,
+        "comment": comment,
+        "position": [0, y],
+        "size": [400, 100]
+    }
+
+def _call_node(function: str, position: List[int]) -> Dict[str, Any]:
+    return {
+        "blueprint_name": "$blueprint_name",
+        "function_id": _FUNCTION_ID,
+        "function": function,
+        "position": position
+    }
+
+def _math(operation: str, position: List[int]) -> Dict[str, Any]:
+    return {
+        "blueprint_name": "$blueprint_name",
+        "function_id": _FUNCTION_ID,
+        "operation": operation,
+        "position": position
+    }
+
+def _connect(source: str, source_pin: str, target: str, target_pin: str) -> Dict[str, Any]:
+    return {
+        "blueprint_name": "$blueprint_name",
+        "function_id": _FUNCTION_ID,
+        "source_node_id": {"$ref": source},
+        "source_pin": source_pin,
+        "target_node_id": {"$ref": target},
+        "target_pin": target_pin
+    }
+
+MAZE_GRAPH_TEMPLATE = _graph_template([
+    # 1. Create the function if it doesn't exist
+    ("function", "create_blueprint_function", {
+        "blueprint_name": "$blueprint_name",
+        "function_name": "$function_name",
+        "inputs": [],
+        "outputs": [],
+        "pure": False,
+        "description": "Generates a random maze using Depth-First Search algorithm"
+    }, "create function"),
+    # 2. Create variables for maze generation
+    ("width_var", "add_blueprint_variable", _maze_variable("MazeWidth", "int", "$maze_width"), "create maze width variable"),
+    ("height_var", "add_blueprint_variable", _maze_variable("MazeHeight", "int", "$maze_height"), "create maze height variable"),
+    ("scale_var", "add_blueprint_variable", _maze_variable("WallScale", "float", "$wall_scale"), "create wall scale variable"),
+    ("wall_height_var", "add_blueprint_variable", _maze_variable("WallHeight", "float", "$wall_height"), "create wall height variable"),
+    # One byte per cell, row-major at y * MazeWidth + x: bit 0 is open down, bit 1 open right
+    ("grid_var", "add_blueprint_variable", _maze_variable("MazeGrid", "TArray<uint8>", None), "create maze grid variable"),
+    # 3.1 Comment nodes for initialization, the DFS algorithm and wall creation
+    ("init_comment", "add_blueprint_comment_node", _comment("Initialize Maze Grid", 0), None),
+    ("dfs_comment", "add_blueprint_comment_node", _comment("Depth-First Search Maze Generation", 200), None),
+    ("wall_comment", "add_blueprint_comment_node", _comment("Create Wall Cubes", 400), None),
+    # 3.2 Initialize the maze grid
+    ("get_width", "add_blueprint_variable_get_node", {
+        "blueprint_name": "$blueprint_name",
+        "function_id": _FUNCTION_ID,
+        "variable_name": "MazeWidth",
+        "position": [100, 50]
+    }, "add get width node"),
+    ("get_height", "add_blueprint_variable_get_node", {
+        "blueprint_name": "$blueprint_name",
+        "function_id": _FUNCTION_ID,
+        "variable_name": "MazeHeight",
+        "position": [100, 100]
+    }, "add get height node"),
+    ("for_loop", "add_blueprint_loop_node", {
+        "blueprint_name": "$blueprint_name",
+        "function_id": _FUNCTION_ID,
+        "loop_type": "ForLoop",
+        "position": [300, 50]
+    }, "add for loop node"),
+    ("connect_width_loop", "connect_blueprint_nodes", _connect("get_width", "ReturnValue", "for_loop", "LastIndex"), None),
+    # 3.3 Generate the maze using DFS
+    ("dfs_function", "add_blueprint_function_call_node", _call_node("GenerateMazeWithDFS", [300, 250]), "add DFS function call"),
+    # 3.4 Wall creation: every wall is an instance of one instanced static mesh
+    # component, added in a single native AddInstances call rather than a
+    # Blueprint loop spawning an actor per wall
+    ("walls_component", "add_component_to_blueprint", {
+        "blueprint_name": "$blueprint_name",
+        "component_type": "InstancedStaticMeshComponent",
+        "component_name": "MazeWalls"
+    }, "add wall instances component"),
+    ("wall_transforms_var", "add_blueprint_variable", _maze_variable("WallTransforms", "TArray<Transform>", None), "create wall transforms variable"),
+    ("get_walls", "add_blueprint_variable_get_node", {
+        "blueprint_name": "$blueprint_name",
+        "function_id": _FUNCTION_ID,
+        "variable_name": "MazeWalls",
+        "position": [300, 450]
+    }, "add get walls node"),
+    ("get_mesh", "add_blueprint_variable_get_node", {
+        "blueprint_name": "$blueprint_name",
+        "function_id": _FUNCTION_ID,
+        "variable_name": "$cube_mesh_variable",
+        "position": [300, 550]
+    }, "add get mesh node"),
+    ("get_wall_transforms", "add_blueprint_variable_get_node", {
+        "blueprint_name": "$blueprint_name",
+        "function_id": _FUNCTION_ID,
+        "variable_name": "WallTransforms",
+        "position": [300, 650]
+    }, "add get wall transforms node"),
+    ("set_wall_mesh", "add_blueprint_function_call_node", _call_node("SetStaticMesh", [500, 450]), "add set wall mesh node"),
+    ("add_walls", "add_blueprint_function_call_node", _call_node("AddInstances", [700, 550]), "add wall instances node"),
+    ("connect_walls_mesh", "connect_blueprint_nodes", _connect("get_walls", "ReturnValue", "set_wall_mesh", "self"), None),
+    ("connect_mesh_walls", "connect_blueprint_nodes", _connect("get_mesh", "ReturnValue", "set_wall_mesh", "NewMesh"), None),
+    ("connect_walls_add", "connect_blueprint_nodes", _connect("get_walls", "ReturnValue", "add_walls", "self"), None),
+    ("connect_transforms_add", "connect_blueprint_nodes", _connect("get_wall_transforms", "ReturnValue", "add_walls", "InstanceTransforms"), None),
+    ("connect_mesh_add", "connect_blueprint_nodes", _connect("set_wall_mesh", "ExecutionOutput", "add_walls", "ExecutionInput"), None),
+    # 4. Connect the function to BeginPlay event
+    ("begin_play", "add_blueprint_event_node", {
+        "blueprint_name": "$blueprint_name",
+        "event_type": "EventBeginPlay"
+    }, "add BeginPlay event"),
+    ("call_maze", "add_blueprint_function_call_node", {
+        "blueprint_name": "$blueprint_name",
+        "function": "$function_name",
+        "position": [300, 0]
+    }, "add function call node"),
+    ("connect_begin_call", "connect_blueprint_nodes", {
+        "blueprint_name": "$blueprint_name",
+        "source_node_id": {"$ref": "begin_play"},
+        "source_pin": "ExecutionOutput",
+        "target_node_id": {"$ref": "call_maze"},
+        "target_pin": "ExecutionInput"
+    }, "connect BeginPlay to function call"),
+    # 5. Compile the Blueprint
+    ("compile", "compile_blueprint", {"blueprint_name": "$blueprint_name"}, "compile Blueprint"),
+])
+
+DFS_HELPER_TEMPLATE = _graph_template([
+    # 1. Create the function
+    ("function", "create_blueprint_function", {
+        "blueprint_name": "$blueprint_name",
+        "function_name": "$function_name",
+        "inputs": [
+            {"name": "StartX", "type": "int"},
+            {"name": "StartY", "type": "int"}
+        ],
+        "outputs": [],
+        "pure": False,
+        "description": "Helper function for iterative, stack-based DFS maze generation"
+    }, "create function"),
+    # 2. Comment node and local variables for DFS
+    ("dfs_comment", "add_blueprint_comment_node", _comment("DFS Maze Generation Algorithm", 0), None),
+    ("visited_var", "add_blueprint_variable", {
+        "blueprint_name": "$blueprint_name",
+        "function_id": _FUNCTION_ID,
+        "variable_name": "Visited",
+        "variable_type": "TArray<bool>",
+        "is_local": True
+    }, "create visited variable"),
+    ("directions_var", "add_blueprint_variable", {
+        "blueprint_name": "$blueprint_name",
+        "function_id": _FUNCTION_ID,
+        "variable_name": "Directions",
+        "variable_type": "TArray<FVector2D>",
+        "is_local": True
+    }, "create directions variable"),
+    # 3. Flat cell index StartY * MazeWidth + StartX into MazeGrid and Visited
+    ("get_width", "add_blueprint_variable_get_node", {
+        "blueprint_name": "$blueprint_name",
+        "function_id": _FUNCTION_ID,
+        "variable_name": "MazeWidth",
+        "position": [100, 150]
+    }, "add get width node"),
+    ("row_offset", "add_blueprint_math_node", _math("int * int", [300, 150]), "add row offset node"),
+    ("cell_index", "add_blueprint_math_node", _math("int + int", [500, 150]), "add cell index node"),
+    ("connect_width_offset", "connect_blueprint_nodes", _connect("get_width", "ReturnValue", "row_offset", "B"), "connect width to row offset"),
+    ("connect_offset_index", "connect_blueprint_nodes", _connect("row_offset", "ReturnValue", "cell_index", "A"), "connect row offset to cell index"),
+    # 4. Iterative DFS: a Stack of cells replaces recursive calls, so large mazes
+    # don't build up Blueprint call frames. Cells are marked visited as they are pushed.
+    ("stack_var", "add_blueprint_variable", {
+        "blueprint_name": "$blueprint_name",
+        "function_id": _FUNCTION_ID,
+        "variable_name": "Stack",
+        "variable_type": "TArray<IntPoint>",
+        "is_local": True
+    }, "create stack variable"),
+    ("get_stack", "add_blueprint_variable_get_node", {
+        "blueprint_name": "$blueprint_name",
+        "function_id": _FUNCTION_ID,
+        "variable_name": "Stack",
+        "position": [100, 300]
+    }, "add get stack node"),
+    ("push_start", "add_blueprint_function_call_node", _call_node("Array_Add", [300, 250]), "add push start cell node"),
+    ("stack_length", "add_blueprint_function_call_node", _call_node("Array_Length", [300, 350]), "add stack length node"),
+    ("stack_not_empty", "add_blueprint_math_node", _math("int > int", [500, 350]), "add stack not empty node"),
+    # The walk ends once every cell has been visited rather than after backtracking
+    # the whole stack, which skips up to one pop per cell
+    ("visited_count_var", "add_blueprint_variable", {
+        "blueprint_name": "$blueprint_name",
+        "function_id": _FUNCTION_ID,
+        "variable_name": "VisitedCount",
+        "variable_type": "int",
+        "is_local": True
+    }, "create visited count variable"),
+    ("get_visited_count", "add_blueprint_variable_get_node", {
+        "blueprint_name": "$blueprint_name",
+        "function_id": _FUNCTION_ID,
+        "variable_name": "VisitedCount",
+        "position": [300, 450]
+    }, "add get visited count node"),
+    ("get_height", "add_blueprint_variable_get_node", {
+        "blueprint_name": "$blueprint_name",
+        "function_id": _FUNCTION_ID,
+        "variable_name": "MazeHeight",
+        "position": [100, 550]
+    }, "add get height node"),
+    ("cell_count", "add_blueprint_math_node", _math("int * int", [300, 550]), "add cell count node"),
+    ("cells_left", "add_blueprint_math_node", _math("int < int", [500, 450]), "add cells left node"),
+    ("keep_walking", "add_blueprint_math_node", _math("bool AND bool", [600, 400]), "add keep walking node"),
+    ("while_loop", "add_blueprint_loop_node", {
+        "blueprint_name": "$blueprint_name",
+        "function_id": _FUNCTION_ID,
+        "loop_type": "WhileLoop",
+        "position": [700, 300]
+    }, "add while loop node"),
+    # Loop body: peek the top cell, push and mark its first unvisited neighbor (counting
+    # it in VisitedCount), or pop it
+    ("peek", "add_blueprint_function_call_node", _call_node("Array_Get", [900, 250]), "add peek node"),
+    ("mark_visited", "add_blueprint_function_call_node", _call_node("Array_Set", [1100, 200]), "add mark visited node"),
+    ("push_neighbor", "add_blueprint_function_call_node", _call_node("Array_Add", [1100, 300]), "add push neighbor node"),
+    ("pop", "add_blueprint_function_call_node", _call_node("Array_RemoveIndex", [1100, 400]), "add pop node"),
+    ("connect_stack_push", "connect_blueprint_nodes", _connect("get_stack", "Array", "push_start", "TargetArray"), "connect stack to push start cell"),
+    ("connect_stack_length", "connect_blueprint_nodes", _connect("get_stack", "Array", "stack_length", "TargetArray"), "connect stack to stack length"),
+    ("connect_length_check", "connect_blueprint_nodes", _connect("stack_length", "ReturnValue", "stack_not_empty", "A"), "connect stack length to check"),
+    ("connect_width_count", "connect_blueprint_nodes", _connect("get_width", "ReturnValue", "cell_count", "A"), "connect width to cell count"),
+    ("connect_height_count", "connect_blueprint_nodes", _connect("get_height", "ReturnValue", "cell_count", "B"), "connect height to cell count"),
+    ("connect_visited_left", "connect_blueprint_nodes", _connect("get_visited_count", "ReturnValue", "cells_left", "A"), "connect visited count to cells left"),
+    ("connect_count_left", "connect_blueprint_nodes", _connect("cell_count", "ReturnValue", "cells_left", "B"), "connect cell count to cells left"),
+    ("connect_check_walking", "connect_blueprint_nodes", _connect("stack_not_empty", "ReturnValue", "keep_walking", "A"), "connect check to keep walking"),
+    ("connect_left_walking", "connect_blueprint_nodes", _connect("cells_left", "ReturnValue", "keep_walking", "B"), "connect cells left to keep walking"),
+    ("connect_walking_loop", "connect_blueprint_nodes", _connect("keep_walking", "ReturnValue", "while_loop", "Condition"), "connect keep walking to while loop"),
+    ("connect_push_loop", "connect_blueprint_nodes", _connect("push_start", "ExecutionOutput", "while_loop", "ExecutionInput"), "connect push start cell to while loop"),
+    ("connect_loop_peek", "connect_blueprint_nodes", _connect("while_loop", "LoopBody", "peek", "ExecutionInput"), "connect while loop to peek"),
+    # 5. Compile the Blueprint
+    ("compile", "compile_blueprint", {"blueprint_name": "$blueprint_name"}, "compile Blueprint"),
+])
+
+EVENT_CALL_TEMPLATE = _graph_template([
+    # 1. Find or create the event
+    ("event", "add_blueprint_event_node", {
+        "blueprint_name": "$blueprint_name",
+        "event_type": "$event_type"
+    }, "add event node"),
+    # 2. Add a function call to the function
+    ("call", "add_blueprint_function_call_node", {
+        "blueprint_name": "$blueprint_name",
+        "function": "$function_name",
+        "position": [300, 0]
+    }, "add function call node"),
+    # 3. Connect the event to the function call
+    ("connect", "connect_blueprint_nodes", {
+        "blueprint_name": "$blueprint_name",
+        "source_node_id": {"$ref": "event"},
+        "source_pin": "ExecutionOutput",
+        "target_node_id": {"$ref": "call"},
+        "target_pin": "ExecutionInput"
+    }, "connect event to function call"),
+    # 4. Compile the Blueprint
+    ("compile", "compile_blueprint", {"blueprint_name": "$blueprint_name"}, "compile Blueprint"),
+])
+
+def _substitute(value: Any, args: Dict[str, Any], steps: Dict[str, Any]) -> Any:
+    """Fill a template value in with the tool's arguments and references to earlier steps."""
+    if isinstance(value, str):
+        return args[value[1:]] if value.startswith("$") else value
+    if isinstance(value, dict):
+        if "$ref" in value:
+            step, _, path = value["$ref"].partition(".")
+            return steps[step].ref(path or "result.node_id")
+        return {key: _substitute(item, args, steps) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_substitute(item, args, steps) for item in value]
+    return value
+
+def _check(response: Optional[Dict[str, Any]], what: str) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+    """
+    Unpack a command response.
+    
+    Args:
+        response: Response from Unreal Engine, or None if there was none
+        what: What the command did, for the failure message ("add for loop node")
+        
+    Returns:
+        (ok, node_id, failure) where failure is the tool's error result when not ok
+    """
+    if response and response.get("status") == "success":
+        return True, (response.get("result") or {}).get("node_id", ""), None
+    logger.error("Failed to %s: %s", what, response)
+    error = response.get("error", "Unknown error") if response else "No response from Unreal Engine"
+    return False, "", {"success": False, "message": f"Failed to {what}: {error}"}
+
+def _err(message: str) -> Dict[str, Any]:
+    """Log a tool failure and return it as the tool's error result."""
+    logger.error(message)
+    return {"success": False, "message": message}
+
+def _build_graph(unreal, template: List[GraphStep], args: Dict[str, Any],
+                 auto_compile: bool = True) -> Optional[Dict[str, Any]]:
+    """
+    Send every step of a graph template to Unreal in a single batch.
+    
+    Args:
+        unreal: Unreal connection
+        template: Steps from _graph_template, in order
+        args: Values for the "$name" placeholders in the params
+        auto_compile: Whether to keep the template's compile step
+        
+    Returns:
+        The error result for the first failed step, or None if every step succeeded
+    """
+    if not auto_compile:
+        template = [entry for entry in template if entry[1] != "compile_blueprint"]
+    
+    steps = {}
+    with unreal.batch() as batch:
+        for step, command, params, label, placeholders in template:
+            # Constant params are shared with the template; only placeholder values are filled in
+            filled = {key: _substitute(params[key], args, steps) for key in placeholders}
+            steps[step] = batch.add(command, {**params, **filled}, required=label is not None)
+    
+    for step, _, _, label, _ in template:
+        if label:
+            ok, _, failure = _check(steps[step].response, label)
+            if not ok:
+                return failure
+    return None
+
 def register_blueprint_custom_function_tools(mcp: FastMCP):
     """Register Blueprint custom function tools with the MCP server."""
+    from unreal_mcp_server import get_unreal_connection
     
     @mcp.tool()
     def create_blueprint_custom_function(
@@ -41,13 +411,10 @@ def register_blueprint_custom_function_tools(mcp: FastMCP):
         Returns:
             Dict containing success status and function details
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
+                return _err("Failed to connect to Unreal Engine")
             
             # Default values
             if inputs is None:
@@ -67,9 +434,9 @@ def register_blueprint_custom_function_tools(mcp: FastMCP):
             
             function_response = unreal.send_command("create_blueprint_function", function_params)
             
-            if not function_response or function_response.get("status") != "success":
-                logger.error(f"Failed to create function: {function_response}")
-                return {"success": False, "message": f"Failed to create function: {function_response.get('error', 'Unknown error')}"}
+            ok, _, failure = _check(function_response, "create function")
+            if not ok:
+                return failure
             
             return {
                 "success": True,
@@ -80,9 +447,7 @@ def register_blueprint_custom_function_tools(mcp: FastMCP):
             }
             
         except Exception as e:
-            error_msg = f"Error creating custom function: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+            return _err(f"Error creating custom function: {e}")
     
     @mcp.tool()
     def implement_maze_generation_function(
@@ -94,7 +459,8 @@ def register_blueprint_custom_function_tools(mcp: FastMCP):
         wall_scale: float = 100.0,
         wall_height: float = 200.0,
         cube_mesh_variable: str = "WallMesh",
-        material_variable: str = "WallMaterial"
+        material_variable: str = "WallMaterial",
+        auto_compile: bool = True
     ) -> Dict[str, Any]:
         """
         Implement a maze generation function in a Blueprint using Depth-First Search algorithm.
@@ -108,360 +474,29 @@ def register_blueprint_custom_function_tools(mcp: FastMCP):
             wall_height: Height of the walls
             cube_mesh_variable: Name of the variable containing the wall mesh
             material_variable: Name of the variable containing the wall material
+            auto_compile: Whether to compile the Blueprint afterwards; pass False when
+                chaining several tools and call flush_blueprint_changes once at the end
             
         Returns:
             Dict containing success status and function details
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
+                return _err("Failed to connect to Unreal Engine")
             
-            # 1. Create the function if it doesn't exist
-            function_params = {
+            # Every step goes to Unreal in one batch; node ids flow between steps as references
+            failure = _build_graph(unreal, MAZE_GRAPH_TEMPLATE, {
                 "blueprint_name": blueprint_name,
                 "function_name": function_name,
-                "inputs": [],
-                "outputs": [],
-                "pure": False,
-                "description": "Generates a random maze using Depth-First Search algorithm"
-            }
-            
-            function_response = unreal.send_command("create_blueprint_function", function_params)
-            
-            if not function_response or function_response.get("status") != "success":
-                logger.error(f"Failed to create function: {function_response}")
-                return {"success": False, "message": f"Failed to create function: {function_response.get('error', 'Unknown error')}"}
-            
-            function_id = function_response.get("result", {}).get("function_id", "")
-            
-            # 2. Create variables for maze generation
-            
-            # Create maze width variable
-            width_var_params = {
-                "blueprint_name": blueprint_name,
-                "variable_name": "MazeWidth",
-                "variable_type": "int",
-                "default_value": str(maze_width),
-                "category": "Maze Generation"
-            }
-            
-            width_var_response = unreal.send_command("add_blueprint_variable", width_var_params)
-            
-            if not width_var_response or width_var_response.get("status") != "success":
-                logger.error(f"Failed to create maze width variable: {width_var_response}")
-                return {"success": False, "message": f"Failed to create maze width variable: {width_var_response.get('error', 'Unknown error')}"}
-            
-            # Create maze height variable
-            height_var_params = {
-                "blueprint_name": blueprint_name,
-                "variable_name": "MazeHeight",
-                "variable_type": "int",
-                "default_value": str(maze_height),
-                "category": "Maze Generation"
-            }
-            
-            height_var_response = unreal.send_command("add_blueprint_variable", height_var_params)
-            
-            if not height_var_response or height_var_response.get("status") != "success":
-                logger.error(f"Failed to create maze height variable: {height_var_response}")
-                return {"success": False, "message": f"Failed to create maze height variable: {height_var_response.get('error', 'Unknown error')}"}
-            
-            # Create wall scale variable
-            scale_var_params = {
-                "blueprint_name": blueprint_name,
-                "variable_name": "WallScale",
-                "variable_type": "float",
-                "default_value": str(wall_scale),
-                "category": "Maze Generation"
-            }
-            
-            scale_var_response = unreal.send_command("add_blueprint_variable", scale_var_params)
-            
-            if not scale_var_response or scale_var_response.get("status") != "success":
-                logger.error(f"Failed to create wall scale variable: {scale_var_response}")
-                return {"success": False, "message": f"Failed to create wall scale variable: {scale_var_response.get('error', 'Unknown error')}"}
-            
-            # Create wall height variable
-            height_var_params = {
-                "blueprint_name": blueprint_name,
-                "variable_name": "WallHeight",
-                "variable_type": "float",
-                "default_value": str(wall_height),
-                "category": "Maze Generation"
-            }
-            
-            height_var_response = unreal.send_command("add_blueprint_variable", height_var_params)
-            
-            if not height_var_response or height_var_response.get("status") != "success":
-                logger.error(f"Failed to create wall height variable: {height_var_response}")
-                return {"success": False, "message": f"Failed to create wall height variable: {height_var_response.get('error', 'Unknown error')}"}
-            
-            # Create maze grid variable (2D array of booleans)
-            grid_var_params = {
-                "blueprint_name": blueprint_name,
-                "variable_name": "MazeGrid",
-                "variable_type": "TArray<TArray<bool>>",
-                "category": "Maze Generation"
-            }
-            
-            grid_var_response = unreal.send_command("add_blueprint_variable", grid_var_params)
-            
-            if not grid_var_response or grid_var_response.get("status") != "success":
-                logger.error(f"Failed to create maze grid variable: {grid_var_response}")
-                return {"success": False, "message": f"Failed to create maze grid variable: {grid_var_response.get('error', 'Unknown error')}"}
-            
-            # 3. Implement the maze generation algorithm
-            
-            # 3.1 Add local variables for maze generation
-            
-            # Add a comment node for initialization
-            init_comment_params = {
-                "blueprint_name": blueprint_name,
-                "function_id": function_id,
-                "comment": "Initialize Maze Grid",
-                "position": [0, 0],
-                "size": [400, 100]
-            }
-            
-            init_comment_response = unreal.send_command("add_blueprint_comment_node", init_comment_params)
-            
-            # Add a comment node for DFS algorithm
-            dfs_comment_params = {
-                "blueprint_name": blueprint_name,
-                "function_id": function_id,
-                "comment": "Depth-First Search Maze Generation",
-                "position": [0, 200],
-                "size": [400, 100]
-            }
-            
-            dfs_comment_response = unreal.send_command("add_blueprint_comment_node", dfs_comment_params)
-            
-            # Add a comment node for wall creation
-            wall_comment_params = {
-                "blueprint_name": blueprint_name,
-                "function_id": function_id,
-                "comment": "Create Wall Cubes",
-                "position": [0, 400],
-                "size": [400, 100]
-            }
-            
-            wall_comment_response = unreal.send_command("add_blueprint_comment_node", wall_comment_params)
-            
-            # 3.2 Initialize the maze grid
-            
-            # Get maze width variable
-            get_width_params = {
-                "blueprint_name": blueprint_name,
-                "function_id": function_id,
-                "variable_name": "MazeWidth",
-                "position": [100, 50]
-            }
-            
-            get_width_response = unreal.send_command("add_blueprint_variable_get_node", get_width_params)
-            
-            if not get_width_response or get_width_response.get("status") != "success":
-                logger.error(f"Failed to add get width node: {get_width_response}")
-                return {"success": False, "message": f"Failed to add get width node: {get_width_response.get('error', 'Unknown error')}"}
-            
-            get_width_node_id = get_width_response.get("result", {}).get("node_id", "")
-            
-            # Get maze height variable
-            get_height_params = {
-                "blueprint_name": blueprint_name,
-                "function_id": function_id,
-                "variable_name": "MazeHeight",
-                "position": [100, 100]
-            }
-            
-            get_height_response = unreal.send_command("add_blueprint_variable_get_node", get_height_params)
-            
-            if not get_height_response or get_height_response.get("status") != "success":
-                logger.error(f"Failed to add get height node: {get_height_response}")
-                return {"success": False, "message": f"Failed to add get height node: {get_height_response.get('error', 'Unknown error')}"}
-            
-            get_height_node_id = get_height_response.get("result", {}).get("node_id", "")
-            
-            # Add a for loop for initializing the grid
-            for_loop_params = {
-                "blueprint_name": blueprint_name,
-                "function_id": function_id,
-                "loop_type": "ForLoop",
-                "position": [300, 50]
-            }
-            
-            for_loop_response = unreal.send_command("add_blueprint_loop_node", for_loop_params)
-            
-            if not for_loop_response or for_loop_response.get("status") != "success":
-                logger.error(f"Failed to add for loop node: {for_loop_response}")
-                return {"success": False, "message": f"Failed to add for loop node: {for_loop_response.get('error', 'Unknown error')}"}
-            
-            for_loop_node_id = for_loop_response.get("result", {}).get("node_id", "")
-            
-            # Connect width to for loop
-            connect_width_loop_params = {
-                "blueprint_name": blueprint_name,
-                "function_id": function_id,
-                "source_node_id": get_width_node_id,
-                "source_pin": "ReturnValue",
-                "target_node_id": for_loop_node_id,
-                "target_pin": "LastIndex"
-            }
-            
-            connect_width_loop_response = unreal.send_command("connect_blueprint_nodes", connect_width_loop_params)
-            
-            # 3.3 Add nodes for DFS maze generation
-            
-            # Add a function call to generate the maze using DFS
-            dfs_function_params = {
-                "blueprint_name": blueprint_name,
-                "function_id": function_id,
-                "function": "GenerateMazeWithDFS",
-                "position": [300, 250]
-            }
-            
-            dfs_function_response = unreal.send_command("add_blueprint_function_call_node", dfs_function_params)
-            
-            if not dfs_function_response or dfs_function_response.get("status") != "success":
-                logger.error(f"Failed to add DFS function call: {dfs_function_response}")
-                return {"success": False, "message": f"Failed to add DFS function call: {dfs_function_response.get('error', 'Unknown error')}"}
-            
-            dfs_function_node_id = dfs_function_response.get("result", {}).get("node_id", "")
-            
-            # 3.4 Add nodes for wall creation
-            
-            # Add a for loop for creating walls
-            wall_loop_params = {
-                "blueprint_name": blueprint_name,
-                "function_id": function_id,
-                "loop_type": "ForEachLoop",
-                "array_type": "TArray<FVector>",
-                "position": [300, 450]
-            }
-            
-            wall_loop_response = unreal.send_command("add_blueprint_loop_node", wall_loop_params)
-            
-            if not wall_loop_response or wall_loop_response.get("status") != "success":
-                logger.error(f"Failed to add wall loop node: {wall_loop_response}")
-                return {"success": False, "message": f"Failed to add wall loop node: {wall_loop_response.get('error', 'Unknown error')}"}
-            
-            wall_loop_node_id = wall_loop_response.get("result", {}).get("node_id", "")
-            
-            # Add spawn actor from class node
-            spawn_params = {
-                "blueprint_name": blueprint_name,
-                "function_id": function_id,
-                "function": "SpawnActorFromClass",
-                "position": [500, 450]
-            }
-            
-            spawn_response = unreal.send_command("add_blueprint_function_call_node", spawn_params)
-            
-            if not spawn_response or spawn_response.get("status") != "success":
-                logger.error(f"Failed to add spawn actor node: {spawn_response}")
-                return {"success": False, "message": f"Failed to add spawn actor node: {spawn_response.get('error', 'Unknown error')}"}
-            
-            spawn_node_id = spawn_response.get("result", {}).get("node_id", "")
-            
-            # Get cube mesh variable
-            get_mesh_params = {
-                "blueprint_name": blueprint_name,
-                "function_id": function_id,
-                "variable_name": cube_mesh_variable,
-                "position": [300, 550]
-            }
-            
-            get_mesh_response = unreal.send_command("add_blueprint_variable_get_node", get_mesh_params)
-            
-            if not get_mesh_response or get_mesh_response.get("status") != "success":
-                logger.error(f"Failed to add get mesh node: {get_mesh_response}")
-                return {"success": False, "message": f"Failed to add get mesh node: {get_mesh_response.get('error', 'Unknown error')}"}
-            
-            get_mesh_node_id = get_mesh_response.get("result", {}).get("node_id", "")
-            
-            # Connect mesh to spawn actor
-            connect_mesh_spawn_params = {
-                "blueprint_name": blueprint_name,
-                "function_id": function_id,
-                "source_node_id": get_mesh_node_id,
-                "source_pin": "ReturnValue",
-                "target_node_id": spawn_node_id,
-                "target_pin": "Class"
-            }
-            
-            connect_mesh_spawn_response = unreal.send_command("connect_blueprint_nodes", connect_mesh_spawn_params)
-            
-            # Connect wall loop to spawn actor
-            connect_loop_spawn_params = {
-                "blueprint_name": blueprint_name,
-                "function_id": function_id,
-                "source_node_id": wall_loop_node_id,
-                "source_pin": "ArrayElement",
-                "target_node_id": spawn_node_id,
-                "target_pin": "SpawnTransform"
-            }
-            
-            connect_loop_spawn_response = unreal.send_command("connect_blueprint_nodes", connect_loop_spawn_params)
-            
-            # 4. Connect the function to BeginPlay event
-            
-            # Find the BeginPlay event
-            begin_play_params = {
-                "blueprint_name": blueprint_name,
-                "event_type": "EventBeginPlay"
-            }
-            
-            begin_play_response = unreal.send_command("add_blueprint_event_node", begin_play_params)
-            
-            if not begin_play_response or begin_play_response.get("status") != "success":
-                logger.error(f"Failed to add BeginPlay event: {begin_play_response}")
-                return {"success": False, "message": f"Failed to add BeginPlay event: {begin_play_response.get('error', 'Unknown error')}"}
-            
-            begin_play_node_id = begin_play_response.get("result", {}).get("node_id", "")
-            
-            # Add a function call to the maze generation function
-            call_maze_params = {
-                "blueprint_name": blueprint_name,
-                "function": function_name,
-                "position": [300, 0]
-            }
-            
-            call_maze_response = unreal.send_command("add_blueprint_function_call_node", call_maze_params)
-            
-            if not call_maze_response or call_maze_response.get("status") != "success":
-                logger.error(f"Failed to add function call node: {call_maze_response}")
-                return {"success": False, "message": f"Failed to add function call node: {call_maze_response.get('error', 'Unknown error')}"}
-            
-            call_maze_node_id = call_maze_response.get("result", {}).get("node_id", "")
-            
-            # Connect BeginPlay to function call
-            connect_begin_call_params = {
-                "blueprint_name": blueprint_name,
-                "source_node_id": begin_play_node_id,
-                "source_pin": "ExecutionOutput",
-                "target_node_id": call_maze_node_id,
-                "target_pin": "ExecutionInput"
-            }
-            
-            connect_begin_call_response = unreal.send_command("connect_blueprint_nodes", connect_begin_call_params)
-            
-            if not connect_begin_call_response or connect_begin_call_response.get("status") != "success":
-                logger.error(f"Failed to connect BeginPlay to function call: {connect_begin_call_response}")
-                return {"success": False, "message": f"Failed to connect BeginPlay to function call: {connect_begin_call_response.get('error', 'Unknown error')}"}
-            
-            # 5. Compile the Blueprint
-            compile_params = {
-                "blueprint_name": blueprint_name
-            }
-            
-            compile_response = unreal.send_command("compile_blueprint", compile_params)
-            
-            if not compile_response or compile_response.get("status") != "success":
-                logger.error(f"Failed to compile Blueprint: {compile_response}")
-                return {"success": False, "message": f"Failed to compile Blueprint: {compile_response.get('error', 'Unknown error')}"}
+                "maze_width": str(maze_width),
+                "maze_height": str(maze_height),
+                "wall_scale": str(wall_scale),
+                "wall_height": str(wall_height),
+                "cube_mesh_variable": cube_mesh_variable
+            }, auto_compile)
+            if failure:
+                return failure
             
             return {
                 "success": True,
@@ -475,124 +510,41 @@ def register_blueprint_custom_function_tools(mcp: FastMCP):
             }
             
         except Exception as e:
-            error_msg = f"Error implementing maze generation function: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+            return _err(f"Error implementing maze generation function: {e}")
     
     @mcp.tool()
     def create_dfs_helper_function(
         ctx: Context,
         blueprint_name: str,
-        function_name: str = "GenerateMazeWithDFS"
+        function_name: str = "GenerateMazeWithDFS",
+        auto_compile: bool = True
     ) -> Dict[str, Any]:
         """
         Create a helper function for DFS maze generation algorithm.
         
+        The helper walks the maze iteratively with an explicit stack of cells
+        rather than calling itself, so maze size isn't limited by call depth.
+        
         Args:
             blueprint_name: Name of the target Blueprint
             function_name: Name of the helper function to create
+            auto_compile: Whether to compile the Blueprint afterwards; pass False when
+                chaining several tools and call flush_blueprint_changes once at the end
             
         Returns:
             Dict containing success status and function details
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            # 1. Create the function
-            function_params = {
-                "blueprint_name": blueprint_name,
-                "function_name": function_name,
-                "inputs": [
-                    {"name": "StartX", "type": "int"},
-                    {"name": "StartY", "type": "int"}
-                ],
-                "outputs": [],
-                "pure": False,
-                "description": "Helper function for DFS maze generation"
-            }
-            
-            function_response = unreal.send_command("create_blueprint_function", function_params)
-            
-            if not function_response or function_response.get("status") != "success":
-                logger.error(f"Failed to create function: {function_response}")
-                return {"success": False, "message": f"Failed to create function: {function_response.get('error', 'Unknown error')}"}
-            
-            function_id = function_response.get("result", {}).get("function_id", "")
-            
-            # 2. Add local variables for DFS
-            
-            # Add a comment node for DFS algorithm
-            dfs_comment_params = {
-                "blueprint_name": blueprint_name,
-                "function_id": function_id,
-                "comment": "DFS Maze Generation Algorithm",
-                "position": [0, 0],
-                "size": [400, 100]
-            }
-            
-            dfs_comment_response = unreal.send_command("add_blueprint_comment_node", dfs_comment_params)
-            
-            # Add a local variable for visited cells
-            visited_var_params = {
-                "blueprint_name": blueprint_name,
-                "function_id": function_id,
-                "variable_name": "Visited",
-                "variable_type": "TArray<TArray<bool>>",
-                "is_local": True
-            }
+                return _err("Failed to connect to Unreal Engine")
             
-            visited_var_response = unreal.send_command("add_blueprint_variable", visited_var_params)
-            
-            if not visited_var_response or visited_var_response.get("status") != "success":
-                logger.error(f"Failed to create visited variable: {visited_var_response}")
-                return {"success": False, "message": f"Failed to create visited variable: {visited_var_response.get('error', 'Unknown error')}"}
-            
-            # Add a local variable for directions
-            directions_var_params = {
-                "blueprint_name": blueprint_name,
-                "function_id": function_id,
-                "variable_name": "Directions",
-                "variable_type": "TArray<FVector2D>",
-                "is_local": True
-            }
-            
-            directions_var_response = unreal.send_command("add_blueprint_variable", directions_var_params)
-            
-            if not directions_var_response or directions_var_response.get("status") != "success":
-                logger.error(f"Failed to create directions variable: {directions_var_response}")
-                return {"success": False, "message": f"Failed to create directions variable: {directions_var_response.get('error', 'Unknown error')}"}
-            
-            # 3. Implement the DFS algorithm
-            
-            # Add a recursive function call
-            recursive_call_params = {
+            failure = _build_graph(unreal, DFS_HELPER_TEMPLATE, {
                 "blueprint_name": blueprint_name,
-                "function_id": function_id,
-                "function": function_name,
-                "position": [500, 300]
-            }
-            
-            recursive_call_response = unreal.send_command("add_blueprint_function_call_node", recursive_call_params)
-            
-            if not recursive_call_response or recursive_call_response.get("status") != "success":
-                logger.error(f"Failed to add recursive function call: {recursive_call_response}")
-                return {"success": False, "message": f"Failed to add recursive function call: {recursive_call_response.get('error', 'Unknown error')}"}
-            
-            # 4. Compile the Blueprint
-            compile_params = {
-                "blueprint_name": blueprint_name
-            }
-            
-            compile_response = unreal.send_command("compile_blueprint", compile_params)
-            
-            if not compile_response or compile_response.get("status") != "success":
-                logger.error(f"Failed to compile Blueprint: {compile_response}")
-                return {"success": False, "message": f"Failed to compile Blueprint: {compile_response.get('error', 'Unknown error')}"}
+                "function_name": function_name
+            }, auto_compile)
+            if failure:
+                return failure
             
             return {
                 "success": True,
@@ -602,16 +554,15 @@ def register_blueprint_custom_function_tools(mcp: FastMCP):
             }
             
         except Exception as e:
-            error_msg = f"Error creating DFS helper function: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+            return _err(f"Error creating DFS helper function: {e}")
     
     @mcp.tool()
     def connect_blueprint_function_to_event(
         ctx: Context,
         blueprint_name: str,
         function_name: str,
-        event_type: str = "EventBeginPlay"
+        event_type: str = "EventBeginPlay",
+        auto_compile: bool = True
     ) -> Dict[str, Any]:
         """
         Connect a Blueprint function to an event.
@@ -620,84 +571,67 @@ def register_blueprint_custom_function_tools(mcp: FastMCP):
             blueprint_name: Name of the target Blueprint
             function_name: Name of the function to connect
             event_type: Type of event to connect to
+            auto_compile: Whether to compile the Blueprint afterwards; pass False when
+                chaining several tools and call flush_blueprint_changes once at the end
             
         Returns:
             Dict containing success status and connection details
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
+                return _err("Failed to connect to Unreal Engine")
             
-            # 1. Find or create the event
-            event_params = {
+            failure = _build_graph(unreal, EVENT_CALL_TEMPLATE, {
                 "blueprint_name": blueprint_name,
+                "function_name": function_name,
                 "event_type": event_type
-            }
-            
-            event_response = unreal.send_command("add_blueprint_event_node", event_params)
-            
-            if not event_response or event_response.get("status") != "success":
-                logger.error(f"Failed to add event node: {event_response}")
-                return {"success": False, "message": f"Failed to add event node: {event_response.get('error', 'Unknown error')}"}
-            
-            event_node_id = event_response.get("result", {}).get("node_id", "")
-            
-            # 2. Add a function call to the function
-            call_params = {
-                "blueprint_name": blueprint_name,
-                "function": function_name,
-                "position": [300, 0]
-            }
-            
-            call_response = unreal.send_command("add_blueprint_function_call_node", call_params)
-            
-            if not call_response or call_response.get("status") != "success":
-                logger.error(f"Failed to add function call node: {call_response}")
-                return {"success": False, "message": f"Failed to add function call node: {call_response.get('error', 'Unknown error')}"}
+            }, auto_compile)
+            if failure:
+                return failure
             
-            call_node_id = call_response.get("result", {}).get("node_id", "")
-            
-            # 3. Connect the event to the function call
-            connect_params = {
+            return {
+                "success": True,
+                "message": f"Successfully connected function {function_name} to {event_type} in {blueprint_name}",
                 "blueprint_name": blueprint_name,
-                "source_node_id": event_node_id,
-                "source_pin": "ExecutionOutput",
-                "target_node_id": call_node_id,
-                "target_pin": "ExecutionInput"
+                "function_name": function_name,
+                "event_type": event_type
             }
             
-            connect_response = unreal.send_command("connect_blueprint_nodes", connect_params)
-            
-            if not connect_response or connect_response.get("status") != "success":
-                logger.error(f"Failed to connect event to function call: {connect_response}")
-                return {"success": False, "message": f"Failed to connect event to function call: {connect_response.get('error', 'Unknown error')}"}
-            
-            # 4. Compile the Blueprint
-            compile_params = {
-                "blueprint_name": blueprint_name
-            }
+        except Exception as e:
+            return _err(f"Error connecting function to event: {e}")
+    
+    @mcp.tool()
+    def flush_blueprint_changes(
+        ctx: Context,
+        blueprint_name: str
+    ) -> Dict[str, Any]:
+        """
+        Compile a Blueprint once after changes made with auto_compile=False.
+        
+        Args:
+            blueprint_name: Name of the Blueprint to compile
             
-            compile_response = unreal.send_command("compile_blueprint", compile_params)
+        Returns:
+            Dict containing success status
+        """
+        try:
+            unreal = get_unreal_connection()
+            if not unreal:
+                return _err("Failed to connect to Unreal Engine")
             
-            if not compile_response or compile_response.get("status") != "success":
-                logger.error(f"Failed to compile Blueprint: {compile_response}")
-                return {"success": False, "message": f"Failed to compile Blueprint: {compile_response.get('error', 'Unknown error')}"}
+            compile_response = unreal.send_command("compile_blueprint", {"blueprint_name": blueprint_name})
+            ok, _, failure = _check(compile_response, "compile Blueprint")
+            if not ok:
+                return failure
             
             return {
                 "success": True,
-                "message": f"Successfully connected function {function_name} to {event_type} in {blueprint_name}",
-                "blueprint_name": blueprint_name,
-                "function_name": function_name,
-                "event_type": event_type
+                "message": f"Successfully compiled {blueprint_name}",
+                "blueprint_name": blueprint_name
             }
             
         except Exception as e:
-            error_msg = f"Error connecting function to event: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+            return _err(f"Error compiling Blueprint: {e}")
     
     logger.info("Blueprint custom function tools registered successfully")
@@ -4,39 +4,42 @@ Blueprint Function Tools for Unreal MCP.
 This module provides tools for generating Blueprint functions using AI.
 """
 
+import concurrent.futures
 import logging
 import json
-import os
-from typing import Dict, List, Any, Optional
+import threading
+import time
+from typing import Dict, List, Any, Optional, Tuple
 from mcp.server.fastmcp import FastMCP, Context
 
 # Get logger
 logger = logging.getLogger("UnrealMCP")
 
 # Import AI service
-from ai_service import AIService, AIServiceConfig
+from ai_service import CONFIG_FILE, get_ai_service
 
-# Load AI service configuration
-config = AIServiceConfig()
-config_file = os.path.expanduser("~/.unreal_mcp/ai_config.json")
-if os.path.exists(config_file):
-    config.load_from_file(config_file)
-else:
-    # Create default config
-    config.save_to_file(config_file)
+# How long a Blueprint's context is reused before it is looked up again; commands sent
+# through the Unreal connection that change a Blueprint drop its entry right away, this
+# bounds how stale changes made directly in the editor can be
+BLUEPRINT_CONTEXT_TTL_S = 30.0
 
-# Create AI service
-ai_service = AIService(config)
+# Blueprint contexts by Blueprint name, with the monotonic time they were looked up
+_blueprint_contexts: Dict[str, Tuple[float, Dict[str, Any]]] = {}
 
 def register_blueprint_function_tools(mcp: FastMCP):
     """Register Blueprint function tools with the MCP server."""
+    from unreal_mcp_server import add_blueprint_change_listener, get_unreal_connection
+    
+    # Every command that changes a Blueprint, whichever tool sends it, drops its cached context
+    add_blueprint_change_listener(_invalidate_blueprint_context)
     
     @mcp.tool()
     def generate_blueprint_function(
         ctx: Context,
         blueprint_name: str,
         function_description: str,
-        get_blueprint_context: bool = True
+        get_blueprint_context: bool = True,
+        auto_compile: bool = True
     ) -> Dict[str, Any]:
         """
         Generate a Blueprint function using AI.
@@ -45,12 +48,12 @@ def register_blueprint_function_tools(mcp: FastMCP):
             blueprint_name: Name of the target Blueprint
             function_description: Natural language description of the function
             get_blueprint_context: Whether to get the Blueprint context for better generation
+            auto_compile: Whether to compile the Blueprint afterwards; pass False when
+                generating several functions and call flush_blueprint_changes once at the end
             
         Returns:
             Dict containing the generated function details and success status
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -62,43 +65,36 @@ def register_blueprint_function_tools(mcp: FastMCP):
             if get_blueprint_context:
                 blueprint_context = _get_blueprint_context(unreal, blueprint_name)
             
-            # Generate function using AI
-            function_data = ai_service.generate_blueprint_function(
+            # Generate function using AI, creating the structs and enums it requires as they stream in
+            builder = _FunctionBuilder(unreal, blueprint_name)
+            function_data = get_ai_service().generate_blueprint_function(
                 function_description,
-                blueprint_context
+                blueprint_context,
+                on_part=builder.add_part
             )
             
+            # Create the rest of the function, along with any structs and enums it requires
+            result = builder.finish(function_data)
+            
             if not function_data:
                 logger.error("Failed to generate Blueprint function")
                 return {"success": False, "message": "Failed to generate Blueprint function"}
             
-            # Create required structs if any
-            if 'required_structs' in function_data and function_data['required_structs']:
-                for struct_data in function_data['required_structs']:
-                    _create_struct(unreal, struct_data)
-            
-            # Create required enums if any
-            if 'required_enums' in function_data and function_data['required_enums']:
-                for enum_data in function_data['required_enums']:
-                    _create_enum(unreal, enum_data)
-            
-            # Create the function in the Blueprint
-            result = _create_function_in_blueprint(unreal, blueprint_name, function_data)
-            
             if not result:
                 logger.error("Failed to create function in Blueprint")
                 return {"success": False, "message": "Failed to create function in Blueprint"}
             
             # Compile the Blueprint
-            compile_params = {
-                "blueprint_name": blueprint_name
-            }
-            
-            compile_response = unreal.send_command("compile_blueprint", compile_params)
-            
-            if not compile_response or compile_response.get("status") != "success":
-                logger.error(f"Failed to compile Blueprint: {compile_response}")
-                return {"success": False, "message": "Failed to compile Blueprint"}
+            if auto_compile:
+                compile_params = {
+                    "blueprint_name": blueprint_name
+                }
+                
+                compile_response = unreal.send_command("compile_blueprint", compile_params)
+                
+                if not compile_response or compile_response.get("status") != "success":
+                    logger.error(f"Failed to compile Blueprint: {compile_response}")
+                    return {"success": False, "message": "Failed to compile Blueprint"}
             
             return {
                 "success": True,
@@ -133,6 +129,8 @@ def register_blueprint_function_tools(mcp: FastMCP):
             Dict containing success status and configuration details
         """
         try:
+            config = get_ai_service().config
+            
             # Update configuration
             if openai_api_key is not None:
                 config.openai_api_key = openai_api_key
@@ -146,8 +144,7 @@ def register_blueprint_function_tools(mcp: FastMCP):
                 config.selected_service = selected_service
             
             # Save configuration
-            config_file = os.path.expanduser("~/.unreal_mcp/ai_config.json")
-            if not config.save_to_file(config_file):
+            if not config.save_to_file(CONFIG_FILE):
                 return {"success": False, "message": "Failed to save configuration"}
             
             return {
@@ -164,10 +161,58 @@ def register_blueprint_function_tools(mcp: FastMCP):
             logger.error(error_msg)
             return {"success": False, "message": error_msg}
     
+    @mcp.tool()
+    def set_skeletal_mesh_component(
+        ctx: Context,
+        blueprint_name: str,
+        component_name: str,
+        skeletal_mesh_path: str
+    ) -> Dict[str, Any]:
+        """Set a skeletal mesh for a component."""
+        unreal = get_unreal_connection()
+        if not unreal:
+            return {"success": False, "message": "Failed to connect to Unreal Engine"}
+        
+        params = {
+            "blueprint_name": blueprint_name,
+            "component_name": component_name,
+            "skeletal_mesh_path": skeletal_mesh_path
+        }
+        
+        response = unreal.send_command("set_skeletal_mesh", params)
+        return response
+    
+    @mcp.tool()
+    def attach_component(
+        ctx: Context,
+        blueprint_name: str,
+        component_name: str,
+        parent_component_name: str,
+        socket_name: str = ""
+    ) -> Dict[str, Any]:
+        """Attach a component to another component."""
+        unreal = get_unreal_connection()
+        if not unreal:
+            return {"success": False, "message": "Failed to connect to Unreal Engine"}
+        
+        params = {
+            "blueprint_name": blueprint_name,
+            "component_name": component_name,
+            "parent_component_name": parent_component_name,
+            "socket_name": socket_name
+        }
+        
+        response = unreal.send_command("attach_component", params)
+        return response
+    
     logger.info("Blueprint function tools registered successfully")
 
 def _get_blueprint_context(unreal, blueprint_name: str) -> Dict[str, Any]:
     """Get context information about a Blueprint for better function generation."""
+    cached = _blueprint_contexts.get(blueprint_name)
+    if cached and time.monotonic() - cached[0] < BLUEPRINT_CONTEXT_TTL_S:
+        return cached[1]
+    
     context = {
         "variables": [],
         "functions": [],
@@ -175,216 +220,268 @@ def _get_blueprint_context(unreal, blueprint_name: str) -> Dict[str, Any]:
     }
     
     try:
-        # Get Blueprint variables
-        var_params = {
-            "blueprint_name": blueprint_name
-        }
-        
-        var_response = unreal.send_command("get_blueprint_variables", var_params)
-        
-        if var_response and var_response.get("status") == "success":
-            variables = var_response.get("result", {}).get("variables", [])
-            context["variables"] = variables
-        
-        # Get Blueprint functions
-        func_params = {
+        # The three lookups are independent, so they are sent together and their round-trips overlap
+        params = {
             "blueprint_name": blueprint_name
         }
-        
-        func_response = unreal.send_command("get_blueprint_functions", func_params)
-        
-        if func_response and func_response.get("status") == "success":
-            functions = func_response.get("result", {}).get("functions", [])
-            context["functions"] = functions
-        
-        # Get Blueprint components
-        comp_params = {
-            "blueprint_name": blueprint_name
+        futures = {
+            key: unreal.send_command_async(command, params)
+            for key, command in (
+                ("variables", "get_blueprint_variables"),
+                ("functions", "get_blueprint_functions"),
+                ("components", "get_blueprint_components")
+            )
         }
         
-        comp_response = unreal.send_command("get_blueprint_components", comp_params)
-        
-        if comp_response and comp_response.get("status") == "success":
-            components = comp_response.get("result", {}).get("components", [])
-            context["components"] = components
+        complete = True
+        for key, future in futures.items():
+            response = future.result()
+            if response and response.get("status") == "success":
+                context[key] = response.get("result", {}).get(key, [])
+            else:
+                complete = False
         
+        # A partial context is used this once but looked up again next time
+        if complete:
+            _blueprint_contexts[blueprint_name] = (time.monotonic(), context)
         return context
         
     except Exception as e:
         logger.error(f"Error getting Blueprint context: {e}")
         return context
 
-def _create_struct(unreal, struct_data: Dict[str, Any]) -> bool:
-    """Create a struct in Unreal Engine."""
-    try:
-        struct_params = {
-            "struct_name": struct_data["name"],
-            "properties": struct_data["properties"]
-        }
-        
-        response = unreal.send_command("create_struct", struct_params)
-        
-        if not response or response.get("status") != "success":
-            logger.error(f"Failed to create struct: {response}")
-            return False
-        
-        return True
-        
-    except Exception as e:
-        logger.error(f"Error creating struct: {e}")
-        return False
+def _invalidate_blueprint_context(blueprint_name: str):
+    """Drop a Blueprint's cached context after it has been changed."""
+    _blueprint_contexts.pop(blueprint_name, None)
 
-def _create_enum(unreal, enum_data: Dict[str, Any]) -> bool:
-    """Create an enum in Unreal Engine."""
-    try:
-        enum_params = {
-            "enum_name": enum_data["name"],
-            "values": enum_data["values"]
-        }
+class _FunctionBuilder:
+    """
+    Create a generated function in a Blueprint, sending its parts in as few batches as possible.
+    
+    Parts can be added while the function is still being generated. The structs and
+    enums it requires are sent by a background thread as they arrive, so Unreal
+    creates them while the model is still writing the rest; creating them again is
+    harmless, so a generation that fails later leaves nothing half-built behind.
+    The function itself and its body wait for finish(), which only sends them once
+    the whole generation has been validated, as a single batch.
+    """
+    
+    def __init__(self, unreal, blueprint_name: str):
+        self.unreal = unreal
+        self.blueprint_name = blueprint_name
+        self.function_name = None
+        self._function = None
+        self._queued: List[Tuple[str, Any, str, Dict[str, Any]]] = []
+        self._added = set()
+        self._nodes: Dict[str, Any] = {}
+        self._sent: List[Tuple[str, Any]] = []
+        self._lock = threading.Lock()
+        self._flushing = False
+        self._executor = None
+    
+    def add_part(self, key: str, index: Optional[int], value: Any):
+        """
+        Queue a part of the function as it streams in, and start sending it if it is a prerequisite.
         
-        response = unreal.send_command("create_enum", enum_params)
+        Args:
+            key: Top-level key of the function data the part belongs to
+            index: Position of the part in that key's array, or None for the key's whole value
+            value: The part
+        """
+        if index is None:
+            return
+        if key == "required_structs":
+            self._add_struct(value)
+        elif key == "required_enums":
+            self._add_enum(value)
+        else:
+            # The function and its body wait for finish(), so a bad generation never starts one
+            return
+        self._start_flush()
+    
+    def finish(self, function_data: Optional[Dict[str, Any]]) -> bool:
+        """
+        Send the function and whatever else never streamed, and wait until Unreal has created it.
         
-        if not response or response.get("status") != "success":
-            logger.error(f"Failed to create enum: {response}")
+        Args:
+            function_data: The complete, validated generated function, or None if generation failed
+            
+        Returns:
+            True if the function was created
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        
+        if function_data is None:
+            if self._sent:
+                logger.warning("Generation failed after its structs or enums were sent to Unreal")
             return False
         
-        return True
+        for struct_data in function_data.get("required_structs") or []:
+            self._add_struct(struct_data)
+        for enum_data in function_data.get("required_enums") or []:
+            self._add_enum(enum_data)
+        self._add_function(function_data)
+        for var in function_data.get("local_variables") or []:
+            self._add_local_variable(var)
+        for node in function_data["nodes"]:
+            self._add_node(node)
+        for connection in function_data["connections"]:
+            self._add_connection(connection)
+        self._flush()
         
-    except Exception as e:
-        logger.error(f"Error creating enum: {e}")
-        return False
-
-def _create_function_in_blueprint(unreal, blueprint_name: str, function_data: Dict[str, Any]) -> bool:
-    """Create a function in a Blueprint based on the generated data."""
-    try:
-        # Create the function
+        for kind, command in self._sent:
+            if command.response and command.response.get("status") == "success":
+                continue
+            if kind in ("struct", "enum"):
+                logger.error(f"Failed to create {kind}: {command.response}")
+            elif kind == "function":
+                logger.error(f"Failed to create function: {command.response}")
+            else:
+                logger.warning(f"Failed to create {kind}: {command.response}")
+        
+        return self._succeeded(self._function)
+    
+    def _queue(self, kind: str, key: Any, command: str, params: Dict[str, Any]):
+        """Queue a command for the next batch, unless the same part was already queued."""
+        if (kind, key) in self._added:
+            return
+        self._added.add((kind, key))
+        with self._lock:
+            self._queued.append((kind, key, command, params))
+    
+    def _add_struct(self, struct_data: Dict[str, Any]):
+        """Queue creating a struct the function uses."""
+        try:
+            self._queue("struct", struct_data["name"], "create_struct", {
+                "struct_name": struct_data["name"],
+                "properties": struct_data["properties"]
+            })
+        except KeyError as e:
+            logger.error(f"Error creating struct: missing {e}")
+    
+    def _add_enum(self, enum_data: Dict[str, Any]):
+        """Queue creating an enum the function uses."""
+        try:
+            self._queue("enum", enum_data["name"], "create_enum", {
+                "enum_name": enum_data["name"],
+                "values": enum_data["values"]
+            })
+        except KeyError as e:
+            logger.error(f"Error creating enum: missing {e}")
+    
+    def _add_function(self, function_data: Dict[str, Any]):
+        """Queue creating the function itself, which the rest of its parts need."""
         function_params = {
-            "blueprint_name": blueprint_name,
+            "blueprint_name": self.blueprint_name,
             "function_name": function_data["function_name"],
             "return_type": function_data.get("return_type", "None")
         }
         
         # Add parameters if any
-        if "parameters" in function_data and function_data["parameters"]:
+        if function_data.get("parameters"):
             function_params["parameters"] = function_data["parameters"]
         
-        response = unreal.send_command("create_blueprint_function", function_params)
-        
-        if not response or response.get("status") != "success":
-            logger.error(f"Failed to create function: {response}")
-            return False
-        
-        # Create local variables if any
-        if "local_variables" in function_data and function_data["local_variables"]:
-            for var in function_data["local_variables"]:
-                var_params = {
-                    "blueprint_name": blueprint_name,
-                    "function_name": function_data["function_name"],
-                    "variable_name": var["name"],
-                    "variable_type": var["type"]
-                }
-                
-                var_response = unreal.send_command("add_local_variable", var_params)
-                
-                if not var_response or var_response.get("status") != "success":
-                    logger.warning(f"Failed to create local variable: {var_response}")
-        
-        # Create nodes
-        node_id_map = {}  # Map AI-generated node IDs to actual node IDs
-        
-        for node in function_data["nodes"]:
-            node_params = {
-                "blueprint_name": blueprint_name,
-                "function_name": function_data["function_name"],
-                "node_type": node["type"],
-                "position": node.get("position", [0, 0])
-            }
-            
-            # Add node-specific parameters
-            if node["type"] == "FunctionCall":
-                node_params["function"] = node["function"]
-                node_params["target"] = node.get("target", "self")
-                if "parameters" in node:
-                    node_params["parameters"] = node["parameters"]
-            
-            node_response = unreal.send_command("add_blueprint_node", node_params)
-            
-            if not node_response or node_response.get("status") != "success":
-                logger.warning(f"Failed to create node: {node_response}")
-                continue
-            
-            # Store the mapping from AI node ID to actual node ID
-            actual_node_id = node_response.get("result", {}).get("node_id")
-            if actual_node_id:
-                node_id_map[node["id"]] = actual_node_id
-        
-        # Create connections
-        for connection in function_data["connections"]:
-            # Skip if we don't have the node IDs
-            if connection["from_node"] not in node_id_map or connection["to_node"] not in node_id_map:
-                logger.warning(f"Skipping connection due to missing node: {connection}")
-                continue
-            
-            connection_params = {
-                "blueprint_name": blueprint_name,
-                "function_name": function_data["function_name"],
-                "source_node_id": node_id_map[connection["from_node"]],
-                "source_pin": connection["from_pin"],
-                "target_node_id": node_id_map[connection["to_node"]],
-                "target_pin": connection["to_pin"]
-            }
-            
-            connection_response = unreal.send_command("connect_blueprint_nodes", connection_params)
-            
-            if not connection_response or connection_response.get("status") != "success":
-                logger.warning(f"Failed to create connection: {connection_response}")
+        self.function_name = function_data["function_name"]
+        self._queue("function", None, "create_blueprint_function", function_params)
+    
+    def _add_local_variable(self, var: Dict[str, Any]):
+        """Queue adding a local variable to the function."""
+        self._queue("local variable", var["name"], "add_local_variable", {
+            "blueprint_name": self.blueprint_name,
+            "function_name": self.function_name,
+            "variable_name": var["name"],
+            "variable_type": var["type"]
+        })
+    
+    def _add_node(self, node: Dict[str, Any]):
+        """Queue adding a node, keyed by its AI-generated node ID."""
+        node_params = {
+            "blueprint_name": self.blueprint_name,
+            "function_name": self.function_name,
+            "node_type": node["type"],
+            "position": node.get("position", [0, 0])
+        }
         
-        return True
+        # Add node-specific parameters
+        if node["type"] == "FunctionCall":
+            node_params["function"] = node["function"]
+            node_params["target"] = node.get("target", "self")
+            if "parameters" in node:
+                node_params["parameters"] = node["parameters"]
         
-    except Exception as e:
-        logger.error(f"Error creating function in Blueprint: {e}")
-        return False
-
-@mcp.tool()
-def set_skeletal_mesh_component(
-    ctx: Context,
-    blueprint_name: str,
-    component_name: str,
-    skeletal_mesh_path: str
-) -> Dict[str, Any]:
-    """Set a skeletal mesh for a component."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
+        self._queue("node", node["id"], "add_blueprint_node", node_params)
     
-    params = {
-        "blueprint_name": blueprint_name,
-        "component_name": component_name,
-        "skeletal_mesh_path": skeletal_mesh_path
-    }
+    def _add_connection(self, connection: Dict[str, Any]):
+        """Queue a connection; its AI-generated node IDs are resolved when it is sent."""
+        key = (connection["from_node"], connection["from_pin"], connection["to_node"], connection["to_pin"])
+        self._queue("connection", key, "connect_blueprint_nodes", {
+            "blueprint_name": self.blueprint_name,
+            "function_name": self.function_name,
+            "source_node_id": connection["from_node"],
+            "source_pin": connection["from_pin"],
+            "target_node_id": connection["to_node"],
+            "target_pin": connection["to_pin"]
+        })
     
-    response = unreal.send_command("set_skeletal_mesh", params)
-    return response
-
-@mcp.tool()
-def attach_component(
-    ctx: Context,
-    blueprint_name: str,
-    component_name: str,
-    parent_component_name: str,
-    socket_name: str = ""
-) -> Dict[str, Any]:
-    """Attach a component to another component."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
+    def _start_flush(self):
+        """Have the background thread send what is queued, unless it is already sending."""
+        with self._lock:
+            if self._flushing or not self._queued:
+                return
+            self._flushing = True
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._executor.submit(self._flush)
     
-    params = {
-        "blueprint_name": blueprint_name,
-        "component_name": component_name,
-        "parent_component_name": parent_component_name,
-        "socket_name": socket_name
-    }
+    def _flush(self):
+        """Send the queued commands, one batch at a time, until none are left."""
+        while True:
+            with self._lock:
+                queued, self._queued = self._queued, []
+                if not queued:
+                    self._flushing = False
+                    return
+            
+            try:
+                self._send(queued)
+            except Exception as e:
+                logger.error(f"Error creating function in Blueprint: {e}")
+    
+    def _send(self, queued: List[Tuple[str, Any, str, Dict[str, Any]]]):
+        """Send commands as one batch."""
+        with self.unreal.batch() as batch:
+            in_batch = set()
+            for kind, key, command, params in queued:
+                if kind == "connection":
+                    source = self._node_ref(params["source_node_id"], in_batch)
+                    target = self._node_ref(params["target_node_id"], in_batch)
+                    if source is None or target is None:
+                        # Skip if the connection names a node that isn't in the function
+                        logger.warning(f"Skipping connection due to missing node: {key}")
+                        continue
+                    params = {**params, "source_node_id": source, "target_node_id": target}
+                
+                handle = batch.add(command, params, required=kind == "function")
+                self._sent.append((kind, handle))
+                if kind == "function":
+                    self._function = handle
+                elif kind == "node":
+                    self._nodes[key] = handle
+                    in_batch.add(key)
+    
+    def _node_ref(self, node_id: str, in_batch: set):
+        """Unreal's ID for an AI-generated node ID: a batch reference if the node is in this batch."""
+        handle = self._nodes.get(node_id)
+        if handle is None:
+            return None
+        if node_id in in_batch:
+            return handle.ref()
+        if not self._succeeded(handle):
+            return None
+        return handle.response.get("result", {}).get("node_id")
     
-    response = unreal.send_command("attach_component", params)
-    return response
+    @staticmethod
+    def _succeeded(command) -> bool:
+        """Whether a sent command succeeded."""
+        return bool(command and command.response and command.response.get("status") == "success")
@@ -5,16 +5,268 @@ This module provides advanced tools for Blueprint node management, including pre
 and complete event graph logic creation.
 """
 
+import itertools
+import json
 import logging
 import os
-from typing import Dict, List, Any, Optional, Tuple
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from mcp.server.fastmcp import FastMCP, Context
 
 # Get logger
 logger = logging.getLogger("UnrealMCP")
 
+# Actor types backed by an engine basic-shape mesh. set_static_mesh_properties takes the
+# lowercase shape name and resolves it through the plugin's cached basic-shape lookup.
+_BASIC_SHAPES = frozenset(("cube", "sphere", "cylinder", "cone"))
+
+# Default speed of the rotation tools, in degrees per second
+_DEFAULT_ROTATION_SPEED = 20.0
+
+# Rotator pin and Roll/Pitch/Yaw pin values for each rotation axis
+_AXIS_PINS = {
+    "X": ("Roll", "1", "0", "0"),
+    "Y": ("Pitch", "0", "1", "0"),
+    "Z": ("Yaw", "0", "0", "1")
+}
+
+
+@dataclass(frozen=True, slots=True)
+class RotatingActorSpec:
+    """
+    Inputs of the rotation tools, checked before anything is sent to Unreal.
+    
+    Raises:
+        ValueError: If the actor type has no basic-shape mesh, the axis isn't X, Y or Z,
+            the speed isn't a number, or a location/rotation/scale doesn't have 3 numbers
+    """
+    actor_type: str = "Cube"
+    rotation_speed: float = _DEFAULT_ROTATION_SPEED
+    rotation_axis: str = "Z"
+    location: Sequence[float] = (0.0, 0.0, 0.0)
+    rotation: Sequence[float] = (0.0, 0.0, 0.0)
+    scale: Sequence[float] = (1.0, 1.0, 1.0)
+    
+    def __post_init__(self):
+        if self.mesh_shape not in _BASIC_SHAPES:
+            raise ValueError(f"Unsupported actor type '{self.actor_type}'; use one of Cube, Sphere, Cylinder or Cone")
+        if self.axis not in _AXIS_PINS:
+            raise ValueError(f"Invalid rotation axis '{self.rotation_axis}'; use X, Y or Z")
+        if isinstance(self.rotation_speed, bool) or not isinstance(self.rotation_speed, (int, float)):
+            raise ValueError(f"Rotation speed must be a number, got {self.rotation_speed!r}")
+        for name in ("location", "rotation", "scale"):
+            value = getattr(self, name)
+            if len(value) != 3 or not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in value):
+                raise ValueError(f"{name.capitalize()} must be 3 numbers [X, Y, Z], got {value!r}")
+    
+    @property
+    def mesh_shape(self) -> str:
+        """Short basic-shape name for set_static_mesh_properties."""
+        return self.actor_type.lower()
+    
+    @property
+    def axis(self) -> str:
+        """Rotation axis in upper case ("X", "Y" or "Z")."""
+        return self.rotation_axis.upper()
+
+# Event graph that rotates an actor every tick, shared by create_rotating_actor and
+# add_blueprint_complete_rotation_logic. Entries with a "node" name create a node that later
+# entries refer to by that name in their *_node_id params; "{name}" values are replaced with
+# rotation_speed, axis_values (the Roll/Pitch/Yaw pin values) or rot_pin.
+ROTATION_GRAPH_SPEC = [
+    {"step": "add Event Tick node", "node": "tick", "command": "add_blueprint_event_node",
+     "params": {"event_type": "EventTick"}},
+    {"step": "add Get Delta Seconds node", "node": "delta", "command": "add_blueprint_function_call_node",
+     "params": {"function": "GetWorldDeltaSeconds", "target": "self"}},
+    {"step": "add multiply node", "node": "multiply", "command": "add_blueprint_math_node",
+     "params": {"operation": "float * float", "position": [400, 0]}},
+    {"step": "set rotation speed", "command": "set_blueprint_node_pin_value",
+     "params": {"node_id": "multiply", "pin_name": "B", "value": "{rotation_speed}"}},
+    {"step": "add Make Rotator node", "node": "make_rot", "command": "add_blueprint_function_call_node",
+     "params": {"function": "MakeRotator", "position": [600, 0]}},
+    {"step": "set rotation axis", "command": "set_blueprint_node_pin_values",
+     "params": {"node_id": "make_rot", "values": "{axis_values}"}},
+    {"step": "add Add Actor Local Rotation node", "node": "add_rot", "command": "add_blueprint_function_call_node",
+     "params": {"function": "AddActorLocalRotation", "target": "self", "position": [800, 0]}},
+    {"step": "connect Event Tick to Get Delta Seconds", "command": "connect_blueprint_nodes",
+     "params": {"source_node_id": "tick", "source_pin": "ExecutionOutput",
+                "target_node_id": "delta", "target_pin": "ExecutionInput"}},
+    {"step": "connect Get Delta Seconds to Multiply", "command": "connect_blueprint_nodes",
+     "params": {"source_node_id": "delta", "source_pin": "ReturnValue",
+                "target_node_id": "multiply", "target_pin": "A"}},
+    {"step": "connect Multiply to Make Rotator", "command": "connect_blueprint_nodes",
+     "params": {"source_node_id": "multiply", "source_pin": "ReturnValue",
+                "target_node_id": "make_rot", "target_pin": "{rot_pin}"}},
+    {"step": "connect Make Rotator to Add Actor Local Rotation", "command": "connect_blueprint_nodes",
+     "params": {"source_node_id": "make_rot", "source_pin": "ReturnValue",
+                "target_node_id": "add_rot", "target_pin": "DeltaRotation"}},
+    # Execution flow
+    {"step": "connect Get Delta Seconds to Add Actor Local Rotation", "command": "connect_blueprint_nodes",
+     "params": {"source_node_id": "delta", "source_pin": "ExecutionOutput",
+                "target_node_id": "add_rot", "target_pin": "ExecutionInput"}},
+]
+
+
+class UnrealStepError(Exception):
+    """Raised by _must when an Unreal command fails; the message names the failed step."""
+
+
+def _must(response: Dict[str, Any], what: str) -> Dict[str, Any]:
+    """
+    Check the response to one step of a tool.
+    
+    Args:
+        response: Response from Unreal, or None if none arrived
+        what: Description of the step, used in the error message ("add component")
+        
+    Returns:
+        The response, if the command succeeded
+        
+    Raises:
+        UnrealStepError: If there is no response or the command failed
+    """
+    if not response or response.get("status") != "success":
+        error = response.get("error", "Unknown error") if response else "No response from Unreal Engine"
+        raise UnrealStepError(f"Failed to {what}: {error}")
+    return response
+
+
+# Params of the rotation graph are encoded as JSON bytes, most of them once at import
+_ENC = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def _encode(value: Any) -> bytes:
+    """Encode a value as compact JSON bytes."""
+    return _ENC.encode(value).encode("utf-8")
+
+
+def _compile_graph_entry(entry: Dict[str, Any]) -> tuple:
+    """
+    Split the params of a ROTATION_GRAPH_SPEC entry into pre-encoded and per-call parts.
+    
+    Args:
+        entry: Entry of ROTATION_GRAPH_SPEC
+        
+    Returns:
+        Tuple of (command, node name, step, encoded static params, node refs, values);
+        node refs and values are lists of (encoded key, node name or value name)
+    """
+    static = b""
+    refs = []
+    values = []
+    for key, value in entry["params"].items():
+        encoded_key = _encode(key) + b":"
+        if key.endswith("node_id"):
+            refs.append((encoded_key, value))
+        elif isinstance(value, str) and value.startswith("{"):
+            values.append((encoded_key, value[1:-1]))
+        else:
+            static += b"," + encoded_key + _encode(value)
+    return entry["command"], entry.get("node"), entry["step"], static, refs, values
+
+
+_ROTATION_GRAPH_OPS = [_compile_graph_entry(entry) for entry in ROTATION_GRAPH_SPEC]
+
+# Encoded "{name}" values for each rotation axis, and the encoded default rotation speed
+_ENCODED_AXIS_VALUES = {
+    axis: {"rot_pin": _encode(rot_pin), "axis_values": _encode({"Roll": roll, "Pitch": pitch, "Yaw": yaw})}
+    for axis, (rot_pin, roll, pitch, yaw) in _AXIS_PINS.items()
+}
+_ENCODED_DEFAULT_SPEED = _encode(str(_DEFAULT_ROTATION_SPEED))
+
+
+def _add_rotation_graph(batch, blueprint_name: str, spec: RotatingActorSpec) -> List[tuple]:
+    """
+    Queue the ROTATION_GRAPH_SPEC commands on a batch.
+    
+    Args:
+        batch: CommandBatch to add the commands to
+        blueprint_name: Name of the target Blueprint
+        spec: Validated rotation speed and axis
+        
+    Returns:
+        List of (batched command, step description) pairs in spec order
+    """
+    values = dict(_ENCODED_AXIS_VALUES[spec.axis])
+    values["rotation_speed"] = (
+        _ENCODED_DEFAULT_SPEED if spec.rotation_speed == _DEFAULT_ROTATION_SPEED else _encode(str(spec.rotation_speed))
+    )
+    
+    # Only the Blueprint name, the speed and each node's ref are encoded per call
+    head = b'{"blueprint_name":' + _encode(blueprint_name)
+    node_refs = {}
+    steps = []
+    for command_type, node, step, static, refs, value_names in _ROTATION_GRAPH_OPS:
+        params = head
+        for encoded_key, name in refs:
+            params += b"," + encoded_key + node_refs[name]
+        for encoded_key, name in value_names:
+            params += b"," + encoded_key + values[name]
+        command = batch.add(command_type, params + static + b"}")
+        if node:
+            node_refs[node] = _encode(command.ref())
+        steps.append((command, step))
+    return steps
+
+# Blueprint jobs started by the *_async tools, keyed by handle. One worker runs them in the
+# order they were started; beyond MAX_FINISHED_JOBS, the oldest finished jobs are forgotten.
+MAX_FINISHED_JOBS = 64
+_jobs: "OrderedDict[str, Future]" = OrderedDict()
+_jobs_lock = threading.Lock()
+_job_ids = itertools.count(1)
+_job_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _start_job(fn, *args, **kwargs) -> str:
+    """
+    Run fn(*args, **kwargs) on the Blueprint job worker.
+    
+    Returns:
+        Handle for _job_status
+    """
+    global _job_executor
+    with _jobs_lock:
+        if _job_executor is None:
+            _job_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="UnrealMCPJob")
+        finished = [handle for handle, future in _jobs.items() if future.done()]
+        for handle in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del _jobs[handle]
+        handle = f"job-{next(_job_ids)}"
+        _jobs[handle] = _job_executor.submit(fn, *args, **kwargs)
+    return handle
+
+
+def _job_status(handle: str) -> Dict[str, Any]:
+    """
+    Report on a job started with _start_job.
+    
+    Args:
+        handle: Handle returned by _start_job
+        
+    Returns:
+        Dict with the job's status ("queued", "running" or "done") and, once done, its result
+    """
+    with _jobs_lock:
+        future = _jobs.get(handle)
+    if future is None:
+        return {"success": False, "message": f"Unknown job handle: {handle}"}
+    
+    if not future.done():
+        status = "running" if future.running() else "queued"
+        return {"success": True, "handle": handle, "status": status, "done": False}
+    
+    try:
+        result = future.result()
+    except Exception as e:
+        result = {"success": False, "message": f"Job failed: {e}"}
+    return {"success": True, "handle": handle, "status": "done", "done": True, "result": result}
+
 def register_enhanced_node_tools(mcp: FastMCP):
     """Register enhanced Blueprint node tools with the MCP server."""
+    from unreal_mcp_server import get_unreal_connection
     
     @mcp.tool()
     def create_rotating_actor(
@@ -24,7 +276,7 @@ def register_enhanced_node_tools(mcp: FastMCP):
         location: List[float] = None,
         rotation: List[float] = None,
         scale: List[float] = None,
-        rotation_speed: float = 20.0,
+        rotation_speed: float = _DEFAULT_ROTATION_SPEED,
         rotation_axis: str = "Z",
         spawn_in_level_editor: bool = True
     ) -> Dict[str, Any]:
@@ -32,7 +284,7 @@ def register_enhanced_node_tools(mcp: FastMCP):
         Create an actor that rotates continuously.
         
         Args:
-            actor_type: Type of actor to create ("Cube", "Sphere", "Cylinder", etc.)
+            actor_type: Type of actor to create ("Cube", "Sphere", "Cylinder" or "Cone")
             blueprint_name: Optional name for the Blueprint to create (if None, will generate one)
             location: Optional location [X, Y, Z]
             rotation: Optional rotation [Pitch, Yaw, Roll]
@@ -48,330 +300,74 @@ def register_enhanced_node_tools(mcp: FastMCP):
             create_rotating_actor(ctx, actor_type="Cube", spawn_in_level_editor=True)
         """
         # This edit follows the 'tools' Cursor rule for MCP tools.
-        from unreal_mcp_server import get_unreal_connection
         try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            # Default values
+            # Default values; bad input is rejected here, before anything is sent
             if location is None:
                 location = [0, 0, 0]
             if rotation is None:
                 rotation = [0, 0, 0]
             if scale is None:
                 scale = [1.0, 1.0, 1.0]
+            spec = RotatingActorSpec(actor_type, rotation_speed, rotation_axis, location, rotation, scale)
+            
+            unreal = get_unreal_connection()
+            if not unreal:
+                logger.error("Failed to connect to Unreal Engine")
+                return {"success": False, "message": "Failed to connect to Unreal Engine"}
             # Generate Blueprint name if not provided
             if blueprint_name is None:
                 blueprint_name = f"BP_Rotating_{actor_type}"
+            component_name = actor_type + "Mesh"
             
-            # Create the Blueprint
-            blueprint_params = {
-                "blueprint_name": blueprint_name,
-                "parent_class": "/Script/Engine.Actor",
-                "save_path": "/Game/Blueprints"
-            }
-            
-            blueprint_response = unreal.send_command("create_blueprint_class", blueprint_params)
-            
-            if not blueprint_response or blueprint_response.get("status") != "success":
-                logger.error(f"Failed to create Blueprint: {blueprint_response}")
-                return {"success": False, "message": f"Failed to create Blueprint: {blueprint_response.get('error', 'Unknown error')}"}
-            
-            # Add a static mesh component
-            component_params = {
-                "blueprint_name": blueprint_name,
-                "component_type": "StaticMeshComponent",
-                "component_name": f"{actor_type}Mesh"
-            }
-            
-            component_response = unreal.send_command("add_component_to_blueprint", component_params)
-            
-            if not component_response or component_response.get("status") != "success":
-                logger.error(f"Failed to add component: {component_response}")
-                return {"success": False, "message": f"Failed to add component: {component_response.get('error', 'Unknown error')}"}
-            
-            # Set the static mesh based on actor type
-            mesh_path = ""
-            if actor_type.lower() == "cube":
-                mesh_path = "/Engine/BasicShapes/Cube.Cube"
-            elif actor_type.lower() == "sphere":
-                mesh_path = "/Engine/BasicShapes/Sphere.Sphere"
-            elif actor_type.lower() == "cylinder":
-                mesh_path = "/Engine/BasicShapes/Cylinder.Cylinder"
-            elif actor_type.lower() == "cone":
-                mesh_path = "/Engine/BasicShapes/Cone.Cone"
-            else:
-                mesh_path = "/Engine/BasicShapes/Cube.Cube"  # Default to cube
-            
-            mesh_params = {
-                "blueprint_name": blueprint_name,
-                "component_name": f"{actor_type}Mesh",
-                "static_mesh": mesh_path
-            }
-            
-            mesh_response = unreal.send_command("set_static_mesh_properties", mesh_params)
-            
-            if not mesh_response or mesh_response.get("status") != "success":
-                logger.error(f"Failed to set static mesh: {mesh_response}")
-                return {"success": False, "message": f"Failed to set static mesh: {mesh_response.get('error', 'Unknown error')}"}
-            
-            # Create the rotation logic in the event graph
-            
-            # 1. Add the Event Tick node
-            tick_params = {
-                "blueprint_name": blueprint_name,
-                "event_type": "EventTick"
-            }
-            
-            tick_response = unreal.send_command("add_blueprint_event_node", tick_params)
-            
-            if not tick_response or tick_response.get("status") != "success":
-                logger.error(f"Failed to add Event Tick node: {tick_response}")
-                return {"success": False, "message": f"Failed to add Event Tick node: {tick_response.get('error', 'Unknown error')}"}
-            
-            tick_node_id = tick_response.get("result", {}).get("node_id")
-            
-            # 2. Add the Get Delta Seconds node
-            delta_params = {
-                "blueprint_name": blueprint_name,
-                "function": "GetWorldDeltaSeconds",
-                "target": "self"
-            }
-            
-            delta_response = unreal.send_command("add_blueprint_function_call_node", delta_params)
-            
-            if not delta_response or delta_response.get("status") != "success":
-                logger.error(f"Failed to add Get Delta Seconds node: {delta_response}")
-                return {"success": False, "message": f"Failed to add Get Delta Seconds node: {delta_response.get('error', 'Unknown error')}"}
-            
-            delta_node_id = delta_response.get("result", {}).get("node_id")
-            
-            # 3. Add a multiply node for rotation speed
-            multiply_params = {
-                "blueprint_name": blueprint_name,
-                "operation": "float * float",
-                "position": [400, 0]
-            }
-            
-            multiply_response = unreal.send_command("add_blueprint_math_node", multiply_params)
-            
-            if not multiply_response or multiply_response.get("status") != "success":
-                logger.error(f"Failed to add multiply node: {multiply_response}")
-                return {"success": False, "message": f"Failed to add multiply node: {multiply_response.get('error', 'Unknown error')}"}
-            
-            multiply_node_id = multiply_response.get("result", {}).get("node_id")
-            
-            # 4. Set the rotation speed constant
-            speed_params = {
-                "blueprint_name": blueprint_name,
-                "node_id": multiply_node_id,
-                "pin_name": "B",
-                "value": str(rotation_speed)
-            }
-            
-            speed_response = unreal.send_command("set_blueprint_node_pin_value", speed_params)
-            
-            if not speed_response or speed_response.get("status") != "success":
-                logger.error(f"Failed to set rotation speed: {speed_response}")
-                return {"success": False, "message": f"Failed to set rotation speed: {speed_response.get('error', 'Unknown error')}"}
-            
-            # 5. Create a rotation vector
-            make_rot_params = {
-                "blueprint_name": blueprint_name,
-                "function": "MakeRotator",
-                "position": [600, 0]
-            }
-            
-            make_rot_response = unreal.send_command("add_blueprint_function_call_node", make_rot_params)
-            
-            if not make_rot_response or make_rot_response.get("status") != "success":
-                logger.error(f"Failed to add Make Rotator node: {make_rot_response}")
-                return {"success": False, "message": f"Failed to add Make Rotator node: {make_rot_response.get('error', 'Unknown error')}"}
-            
-            make_rot_node_id = make_rot_response.get("result", {}).get("node_id")
-            
-            # 6. Set the rotation axis
-            rot_x = "0"
-            rot_y = "0"
-            rot_z = "0"
-            
-            if rotation_axis.upper() == "X":
-                rot_x = "1"
-            elif rotation_axis.upper() == "Y":
-                rot_y = "1"
-            else:  # Default to Z
-                rot_z = "1"
-            
-            # Set X rotation
-            rot_x_params = {
-                "blueprint_name": blueprint_name,
-                "node_id": make_rot_node_id,
-                "pin_name": "Roll",
-                "value": rot_x
-            }
-            
-            rot_x_response = unreal.send_command("set_blueprint_node_pin_value", rot_x_params)
-            
-            if not rot_x_response or rot_x_response.get("status") != "success":
-                logger.error(f"Failed to set X rotation: {rot_x_response}")
-                return {"success": False, "message": f"Failed to set X rotation: {rot_x_response.get('error', 'Unknown error')}"}
-            
-            # Set Y rotation
-            rot_y_params = {
-                "blueprint_name": blueprint_name,
-                "node_id": make_rot_node_id,
-                "pin_name": "Pitch",
-                "value": rot_y
-            }
-            
-            rot_y_response = unreal.send_command("set_blueprint_node_pin_value", rot_y_params)
-            
-            if not rot_y_response or rot_y_response.get("status") != "success":
-                logger.error(f"Failed to set Y rotation: {rot_y_response}")
-                return {"success": False, "message": f"Failed to set Y rotation: {rot_y_response.get('error', 'Unknown error')}"}
-            
-            # Set Z rotation
-            rot_z_params = {
-                "blueprint_name": blueprint_name,
-                "node_id": make_rot_node_id,
-                "pin_name": "Yaw",
-                "value": rot_z
-            }
-            
-            rot_z_response = unreal.send_command("set_blueprint_node_pin_value", rot_z_params)
-            
-            if not rot_z_response or rot_z_response.get("status") != "success":
-                logger.error(f"Failed to set Z rotation: {rot_z_response}")
-                return {"success": False, "message": f"Failed to set Z rotation: {rot_z_response.get('error', 'Unknown error')}"}
-            
-            # 7. Add the Add Actor Local Rotation node
-            add_rot_params = {
-                "blueprint_name": blueprint_name,
-                "function": "AddActorLocalRotation",
-                "target": "self",
-                "position": [800, 0]
-            }
-            
-            add_rot_response = unreal.send_command("add_blueprint_function_call_node", add_rot_params)
-            
-            if not add_rot_response or add_rot_response.get("status") != "success":
-                logger.error(f"Failed to add Add Actor Local Rotation node: {add_rot_response}")
-                return {"success": False, "message": f"Failed to add Add Actor Local Rotation node: {add_rot_response.get('error', 'Unknown error')}"}
-            
-            add_rot_node_id = add_rot_response.get("result", {}).get("node_id")
-            
-            # 8. Connect the nodes
-            
-            # Connect Event Tick to Get Delta Seconds
-            connect_tick_delta_params = {
-                "blueprint_name": blueprint_name,
-                "source_node_id": tick_node_id,
-                "source_pin": "ExecutionOutput",
-                "target_node_id": delta_node_id,
-                "target_pin": "ExecutionInput"
-            }
-            
-            connect_tick_delta_response = unreal.send_command("connect_blueprint_nodes", connect_tick_delta_params)
-            
-            if not connect_tick_delta_response or connect_tick_delta_response.get("status") != "success":
-                logger.error(f"Failed to connect Event Tick to Get Delta Seconds: {connect_tick_delta_response}")
-                return {"success": False, "message": f"Failed to connect Event Tick to Get Delta Seconds: {connect_tick_delta_response.get('error', 'Unknown error')}"}
-            
-            # Connect Get Delta Seconds to Multiply
-            connect_delta_multiply_params = {
-                "blueprint_name": blueprint_name,
-                "source_node_id": delta_node_id,
-                "source_pin": "ReturnValue",
-                "target_node_id": multiply_node_id,
-                "target_pin": "A"
-            }
-            
-            connect_delta_multiply_response = unreal.send_command("connect_blueprint_nodes", connect_delta_multiply_params)
-            
-            if not connect_delta_multiply_response or connect_delta_multiply_response.get("status") != "success":
-                logger.error(f"Failed to connect Get Delta Seconds to Multiply: {connect_delta_multiply_response}")
-                return {"success": False, "message": f"Failed to connect Get Delta Seconds to Multiply: {connect_delta_multiply_response.get('error', 'Unknown error')}"}
-            
-            # Connect Multiply to Make Rotator
-            # Determine the correct pin name for the rotation axis
-            if rotation_axis.upper() == "X":
-                rot_pin = "Roll"
-            elif rotation_axis.upper() == "Y":
-                rot_pin = "Pitch"
-            else:
-                rot_pin = "Yaw"
-            connect_multiply_rot_params = {
-                "blueprint_name": blueprint_name,
-                "source_node_id": multiply_node_id,
-                "source_pin": "ReturnValue",
-                "target_node_id": make_rot_node_id,
-                "target_pin": rot_pin
-            }
-            
-            connect_multiply_rot_response = unreal.send_command("connect_blueprint_nodes", connect_multiply_rot_params)
-            
-            if not connect_multiply_rot_response or connect_multiply_rot_response.get("status") != "success":
-                logger.error(f"Failed to connect Multiply to Make Rotator: {connect_multiply_rot_response}")
-                return {"success": False, "message": f"Failed to connect Multiply to Make Rotator: {connect_multiply_rot_response.get('error', 'Unknown error')}"}
-            
-            # Connect Make Rotator to Add Actor Local Rotation
-            connect_rot_add_rot_params = {
-                "blueprint_name": blueprint_name,
-                "source_node_id": make_rot_node_id,
-                "source_pin": "ReturnValue",
-                "target_node_id": add_rot_node_id,
-                "target_pin": "DeltaRotation"
-            }
-            
-            connect_rot_add_rot_response = unreal.send_command("connect_blueprint_nodes", connect_rot_add_rot_params)
-            
-            if not connect_rot_add_rot_response or connect_rot_add_rot_response.get("status") != "success":
-                logger.error(f"Failed to connect Make Rotator to Add Actor Local Rotation: {connect_rot_add_rot_response}")
-                return {"success": False, "message": f"Failed to connect Make Rotator to Add Actor Local Rotation: {connect_rot_add_rot_response.get('error', 'Unknown error')}"}
-            
-            # Connect Get Delta Seconds to Add Actor Local Rotation (execution flow)
-            connect_delta_add_rot_params = {
-                "blueprint_name": blueprint_name,
-                "source_node_id": delta_node_id,
-                "source_pin": "ExecutionOutput",
-                "target_node_id": add_rot_node_id,
-                "target_pin": "ExecutionInput"
-            }
-            
-            connect_delta_add_rot_response = unreal.send_command("connect_blueprint_nodes", connect_delta_add_rot_params)
-            
-            if not connect_delta_add_rot_response or connect_delta_add_rot_response.get("status") != "success":
-                logger.error(f"Failed to connect Get Delta Seconds to Add Actor Local Rotation: {connect_delta_add_rot_response}")
-                return {"success": False, "message": f"Failed to connect Get Delta Seconds to Add Actor Local Rotation: {connect_delta_add_rot_response.get('error', 'Unknown error')}"}
-            
-            # Compile the Blueprint
-            compile_params = {
-                "blueprint_name": blueprint_name
-            }
-            
-            compile_response = unreal.send_command("compile_blueprint", compile_params)
-            
-            if not compile_response or compile_response.get("status") != "success":
-                logger.error(f"Failed to compile Blueprint: {compile_response}")
-                return {"success": False, "message": f"Failed to compile Blueprint: {compile_response.get('error', 'Unknown error')}"}
-            
-            # Only spawn in the level editor if requested
-            if spawn_in_level_editor:
-                spawn_params = {
+            # Every step goes to Unreal in one batch, which it runs in a single game-thread task;
+            # node ids flow from the node-creating steps to the later ones as batch references.
+            # The first step that fails stops the batch, and its error is reported below.
+            steps = []
+            with unreal.batch() as batch:
+                # Create the Blueprint
+                steps.append((batch.add("create_blueprint_class", {
                     "blueprint_name": blueprint_name,
-                    "actor_name": f"Rotating{actor_type}",
-                    "location": location,
-                    "rotation": rotation,
-                    "scale": scale
-                }
-                spawn_response = unreal.send_command("spawn_blueprint_actor", spawn_params)
-                if not spawn_response or spawn_response.get("status") != "success":
-                    logger.error(f"Failed to spawn actor: {spawn_response}")
-                    return {"success": False, "message": f"Failed to spawn actor: {spawn_response.get('error', 'Unknown error')}"}
-                actor_name = spawn_response.get("result", {}).get("actor_name", "")
-            else:
-                actor_name = None
+                    "parent_class": "/Script/Engine.Actor",
+                    "save_path": "/Game/Blueprints"
+                }), "create Blueprint"))
+                
+                # Add a static mesh component
+                steps.append((batch.add("add_component_to_blueprint", {
+                    "blueprint_name": blueprint_name,
+                    "component_type": "StaticMeshComponent",
+                    "component_name": component_name
+                }), "add component"))
+                
+                steps.append((batch.add("set_static_mesh_properties", {
+                    "blueprint_name": blueprint_name,
+                    "component_name": component_name,
+                    "static_mesh": spec.mesh_shape
+                }), "set static mesh"))
+                
+                # Create the rotation logic in the event graph
+                steps.extend(_add_rotation_graph(batch, blueprint_name, spec))
+                
+                # Compile the Blueprint
+                steps.append((batch.add("compile_blueprint", {
+                    "blueprint_name": blueprint_name
+                }), "compile Blueprint"))
+                
+                # Only spawn in the level editor if requested
+                spawn = None
+                if spawn_in_level_editor:
+                    spawn = batch.add("spawn_blueprint_actor", {
+                        "blueprint_name": blueprint_name,
+                        "actor_name": f"Rotating{actor_type}",
+                        "location": location,
+                        "rotation": rotation,
+                        "scale": scale
+                    })
+                    steps.append((spawn, "spawn actor"))
+            
+            for command, what in steps:
+                _must(command.response, what)
+            
+            actor_name = spawn.response.get("result", {}).get("actor_name", "") if spawn else None
             return {
                 "success": True,
                 "message": f"Successfully created rotating {actor_type} Blueprint.",
@@ -385,16 +381,91 @@ def register_enhanced_node_tools(mcp: FastMCP):
                 "spawn_in_level_editor": spawn_in_level_editor
             }
             
+        except (ValueError, UnrealStepError) as e:
+            logger.error("%s", e)
+            return {"success": False, "message": str(e)}
         except Exception as e:
             error_msg = f"Error creating rotating actor: {e}"
             logger.error(error_msg)
             return {"success": False, "message": error_msg}
     
+    @mcp.tool()
+    def create_rotating_actor_async(
+        ctx: Context,
+        actor_type: str = "Cube",
+        blueprint_name: str = None,
+        location: List[float] = None,
+        rotation: List[float] = None,
+        scale: List[float] = None,
+        rotation_speed: float = _DEFAULT_ROTATION_SPEED,
+        rotation_axis: str = "Z",
+        spawn_in_level_editor: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Start creating a rotating actor in the background and return a handle right away.
+        
+        Takes the same arguments as create_rotating_actor. Jobs run one at a time in the order
+        they were started; poll blueprint_job_status with the handle for the result.
+        
+        Args:
+            actor_type: Type of actor to create ("Cube", "Sphere", "Cylinder" or "Cone")
+            blueprint_name: Optional name for the Blueprint to create (if None, will generate one)
+            location: Optional location [X, Y, Z]
+            rotation: Optional rotation [Pitch, Yaw, Roll]
+            scale: Optional scale [X, Y, Z] (default: [1,1,1] if not provided)
+            rotation_speed: Speed of rotation in degrees per second
+            rotation_axis: Axis to rotate around ("X", "Y", or "Z")
+            spawn_in_level_editor: If True, spawn the actor in the level editor
+        
+        Returns:
+            Dict containing success status, the job handle and its status ("queued")
+        
+        Example:
+            create_rotating_actor_async(ctx, actor_type="Sphere", location=[0, 0, 200])
+        """
+        try:
+            # Reject bad input now rather than in the job
+            RotatingActorSpec(
+                actor_type, rotation_speed, rotation_axis,
+                location if location is not None else (0, 0, 0),
+                rotation if rotation is not None else (0, 0, 0),
+                scale if scale is not None else (1, 1, 1)
+            )
+            handle = _start_job(
+                create_rotating_actor, ctx, actor_type, blueprint_name, location, rotation, scale,
+                rotation_speed, rotation_axis, spawn_in_level_editor
+            )
+            return {"success": True, "handle": handle, "status": "queued"}
+        except ValueError as e:
+            logger.error("%s", e)
+            return {"success": False, "message": str(e)}
+        except Exception as e:
+            error_msg = f"Error starting rotating actor job: {e}"
+            logger.error(error_msg)
+            return {"success": False, "message": error_msg}
+    
+    @mcp.tool()
+    def blueprint_job_status(ctx: Context, handle: str) -> Dict[str, Any]:
+        """
+        Get the status of a job started by create_rotating_actor_async.
+        
+        Args:
+            handle: Handle returned when the job was started
+            
+        Returns:
+            Dict with the job's status ("queued", "running" or "done"), a done flag and,
+            once done, the result the synchronous tool would have returned
+        
+        Example:
+            blueprint_job_status(ctx, handle="job-1")
+        """
+        return _job_status(handle)
+    
     @mcp.tool()
     def add_blueprint_complete_rotation_logic(
         ctx: Context,
         blueprint_name: str,
-        rotation_speed: float = 20.0,
+        rotation_speed: float = _DEFAULT_ROTATION_SPEED,
         rotation_axis: str = "Z"
     ) -> Dict[str, Any]:
         """
@@ -408,250 +479,27 @@ def register_enhanced_node_tools(mcp: FastMCP):
         Returns:
             Dict containing success status and details
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
+            spec = RotatingActorSpec(rotation_speed=rotation_speed, rotation_axis=rotation_axis)
+            
             unreal = get_unreal_connection()
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
             
-            # 1. Add the Event Tick node
-            tick_params = {
-                "blueprint_name": blueprint_name,
-                "event_type": "EventTick"
-            }
-            
-            tick_response = unreal.send_command("add_blueprint_event_node", tick_params)
-            
-            if not tick_response or tick_response.get("status") != "success":
-                logger.error(f"Failed to add Event Tick node: {tick_response}")
-                return {"success": False, "message": f"Failed to add Event Tick node: {tick_response.get('error', 'Unknown error')}"}
-            
-            tick_node_id = tick_response.get("result", {}).get("node_id")
-            
-            # 2. Add the Get Delta Seconds node
-            delta_params = {
-                "blueprint_name": blueprint_name,
-                "function": "GetWorldDeltaSeconds",
-                "target": "self"
-            }
-            
-            delta_response = unreal.send_command("add_blueprint_function_call_node", delta_params)
-            
-            if not delta_response or delta_response.get("status") != "success":
-                logger.error(f"Failed to add Get Delta Seconds node: {delta_response}")
-                return {"success": False, "message": f"Failed to add Get Delta Seconds node: {delta_response.get('error', 'Unknown error')}"}
-            
-            delta_node_id = delta_response.get("result", {}).get("node_id")
-            
-            # 3. Add a multiply node for rotation speed
-            multiply_params = {
-                "blueprint_name": blueprint_name,
-                "operation": "float * float",
-                "position": [400, 0]
-            }
-            
-            multiply_response = unreal.send_command("add_blueprint_math_node", multiply_params)
-            
-            if not multiply_response or multiply_response.get("status") != "success":
-                logger.error(f"Failed to add multiply node: {multiply_response}")
-                return {"success": False, "message": f"Failed to add multiply node: {multiply_response.get('error', 'Unknown error')}"}
-            
-            multiply_node_id = multiply_response.get("result", {}).get("node_id")
-            
-            # 4. Set the rotation speed constant
-            speed_params = {
-                "blueprint_name": blueprint_name,
-                "node_id": multiply_node_id,
-                "pin_name": "B",
-                "value": str(rotation_speed)
-            }
-            
-            speed_response = unreal.send_command("set_blueprint_node_pin_value", speed_params)
-            
-            if not speed_response or speed_response.get("status") != "success":
-                logger.error(f"Failed to set rotation speed: {speed_response}")
-                return {"success": False, "message": f"Failed to set rotation speed: {speed_response.get('error', 'Unknown error')}"}
-            
-            # 5. Create a rotation vector
-            make_rot_params = {
-                "blueprint_name": blueprint_name,
-                "function": "MakeRotator",
-                "position": [600, 0]
-            }
-            
-            make_rot_response = unreal.send_command("add_blueprint_function_call_node", make_rot_params)
-            
-            if not make_rot_response or make_rot_response.get("status") != "success":
-                logger.error(f"Failed to add Make Rotator node: {make_rot_response}")
-                return {"success": False, "message": f"Failed to add Make Rotator node: {make_rot_response.get('error', 'Unknown error')}"}
-            
-            make_rot_node_id = make_rot_response.get("result", {}).get("node_id")
-            
-            # 6. Set the rotation axis
-            rot_x = "0"
-            rot_y = "0"
-            rot_z = "0"
-            
-            if rotation_axis.upper() == "X":
-                rot_x = "1"
-            elif rotation_axis.upper() == "Y":
-                rot_y = "1"
-            else:  # Default to Z
-                rot_z = "1"
-            
-            # Set X rotation
-            rot_x_params = {
-                "blueprint_name": blueprint_name,
-                "node_id": make_rot_node_id,
-                "pin_name": "Roll",
-                "value": rot_x
-            }
-            
-            rot_x_response = unreal.send_command("set_blueprint_node_pin_value", rot_x_params)
-            
-            if not rot_x_response or rot_x_response.get("status") != "success":
-                logger.error(f"Failed to set X rotation: {rot_x_response}")
-                return {"success": False, "message": f"Failed to set X rotation: {rot_x_response.get('error', 'Unknown error')}"}
-            
-            # Set Y rotation
-            rot_y_params = {
-                "blueprint_name": blueprint_name,
-                "node_id": make_rot_node_id,
-                "pin_name": "Pitch",
-                "value": rot_y
-            }
-            
-            rot_y_response = unreal.send_command("set_blueprint_node_pin_value", rot_y_params)
-            
-            if not rot_y_response or rot_y_response.get("status") != "success":
-                logger.error(f"Failed to set Y rotation: {rot_y_response}")
-                return {"success": False, "message": f"Failed to set Y rotation: {rot_y_response.get('error', 'Unknown error')}"}
-            
-            # Set Z rotation
-            rot_z_params = {
-                "blueprint_name": blueprint_name,
-                "node_id": make_rot_node_id,
-                "pin_name": "Yaw",
-                "value": rot_z
-            }
-            
-            rot_z_response = unreal.send_command("set_blueprint_node_pin_value", rot_z_params)
-            
-            if not rot_z_response or rot_z_response.get("status") != "success":
-                logger.error(f"Failed to set Z rotation: {rot_z_response}")
-                return {"success": False, "message": f"Failed to set Z rotation: {rot_z_response.get('error', 'Unknown error')}"}
-            
-            # 7. Add the Add Actor Local Rotation node
-            add_rot_params = {
-                "blueprint_name": blueprint_name,
-                "function": "AddActorLocalRotation",
-                "target": "self",
-                "position": [800, 0]
-            }
-            
-            add_rot_response = unreal.send_command("add_blueprint_function_call_node", add_rot_params)
-            
-            if not add_rot_response or add_rot_response.get("status") != "success":
-                logger.error(f"Failed to add Add Actor Local Rotation node: {add_rot_response}")
-                return {"success": False, "message": f"Failed to add Add Actor Local Rotation node: {add_rot_response.get('error', 'Unknown error')}"}
-            
-            add_rot_node_id = add_rot_response.get("result", {}).get("node_id")
-            
-            # 8. Connect the nodes
-            
-            # Connect Event Tick to Get Delta Seconds
-            connect_tick_delta_params = {
-                "blueprint_name": blueprint_name,
-                "source_node_id": tick_node_id,
-                "source_pin": "ExecutionOutput",
-                "target_node_id": delta_node_id,
-                "target_pin": "ExecutionInput"
-            }
-            
-            connect_tick_delta_response = unreal.send_command("connect_blueprint_nodes", connect_tick_delta_params)
-            
-            if not connect_tick_delta_response or connect_tick_delta_response.get("status") != "success":
-                logger.error(f"Failed to connect Event Tick to Get Delta Seconds: {connect_tick_delta_response}")
-                return {"success": False, "message": f"Failed to connect Event Tick to Get Delta Seconds: {connect_tick_delta_response.get('error', 'Unknown error')}"}
-            
-            # Connect Get Delta Seconds to Multiply
-            connect_delta_multiply_params = {
-                "blueprint_name": blueprint_name,
-                "source_node_id": delta_node_id,
-                "source_pin": "ReturnValue",
-                "target_node_id": multiply_node_id,
-                "target_pin": "A"
-            }
-            
-            connect_delta_multiply_response = unreal.send_command("connect_blueprint_nodes", connect_delta_multiply_params)
-            
-            if not connect_delta_multiply_response or connect_delta_multiply_response.get("status") != "success":
-                logger.error(f"Failed to connect Get Delta Seconds to Multiply: {connect_delta_multiply_response}")
-                return {"success": False, "message": f"Failed to connect Get Delta Seconds to Multiply: {connect_delta_multiply_response.get('error', 'Unknown error')}"}
-            
-            # Connect Multiply to Make Rotator
-            rot_pin = "Yaw"  # Default to Z
-            if rotation_axis.upper() == "X":
-                rot_pin = "Roll"
-            elif rotation_axis.upper() == "Y":
-                rot_pin = "Pitch"
-            
-            connect_multiply_rot_params = {
-                "blueprint_name": blueprint_name,
-                "source_node_id": multiply_node_id,
-                "source_pin": "ReturnValue",
-                "target_node_id": make_rot_node_id,
-                "target_pin": rot_pin
-            }
-            
-            connect_multiply_rot_response = unreal.send_command("connect_blueprint_nodes", connect_multiply_rot_params)
-            
-            if not connect_multiply_rot_response or connect_multiply_rot_response.get("status") != "success":
-                logger.error(f"Failed to connect Multiply to Make Rotator: {connect_multiply_rot_response}")
-                return {"success": False, "message": f"Failed to connect Multiply to Make Rotator: {connect_multiply_rot_response.get('error', 'Unknown error')}"}
-            
-            # Connect Make Rotator to Add Actor Local Rotation
-            connect_rot_add_rot_params = {
-                "blueprint_name": blueprint_name,
-                "source_node_id": make_rot_node_id,
-                "source_pin": "ReturnValue",
-                "target_node_id": add_rot_node_id,
-                "target_pin": "DeltaRotation"
-            }
-            
-            connect_rot_add_rot_response = unreal.send_command("connect_blueprint_nodes", connect_rot_add_rot_params)
-            
-            if not connect_rot_add_rot_response or connect_rot_add_rot_response.get("status") != "success":
-                logger.error(f"Failed to connect Make Rotator to Add Actor Local Rotation: {connect_rot_add_rot_response}")
-                return {"success": False, "message": f"Failed to connect Make Rotator to Add Actor Local Rotation: {connect_rot_add_rot_response.get('error', 'Unknown error')}"}
-            
-            # Connect Get Delta Seconds to Add Actor Local Rotation (execution flow)
-            connect_delta_add_rot_params = {
-                "blueprint_name": blueprint_name,
-                "source_node_id": delta_node_id,
-                "source_pin": "ExecutionOutput",
-                "target_node_id": add_rot_node_id,
-                "target_pin": "ExecutionInput"
-            }
-            
-            connect_delta_add_rot_response = unreal.send_command("connect_blueprint_nodes", connect_delta_add_rot_params)
-            
-            if not connect_delta_add_rot_response or connect_delta_add_rot_response.get("status") != "success":
-                logger.error(f"Failed to connect Get Delta Seconds to Add Actor Local Rotation: {connect_delta_add_rot_response}")
-                return {"success": False, "message": f"Failed to connect Get Delta Seconds to Add Actor Local Rotation: {connect_delta_add_rot_response.get('error', 'Unknown error')}"}
-            
-            # Compile the Blueprint
-            compile_params = {
-                "blueprint_name": blueprint_name
-            }
-            
-            compile_response = unreal.send_command("compile_blueprint", compile_params)
+            # Every step goes to Unreal in one batch; node ids flow between steps as batch
+            # references, and the first step that fails stops the batch
+            steps = []
+            with unreal.batch() as batch:
+                steps.extend(_add_rotation_graph(batch, blueprint_name, spec))
+                
+                # Compile the Blueprint
+                steps.append((batch.add("compile_blueprint", {
+                    "blueprint_name": blueprint_name
+                }), "compile Blueprint"))
             
-            if not compile_response or compile_response.get("status") != "success":
-                logger.error(f"Failed to compile Blueprint: {compile_response}")
-                return {"success": False, "message": f"Failed to compile Blueprint: {compile_response.get('error', 'Unknown error')}"}
+            for command, what in steps:
+                _must(command.response, what)
             
             return {
                 "success": True,
@@ -661,6 +509,9 @@ def register_enhanced_node_tools(mcp: FastMCP):
                 "rotation_axis": rotation_axis
             }
             
+        except (ValueError, UnrealStepError) as e:
+            logger.error("%s", e)
+            return {"success": False, "message": str(e)}
         except Exception as e:
             error_msg = f"Error adding rotation logic: {e}"
             logger.error(error_msg)
@@ -692,8 +543,6 @@ def register_enhanced_node_tools(mcp: FastMCP):
         Returns:
             Dict containing success status and actor details
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -715,6 +564,7 @@ def register_enhanced_node_tools(mcp: FastMCP):
             if use_blueprint:
                 if blueprint_name is None:
                     blueprint_name = f"BP_{actor_type}"
+                component_name = actor_type + "Mesh"
                 
                 # Create the Blueprint
                 blueprint_params = {
@@ -723,60 +573,36 @@ def register_enhanced_node_tools(mcp: FastMCP):
                     "save_path": "/Game/Blueprints"
                 }
                 
-                blueprint_response = unreal.send_command("create_blueprint_class", blueprint_params)
-                
-                if not blueprint_response or blueprint_response.get("status") != "success":
-                    logger.error(f"Failed to create Blueprint: {blueprint_response}")
-                    return {"success": False, "message": f"Failed to create Blueprint: {blueprint_response.get('error', 'Unknown error')}"}
+                _must(unreal.send_command("create_blueprint_class", blueprint_params), "create Blueprint")
                 
                 # Add a static mesh component
                 component_params = {
                     "blueprint_name": blueprint_name,
                     "component_type": "StaticMeshComponent",
-                    "component_name": f"{actor_type}Mesh"
+                    "component_name": component_name
                 }
                 
-                component_response = unreal.send_command("add_component_to_blueprint", component_params)
-                
-                if not component_response or component_response.get("status") != "success":
-                    logger.error(f"Failed to add component: {component_response}")
-                    return {"success": False, "message": f"Failed to add component: {component_response.get('error', 'Unknown error')}"}
+                _must(unreal.send_command("add_component_to_blueprint", component_params), "add component")
                 
-                # Set the static mesh based on actor type
-                mesh_path = ""
-                if actor_type.lower() == "cube":
-                    mesh_path = "/Engine/BasicShapes/Cube.Cube"
-                elif actor_type.lower() == "sphere":
-                    mesh_path = "/Engine/BasicShapes/Sphere.Sphere"
-                elif actor_type.lower() == "cylinder":
-                    mesh_path = "/Engine/BasicShapes/Cylinder.Cylinder"
-                elif actor_type.lower() == "cone":
-                    mesh_path = "/Engine/BasicShapes/Cone.Cone"
-                else:
-                    mesh_path = "/Engine/BasicShapes/Cube.Cube"  # Default to cube
+                # Set the static mesh based on actor type, defaulting to a cube
+                mesh_shape = actor_type.lower()
+                if mesh_shape not in _BASIC_SHAPES:
+                    mesh_shape = "cube"
                 
                 mesh_params = {
                     "blueprint_name": blueprint_name,
-                    "component_name": f"{actor_type}Mesh",
-                    "static_mesh": mesh_path
+                    "component_name": component_name,
+                    "static_mesh": mesh_shape
                 }
                 
-                mesh_response = unreal.send_command("set_static_mesh_properties", mesh_params)
-                
-                if not mesh_response or mesh_response.get("status") != "success":
-                    logger.error(f"Failed to set static mesh: {mesh_response}")
-                    return {"success": False, "message": f"Failed to set static mesh: {mesh_response.get('error', 'Unknown error')}"}
+                _must(unreal.send_command("set_static_mesh_properties", mesh_params), "set static mesh")
                 
                 # Compile the Blueprint
                 compile_params = {
                     "blueprint_name": blueprint_name
                 }
                 
-                compile_response = unreal.send_command("compile_blueprint", compile_params)
-                
-                if not compile_response or compile_response.get("status") != "success":
-                    logger.error(f"Failed to compile Blueprint: {compile_response}")
-                    return {"success": False, "message": f"Failed to compile Blueprint: {compile_response.get('error', 'Unknown error')}"}
+                _must(unreal.send_command("compile_blueprint", compile_params), "compile Blueprint")
                 
                 # Spawn the actor in the level editor (not just for testing)
                 spawn_params = {
@@ -787,11 +613,7 @@ def register_enhanced_node_tools(mcp: FastMCP):
                     "scale": scale
                 }
                 
-                spawn_response = unreal.send_command("spawn_blueprint_actor", spawn_params)
-                
-                if not spawn_response or spawn_response.get("status") != "success":
-                    logger.error(f"Failed to spawn actor: {spawn_response}")
-                    return {"success": False, "message": f"Failed to spawn actor: {spawn_response.get('error', 'Unknown error')}"}
+                spawn_response = _must(unreal.send_command("spawn_blueprint_actor", spawn_params), "spawn actor")
                 
                 actor_name = spawn_response.get("result", {}).get("actor_name", "")
                 
@@ -814,11 +636,7 @@ def register_enhanced_node_tools(mcp: FastMCP):
                     "scale": scale
                 }
                 
-                spawn_response = unreal.send_command("spawn_actor", spawn_params)
-                
-                if not spawn_response or spawn_response.get("status") != "success":
-                    logger.error(f"Failed to spawn actor: {spawn_response}")
-                    return {"success": False, "message": f"Failed to spawn actor: {spawn_response.get('error', 'Unknown error')}"}
+                spawn_response = _must(unreal.send_command("spawn_actor", spawn_params), "spawn actor")
                 
                 return {
                     "success": True,
@@ -829,6 +647,9 @@ def register_enhanced_node_tools(mcp: FastMCP):
                     "scale": scale
                 }
             
+        except UnrealStepError as e:
+            logger.error("%s", e)
+            return {"success": False, "message": str(e)}
         except Exception as e:
             error_msg = f"Error creating actor: {e}"
             logger.error(error_msg)
@@ -153,7 +153,6 @@ def register_asset_management_tools(mcp: FastMCP):
         Example:
             find_asset_references(ctx, asset_path="/Game/Materials/M_MyMaterial")
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -654,7 +654,6 @@ def register_basic_asset_tools(mcp: FastMCP):
         Example:
             batch_create_assets(ctx, [{"type": "Blueprint", "name": "BP_MyActor", "save_path": "/Game/Blueprints"}])
         """
-        from unreal_mcp_server import get_unreal_connection
         results = []
         try:
             unreal = get_unreal_connection()
@@ -693,7 +692,6 @@ def register_basic_asset_tools(mcp: FastMCP):
         Example:
             batch_delete_assets(ctx, ["/Game/Blueprints/BP_MyActor"])
         """
-        from unreal_mcp_server import get_unreal_connection
         results = []
         try:
             unreal = get_unreal_connection()
@@ -720,7 +718,6 @@ def register_basic_asset_tools(mcp: FastMCP):
         Example:
             batch_rename_assets(ctx, [{"old_path": "/Game/Blueprints/BP_MyActor", "new_name": "BP_MyActor2"}])
         """
-        from unreal_mcp_server import get_unreal_connection
         results = []
         try:
             unreal = get_unreal_connection()
@@ -749,7 +746,6 @@ def register_basic_asset_tools(mcp: FastMCP):
         Example:
             batch_set_asset_properties(ctx, [{"asset_path": "/Game/Blueprints/BP_MyActor", "property_name": "bHidden", "property_value": "True"}])
         """
-        from unreal_mcp_server import get_unreal_connection
         results = []
         try:
             unreal = get_unreal_connection()
@@ -16,6 +16,7 @@ logger = logging.getLogger("UnrealMCP")
 
 def register_blueprint_tools(mcp: FastMCP):
     """Register Blueprint tools with the MCP server."""
+    from unreal_mcp_server import get_unreal_connection
     
     @mcp.tool()
     def create_blueprint(
@@ -25,8 +26,6 @@ def register_blueprint_tools(mcp: FastMCP):
     ) -> Dict[str, Any]:
         """Create a new Blueprint class."""
         # Import inside function to avoid circular imports
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -76,8 +75,6 @@ def register_blueprint_tools(mcp: FastMCP):
         Returns:
             Information about the added component
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             # Ensure all parameters are properly formatted
             params = {
@@ -135,13 +132,12 @@ def register_blueprint_tools(mcp: FastMCP):
         Args:
             blueprint_name: Name of the target Blueprint
             component_name: Name of the StaticMeshComponent
-            static_mesh: Path to the static mesh asset (e.g., "/Engine/BasicShapes/Cube.Cube")
+            static_mesh: Path to the static mesh asset (e.g., "/Engine/BasicShapes/Cube.Cube"),
+                or the short name of an engine basic shape ("cube", "sphere", "cylinder", "cone")
             
         Returns:
             Response indicating success or failure
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -178,8 +174,6 @@ def register_blueprint_tools(mcp: FastMCP):
         property_value,
     ) -> Dict[str, Any]:
         """Set a property on a component in a Blueprint."""
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -220,8 +214,6 @@ def register_blueprint_tools(mcp: FastMCP):
         angular_damping: float = 0.0
     ) -> Dict[str, Any]:
         """Set physics properties on a component."""
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -259,8 +251,6 @@ def register_blueprint_tools(mcp: FastMCP):
         blueprint_name: str
     ) -> Dict[str, Any]:
         """Compile a Blueprint."""
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -304,8 +294,6 @@ def register_blueprint_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -358,8 +346,6 @@ def register_blueprint_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure with detailed results for each property
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
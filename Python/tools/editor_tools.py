@@ -15,19 +15,18 @@ This module provides tools for controlling the Unreal Editor viewport and other
 
 import logging
 from typing import Dict, List, Any, Optional
-from fastmcp import FastMCP, Context
+from mcp.server.fastmcp import FastMCP, Context
 
 # Get logger
 logger = logging.getLogger("UnrealMCP")
 
 def register_editor_tools(mcp: FastMCP):
     """Register editor tools with the MCP server."""
+    from unreal_mcp_server import get_unreal_connection
     
     @mcp.tool()
     def get_actors_in_level(ctx: Context) -> List[Dict[str, Any]]:
         """Get a list of all actors in the current level."""
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -63,8 +62,6 @@ def register_editor_tools(mcp: FastMCP):
     @mcp.tool()
     def find_actors_by_name(ctx: Context, pattern: str) -> List[str]:
         """Find actors by name pattern."""
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -94,7 +91,6 @@ def register_editor_tools(mcp: FastMCP):
         scale: List[float] = None
     ) -> Dict[str, Any]:
         """Create a new actor in the current level."""
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -133,8 +129,6 @@ def register_editor_tools(mcp: FastMCP):
     @mcp.tool()
     def delete_actor(ctx: Context, name: str) -> Dict[str, Any]:
         """Delete an actor by name."""
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -159,8 +153,6 @@ def register_editor_tools(mcp: FastMCP):
         scale: List[float] = None
     ) -> Dict[str, Any]:
         """Set the transform of an actor."""
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -193,7 +185,6 @@ def register_editor_tools(mcp: FastMCP):
         Example:
             get_actor_properties(ctx, "Cube1")
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -225,7 +216,6 @@ def register_editor_tools(mcp: FastMCP):
         Example:
             set_actor_property(ctx, "Cube1", "bHidden", "True")
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -266,7 +256,6 @@ def register_editor_tools(mcp: FastMCP):
         Example:
             focus_viewport(ctx, target="Cube1")
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -289,6 +278,59 @@ def register_editor_tools(mcp: FastMCP):
             logger.error(f"Error focusing viewport: {e}")
             return {"success": False, "message": str(e)}
 
+    @mcp.tool()
+    def begin_blueprint_edit_batch(ctx: Context) -> Dict[str, Any]:
+        """
+        Stop the level viewports from redrawing in realtime while many Blueprints are created or edited.
+        Batches nest; the viewports go back to realtime when the outermost batch ends.
+        Args:
+            None
+        Returns:
+            Dict with success status, message and the number of open batches
+        Example:
+            begin_blueprint_edit_batch(ctx)
+            # ... create_rotating_actor(ctx, ...) for each actor ...
+            end_blueprint_edit_batch(ctx)
+        """
+        try:
+            unreal = get_unreal_connection()
+            if not unreal:
+                logger.error("Failed to connect to Unreal Engine")
+                return {"success": False, "message": "Failed to connect to Unreal Engine"}
+            response = unreal.send_command("begin_blueprint_edit_batch", {})
+            if not response or response.get("status") != "success":
+                logger.error(f"Failed to begin Blueprint edit batch: {response}")
+                return {"success": False, "message": response.get("error", "Unknown error") if response else "No response from Unreal Engine"}
+            return {"success": True, "message": "Blueprint edit batch started", "depth": response.get("result", {}).get("depth")}
+        except Exception as e:
+            logger.error(f"Error beginning Blueprint edit batch: {e}")
+            return {"success": False, "message": str(e)}
+
+    @mcp.tool()
+    def end_blueprint_edit_batch(ctx: Context) -> Dict[str, Any]:
+        """
+        End a batch started with begin_blueprint_edit_batch.
+        Args:
+            None
+        Returns:
+            Dict with success status, message and the number of batches still open
+        Example:
+            end_blueprint_edit_batch(ctx)
+        """
+        try:
+            unreal = get_unreal_connection()
+            if not unreal:
+                logger.error("Failed to connect to Unreal Engine")
+                return {"success": False, "message": "Failed to connect to Unreal Engine"}
+            response = unreal.send_command("end_blueprint_edit_batch", {})
+            if not response or response.get("status") != "success":
+                logger.error(f"Failed to end Blueprint edit batch: {response}")
+                return {"success": False, "message": response.get("error", "Unknown error") if response else "No response from Unreal Engine"}
+            return {"success": True, "message": "Blueprint edit batch ended", "depth": response.get("result", {}).get("depth")}
+        except Exception as e:
+            logger.error(f"Error ending Blueprint edit batch: {e}")
+            return {"success": False, "message": str(e)}
+
     @mcp.tool()
     def spawn_blueprint_actor(
         ctx: Context,
@@ -299,7 +341,6 @@ def register_editor_tools(mcp: FastMCP):
         scale: List[float] = None
     ) -> Dict[str, Any]:
         """Spawn an actor from a Blueprint."""
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -334,7 +375,6 @@ def register_editor_tools(mcp: FastMCP):
     @mcp.tool()
     def save_level(ctx: Context, level_name: str = None) -> Dict[str, Any]:
         """Save the current or specified level."""
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -350,7 +390,6 @@ def register_editor_tools(mcp: FastMCP):
     @mcp.tool()
     def load_level(ctx: Context, level_name: str) -> Dict[str, Any]:
         """Load a level by name."""
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -365,7 +404,6 @@ def register_editor_tools(mcp: FastMCP):
     @mcp.tool()
     def create_level(ctx: Context, level_name: str) -> Dict[str, Any]:
         """Create a new level by name."""
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -380,7 +418,6 @@ def register_editor_tools(mcp: FastMCP):
     @mcp.tool()
     def duplicate_level(ctx: Context, source_level: str, new_level: str) -> Dict[str, Any]:
         """Duplicate an existing level."""
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -395,7 +432,6 @@ def register_editor_tools(mcp: FastMCP):
     @mcp.tool()
     def delete_level(ctx: Context, level_name: str) -> Dict[str, Any]:
         """Delete a level by name."""
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -410,7 +446,6 @@ def register_editor_tools(mcp: FastMCP):
     @mcp.tool()
     def undo(ctx: Context) -> Dict[str, Any]:
         """Perform an undo action in the editor."""
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -425,7 +460,6 @@ def register_editor_tools(mcp: FastMCP):
     @mcp.tool()
     def redo(ctx: Context) -> Dict[str, Any]:
         """Perform a redo action in the editor."""
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -449,7 +483,6 @@ def register_editor_tools(mcp: FastMCP):
         Example:
             run_editor_command(ctx, "rebuild_navigation", {})
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             allowed_commands = {"rebuild_navigation", "build_lighting", "play_in_editor"}
             if command not in allowed_commands:
@@ -474,7 +507,6 @@ def register_editor_tools(mcp: FastMCP):
         Example:
             get_world_settings(ctx)
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -497,7 +529,6 @@ def register_editor_tools(mcp: FastMCP):
         Example:
             set_world_settings(ctx, {"GravityZ": "-980.0"})
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -518,7 +549,6 @@ def register_editor_tools(mcp: FastMCP):
         Example:
             get_editor_preferences(ctx)
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -541,7 +571,6 @@ def register_editor_tools(mcp: FastMCP):
         Example:
             set_editor_preferences(ctx, {"bShowFPS": "True"})
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -564,7 +593,6 @@ def register_editor_tools(mcp: FastMCP):
         Example:
             select_actors(ctx, ["Cube1", "Sphere2"])
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -591,7 +619,6 @@ def register_editor_tools(mcp: FastMCP):
         Example:
             deselect_actors(ctx, ["Cube1"])
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -616,7 +643,6 @@ def register_editor_tools(mcp: FastMCP):
         Example:
             get_selected_actors(ctx)
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -643,7 +669,6 @@ def register_editor_tools(mcp: FastMCP):
         Example:
             create_editor_utility_widget(ctx, "MyUtilityWidget")
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -671,7 +696,6 @@ def register_editor_tools(mcp: FastMCP):
         Example:
             run_editor_utility_widget(ctx, "MyUtilityWidget")
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -699,7 +723,6 @@ def register_editor_tools(mcp: FastMCP):
         Example:
             send_editor_notification(ctx, "Build complete!", "info")
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -727,7 +750,6 @@ def register_editor_tools(mcp: FastMCP):
         Example:
             query_editor_logs(ctx, log_type="error", limit=10)
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -14,6 +14,7 @@ logger = logging.getLogger("UnrealMCP")
 
 def register_blueprint_node_tools(mcp: FastMCP):
     """Register Blueprint node manipulation tools with the MCP server."""
+    from unreal_mcp_server import get_unreal_connection
     
     @mcp.tool()
     def add_blueprint_event_node(
@@ -36,8 +37,6 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             # Handle default value within the method body
             if node_position is None:
@@ -87,8 +86,6 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             # Handle default value within the method body
             if node_position is None:
@@ -142,8 +139,6 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             # Handle default values within the method body
             if params is None:
@@ -201,8 +196,6 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             params = {
                 "blueprint_name": blueprint_name,
@@ -252,8 +245,6 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             params = {
                 "blueprint_name": blueprint_name,
@@ -301,8 +292,6 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             # Handle None case explicitly in the function
             if node_position is None:
@@ -350,8 +339,6 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             if node_position is None:
                 node_position = [0, 0]
@@ -399,8 +386,6 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing array of found node IDs and success status
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             params = {
                 "blueprint_name": blueprint_name,
@@ -22,6 +22,7 @@ logger = logging.getLogger("UnrealMCP")
 
 def register_project_tools(mcp: FastMCP):
     """Register project tools with the MCP server."""
+    from unreal_mcp_server import get_unreal_connection
     
     @mcp.tool()
     def create_input_mapping(
@@ -41,8 +42,6 @@ def register_project_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -79,7 +78,6 @@ def register_project_tools(mcp: FastMCP):
         Returns:
             Dict with the setting value
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             params = {"setting_name": setting_name}
             unreal = get_unreal_connection()
@@ -102,7 +100,6 @@ def register_project_tools(mcp: FastMCP):
         Returns:
             Dict with success status
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             params = {"setting_name": setting_name, "value": value}
             unreal = get_unreal_connection()
@@ -122,7 +119,6 @@ def register_project_tools(mcp: FastMCP):
         Returns:
             Dict with plugin names and statuses
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -143,7 +139,6 @@ def register_project_tools(mcp: FastMCP):
         Returns:
             Dict with success status
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             params = {"plugin_name": plugin_name}
             unreal = get_unreal_connection()
@@ -165,7 +160,6 @@ def register_project_tools(mcp: FastMCP):
         Returns:
             Dict with success status
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             params = {"plugin_name": plugin_name}
             unreal = get_unreal_connection()
@@ -189,7 +183,6 @@ def register_project_tools(mcp: FastMCP):
         Example:
             build_project(ctx, configuration="Shipping")
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             params = {"configuration": configuration}
             unreal = get_unreal_connection()
@@ -213,7 +206,6 @@ def register_project_tools(mcp: FastMCP):
         Example:
             cook_project(ctx, platforms=["Windows"])
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             params = {"platforms": platforms}
             unreal = get_unreal_connection()
@@ -238,7 +230,6 @@ def register_project_tools(mcp: FastMCP):
         Example:
             package_project(ctx, platform="Windows", output_path="/Builds/Windows")
         """
-        from unreal_mcp_server import get_unreal_connection
         try:
             params = {"platform": platform, "output_path": output_path}
             unreal = get_unreal_connection()
@@ -16,6 +16,7 @@ logger = logging.getLogger("UnrealMCP")
 
 def register_umg_tools(mcp: FastMCP):
     """Register UMG tools with the MCP server."""
+    from unreal_mcp_server import get_unreal_connection
 
     @mcp.tool()
     def create_umg_widget_blueprint(
@@ -35,8 +36,6 @@ def register_umg_tools(mcp: FastMCP):
         Returns:
             Dict containing success status and widget path
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -90,8 +89,6 @@ def register_umg_tools(mcp: FastMCP):
         Returns:
             Dict containing success status and text block properties
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -151,8 +148,6 @@ def register_umg_tools(mcp: FastMCP):
         Returns:
             Dict containing success status and button properties
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -205,8 +200,6 @@ def register_umg_tools(mcp: FastMCP):
         Returns:
             Dict containing success status and binding information
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -255,8 +248,6 @@ def register_umg_tools(mcp: FastMCP):
         Returns:
             Dict containing success status and widget instance information
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -303,8 +294,6 @@ def register_umg_tools(mcp: FastMCP):
         Returns:
             Dict containing success status and binding information
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -13,6 +13,7 @@ logger = logging.getLogger("UnrealMCP")
 
 def register_ui_tools(mcp: FastMCP):
     """Register UI tools with the MCP server."""
+    from unreal_mcp_server import get_unreal_connection
     
     @mcp.tool()
     def show_function_generation_dialog(
@@ -28,8 +29,6 @@ def register_ui_tools(mcp: FastMCP):
         Returns:
             Dict containing the dialog result
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -64,8 +63,6 @@ def register_ui_tools(mcp: FastMCP):
         Returns:
             Dict containing the dialog result
         """
-        from unreal_mcp_server import get_unreal_connection
-        
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -3,17 +3,38 @@ Unreal Engine MCP Server
 
 A simple MCP server for interacting with Unreal Engine.
 """
+import asyncio
+import itertools
 import logging
 import socket
+import struct
 import sys
 import os
+import queue
+import re
+import threading
+import time
 import json
-from contextlib import asynccontextmanager
-from typing import AsyncIterator, Dict, Any, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Callable, Dict, Any, Iterator, List, Optional, Tuple, Union
 from mcp.server.fastmcp import FastMCP
 from enhanced_node_tools import register_enhanced_node_tools
 from blueprint_custom_function_tools import register_blueprint_custom_function_tools
 
+# Prefer orjson for the command/response codec when it is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    def _json_loads(data) -> Any:
+        # json.loads doesn't accept memoryviews
+        return json.loads(bytes(data))
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode('utf-8')
+
 
 # Add the current directory to the path to import the new modules
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -21,8 +42,6 @@ if current_dir not in sys.path:
     sys.path.append(current_dir)
 
 # Import new modules
-from ai_service import AIService, AIServiceConfig
-from http_client import HTTPClient
 from blueprint_function_tools import register_blueprint_function_tools
 from ui_tools import register_ui_tools
 # Import the asset creation tools
@@ -43,6 +62,31 @@ logger = logging.getLogger("UnrealMCP")
 UNREAL_HOST = "127.0.0.1"
 UNREAL_PORT = 55557
 
+# Unix domain socket to try before TCP when the editor runs on this machine and
+# listens on one; None uses TCP only
+UNREAL_SOCKET_PATH: Optional[str] = None
+
+# Initial size of the reusable receive buffer; grown only for larger responses
+RECV_BUFFER_SIZE = 65536
+
+# Seconds to wait for Unreal to accept a connection
+UNREAL_CONNECT_TIMEOUT = 5.0
+
+# Seconds to wait for Unreal to answer a command; asset creation ranges from
+# milliseconds to several seconds, so the blocking read waits for the whole reply
+UNREAL_COMMAND_TIMEOUT = 30.0
+
+# Most frames the async connection coalesces into a single write
+WRITE_COALESCE_MAX_FRAMES = 64
+
+# Most sync connections kept open per Unreal endpoint, and seconds to wait for a free one
+UNREAL_POOL_SIZE = 4
+UNREAL_POOL_TIMEOUT = 30.0
+
+# Seconds the connection getters report Unreal as unreachable after a failed connect
+# before trying again, so a burst of tool calls fails fast instead of each dialing
+UNREAL_RECONNECT_COOLDOWN = 0.5
+
 # Function to register toolbar button
 def register_toolbar_button(button_name: str, tooltip: str, icon_path: str = None) -> Dict[str, Any]:
     """Register a toolbar button in the Unreal Editor."""
@@ -65,47 +109,199 @@ def register_toolbar_button(button_name: str, tooltip: str, icon_path: str = Non
         logger.error("No response from Unreal Engine")
         return {"success": False, "message": "No response from Unreal Engine"}
     
-    logger.info(f"Register toolbar button response: {response}")
+    logger.info("Register toolbar button response: %s", response)
     return response
 
+def _create_unreal_socket(family: int = socket.AF_INET) -> socket.socket:
+    """Create a socket tuned for small request/response command frames."""
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    
+    if family == socket.AF_INET:
+        # Disable Nagle: each command is one small frame followed by a wait for the reply,
+        # which is exactly the pattern where delayed coalescing stalls every round-trip
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    
+    # Set larger buffer sizes
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+    return sock
+
+def _unreal_endpoints(host: str, port: int) -> List[Tuple[int, Any]]:
+    """Addresses to try for Unreal, in order: the Unix domain socket if configured, then TCP."""
+    endpoints = [(socket.AF_INET, (host, port))]
+    if UNREAL_SOCKET_PATH and hasattr(socket, "AF_UNIX"):
+        endpoints.insert(0, (socket.AF_UNIX, UNREAL_SOCKET_PATH))
+    return endpoints
+
+# Command names encoded as JSON strings, for frames whose params are pre-encoded
+_encoded_commands: Dict[str, bytes] = {}
+
+def _command_json(command: str) -> bytes:
+    """A command name encoded as a JSON string, cached per name."""
+    command_json = _encoded_commands.get(command)
+    if command_json is None:
+        command_json = _encoded_commands[command] = _json_dumps(command)
+    return command_json
+
+# Commands that only read a Blueprint; any other command that names one may change it
+_BLUEPRINT_READ_PREFIXES = ("get_", "find_", "list_")
+_BLUEPRINT_NAME_PATTERN = re.compile(rb'"blueprint_name":\s*("(?:[^"\\]|\\.)*")')
+
+# Called with a Blueprint's name before any command that may change it is sent
+_blueprint_change_listeners: List[Callable[[str], None]] = []
+
+def add_blueprint_change_listener(listener: Callable[[str], None]):
+    """Have listener called with a Blueprint's name whenever a command that may change it is sent."""
+    if listener not in _blueprint_change_listeners:
+        _blueprint_change_listeners.append(listener)
+
+def _notify_blueprint_changes(command: str, params: Union[Dict[str, Any], bytes, None]):
+    """Tell the listeners which Blueprints a command is about to change."""
+    if not _blueprint_change_listeners or command.startswith(_BLUEPRINT_READ_PREFIXES):
+        return
+    if isinstance(params, bytes):
+        # Pre-encoded params and batches: every Blueprint named anywhere in them, reads included
+        names = {_json_loads(name) for name in _BLUEPRINT_NAME_PATTERN.findall(params)}
+    elif command == "batch":
+        names = {
+            op["params"].get("blueprint_name") for op in (params or {}).get("ops", [])
+            if isinstance(op.get("params"), dict) and not op.get("type", "").startswith(_BLUEPRINT_READ_PREFIXES)
+        }
+    else:
+        names = {(params or {}).get("blueprint_name")}
+    for name in names:
+        if isinstance(name, str):
+            for listener in _blueprint_change_listeners:
+                listener(name)
+
+def _encode_batch_params(ops: List[Tuple[str, Union[Dict[str, Any], bytes]]]) -> bytes:
+    """Encode the params of a batch command running ops in order; each op's params may be pre-encoded JSON."""
+    return b'{"ops":[%s]}' % b",".join(
+        b'{"type":%s,"params":%s}' % (
+            _command_json(command), params if isinstance(params, bytes) else _json_dumps(params or {}))
+        for command, params in ops
+    )
+
+class BatchedCommand:
+    """Handle to one command of a CommandBatch; its response is set when the batch is sent."""
+    
+    __slots__ = ("index", "response")
+    
+    def __init__(self, index: int):
+        self.index = index
+        self.response: Optional[Dict[str, Any]] = None
+    
+    def ref(self, path: str = "result.node_id") -> Dict[str, str]:
+        """Placeholder param that Unreal replaces with this command's response value at path."""
+        return {"$ref": f"{self.index}.{path}"}
+
+class CommandBatch:
+    """
+    Collects commands and sends them to Unreal as a single batch when the block exits.
+    
+    Later commands can use the results of earlier ones through BatchedCommand.ref(),
+    which Unreal resolves as it runs the batch, so a whole dependent sequence costs
+    one round-trip. Once a command fails, Unreal skips the rest of the batch unless
+    the failed command was added with required=False.
+    
+    Usage:
+        with unreal.batch() as batch:
+            node = batch.add("add_blueprint_event_node", {...})
+            batch.add("connect_blueprint_nodes", {"source_node_id": node.ref(), ...})
+        node.response  # available after the with block
+    """
+    
+    def __init__(self, connection):
+        self.connection = connection
+        # Each op is encoded as it is queued; send() only joins them into the frame
+        self.ops: List[bytes] = []
+        self.commands: List[BatchedCommand] = []
+    
+    def add(self, command: str, params: Union[Dict[str, Any], bytes] = None, required: bool = True) -> BatchedCommand:
+        """
+        Queue a command; a failure of one that isn't required doesn't stop the batch.
+        
+        params may be an already encoded JSON object, so callers can build the
+        unchanging part of their params once and reuse it.
+        """
+        if not isinstance(params, bytes):
+            params = _json_dumps(params or {})
+        self.ops.append(b'{"type":%s,"params":%s%s}' % (_command_json(command), params, b'' if required else b',"optional":true'))
+        handle = BatchedCommand(len(self.commands))
+        self.commands.append(handle)
+        return handle
+    
+    def send(self):
+        """Send every queued command in one round-trip and fill in their responses."""
+        ops, commands = self.ops, self.commands
+        self.ops, self.commands = [], []
+        if not ops:
+            return
+        response = self.connection.send_command("batch", b'{"ops":[%s],"stop_on_error":true}' % b",".join(ops))
+        for handle, op_response in zip(commands, UnrealConnection._split_batch_response(response, len(ops))):
+            handle.response = op_response
+    
+    def __enter__(self) -> "CommandBatch":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.send()
+
 class UnrealConnection:
-    """Connection to an Unreal Engine instance."""
+    """
+    Persistent connection to an Unreal Engine instance.
     
-    def __init__(self):
+    Commands are written as length-prefixed JSON frames tagged with a request id
+    over a single long-lived socket, which is reopened only when it breaks.
+    """
+    
+    def __init__(self, host: str = UNREAL_HOST, port: int = UNREAL_PORT):
         """Initialize the connection."""
+        self.host = host
+        self.port = port
         self.socket = None
         self.connected = False
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._buffer = bytearray(RECV_BUFFER_SIZE)
+        # Unread bytes received ahead of the current frame are _buffer[_start:_end]
+        self._start = self._end = 0
     
     def connect(self) -> bool:
         """Connect to the Unreal Engine instance."""
         try:
-            # Close any existing socket
+            # Close any existing socket, along with anything read ahead from it
             if self.socket:
                 try:
                     self.socket.close()
                 except:
                     pass
                 self.socket = None
+            self._start = self._end = 0
             
-            logger.info(f"Connecting to Unreal at {UNREAL_HOST}:{UNREAL_PORT}...")
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(5)  # 5 second timeout
-            
-            # Set socket options for better stability
-            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
-            
-            # Set larger buffer sizes
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
-            
-            self.socket.connect((UNREAL_HOST, UNREAL_PORT))
+            endpoints = _unreal_endpoints(self.host, self.port)
+            for attempt, (family, address) in enumerate(endpoints, 1):
+                logger.info("Connecting to Unreal at %s...", address)
+                self.socket = _create_unreal_socket(family)
+                self.socket.settimeout(UNREAL_CONNECT_TIMEOUT)
+                try:
+                    self.socket.connect(address)
+                    break
+                except OSError:
+                    self.socket.close()
+                    self.socket = None
+                    if attempt == len(endpoints):
+                        raise
+            # Block in recv until the response arrives rather than timing out slow commands
+            self.socket.settimeout(UNREAL_COMMAND_TIMEOUT)
             self.connected = True
             logger.info("Connected to Unreal Engine")
             return True
             
         except Exception as e:
-            logger.error(f"Failed to connect to Unreal: {e}")
+            logger.error("Failed to connect to Unreal: %s", e)
             self.connected = False
             return False
     
@@ -118,185 +314,537 @@ class UnrealConnection:
                 pass
         self.socket = None
         self.connected = False
+        self._start = self._end = 0
 
-    def receive_full_response(self, sock, buffer_size=4096) -> bytes:
-        """Receive a complete response from Unreal, handling chunked data."""
-        chunks = []
-        sock.settimeout(5)  # 5 second timeout
-        try:
-            while True:
-                chunk = sock.recv(buffer_size)
-                if not chunk:
-                    if not chunks:
-                        raise Exception("Connection closed before receiving data")
-                    break
-                chunks.append(chunk)
-                
-                # Process the data received so far
-                data = b''.join(chunks)
-                decoded_data = data.decode('utf-8')
+    def _recv_exactly(self, size: int) -> memoryview:
+        """
+        Return the next size bytes from the socket, reading ahead into the reusable buffer.
+        
+        Each recv takes as much as the buffer has room for, so a frame's length
+        prefix and body usually arrive in a single call. The returned view is only
+        valid until the next read.
+        """
+        if self._end - self._start < size:
+            if self._start + size > len(self._buffer):
+                # Move the unread bytes to the front, growing the buffer for frames larger than it
+                buffered = self._end - self._start
+                if size > len(self._buffer):
+                    self._buffer.extend(bytes(size - len(self._buffer)))
+                self._buffer[:buffered] = self._buffer[self._start:self._end]
+                self._start, self._end = 0, buffered
+            view = memoryview(self._buffer)
+            while self._end - self._start < size:
+                count = self.socket.recv_into(view[self._end:])
+                if not count:
+                    raise ConnectionResetError("Connection closed by Unreal Engine")
+                self._end += count
+            view.release()
+        
+        start = self._start
+        self._start += size
+        if self._start == self._end:
+            self._start = self._end = 0
+        return memoryview(self._buffer)[start:start + size]
+    
+    def _receive_response(self, request_id: int) -> Dict[str, Any]:
+        """Read frames until the response for request_id arrives."""
+        while True:
+            (length,) = struct.unpack_from(">I", self._recv_exactly(4))
+            response = _json_loads(self._recv_exactly(length))
+            if response.pop("id", None) == request_id:
+                logger.info("Received complete response (%d bytes)", length)
+                return response
+            logger.warning("Discarding stale response: %r", response)
+    
+    @staticmethod
+    def _encode_command(request_id: int, command: str, params: Union[Dict[str, Any], bytes, None]) -> bytes:
+        """Build the length-prefixed frame for one command; params may be an already encoded JSON object."""
+        if isinstance(params, bytes):
+            payload = b'{"id":%d,"type":%s,"params":%s}' % (request_id, _command_json(command), params)
+        else:
+            payload = _json_dumps({
+                "id": request_id,
+                "type": command,
+                "params": params or {}
+            })
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Sending command: %s", payload.decode('utf-8'))
+        return struct.pack(">I", len(payload)) + payload
+    
+    def send_command(self, command: str, params: Union[Dict[str, Any], bytes] = None) -> Optional[Dict[str, Any]]:
+        """Send a command to Unreal Engine and get the response; params may be pre-encoded JSON."""
+        return self.send_pipelined([(command, params)])[0]
+    
+    def send_pipelined(self, ops: List[Tuple[str, Dict[str, Any]]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Send several independent commands back to back and collect their responses.
+        
+        Every frame goes out in one write before any response is read, so Unreal
+        works through the commands without a round-trip between them. Unlike
+        send_batch this needs no plugin support, and each command succeeds or
+        fails on its own.
+        
+        Args:
+            ops: List of (command, params) pairs, executed in order
+            
+        Returns:
+            One response per op, in the same order as the ops
+        """
+        if not ops:
+            return []
+        for command, params in ops:
+            _notify_blueprint_changes(command, params)
+        with self._lock:
+            # A reused socket may have been closed by Unreal while idle; reconnect and retry once
+            for attempt in range(2):
+                reused = self.connected
+                if not self.connected and not self.connect():
+                    logger.error("Failed to connect to Unreal Engine for command")
+                    return [None] * len(ops)
                 
-                # Try to parse as JSON to check if complete
+                responses = []
                 try:
-                    json.loads(decoded_data)
-                    logger.info(f"Received complete response ({len(data)} bytes)")
-                    return data
-                except json.JSONDecodeError:
-                    # Not complete JSON yet, continue reading
-                    logger.debug(f"Received partial response, waiting for more data...")
-                    continue
+                    request_ids = [next(self._ids) for _ in ops]
+                    self.socket.sendall(b"".join(
+                        self._encode_command(request_id, command, params)
+                        for request_id, (command, params) in zip(request_ids, ops)
+                    ))
+                    for request_id in request_ids:
+                        response = self._receive_response(request_id)
+                        
+                        # Log complete response for debugging
+                        logger.info("Complete response from Unreal: %s", response)
+                        
+                        responses.append(self._normalize_response(response))
+                    return responses
+                    
+                except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError) as e:
+                    self.disconnect()
+                    # Only resend if Unreal hasn't answered any of the commands yet
+                    if reused and attempt == 0 and not responses:
+                        logger.warning("Unreal connection lost (%s), reconnecting", e)
+                        continue
+                    logger.error("Error sending command: %s", e)
+                    return responses + [{"status": "error", "error": str(e)}] * (len(ops) - len(responses))
+                    
                 except Exception as e:
-                    logger.warning(f"Error processing response chunk: {str(e)}")
-                    continue
-        except socket.timeout:
-            logger.warning("Socket timeout during receive")
-            if chunks:
-                # If we have some data already, try to use it
-                data = b''.join(chunks)
+                    logger.error("Error sending command: %s", e)
+                    # The stream may be mid-frame, so drop the connection on any other error
+                    self.disconnect()
+                    return responses + [{"status": "error", "error": str(e)}] * (len(ops) - len(responses))
+
+    def send_batch(self, ops: List[Tuple[str, Union[Dict[str, Any], bytes]]]) -> List[Dict[str, Any]]:
+        """
+        Send several commands to Unreal Engine in a single round-trip.
+        
+        Args:
+            ops: List of (command, params) pairs, executed in order
+            
+        Returns:
+            One response per op, in the same order as the ops
+        """
+        response = self.send_command("batch", _encode_batch_params(ops))
+        return self._split_batch_response(response, len(ops))
+    
+    def batch(self) -> CommandBatch:
+        """Start a CommandBatch that is sent over this connection."""
+        return CommandBatch(self)
+    
+    @classmethod
+    def _split_batch_response(cls, response: Optional[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
+        """Turn a batch response into one normalized response per op."""
+        if not response or response.get("status") != "success":
+            error = response.get("error", "Unknown error") if response else "No response from Unreal Engine"
+            return [{"status": "error", "error": error} for _ in range(count)]
+            
+        results = response.get("result", {}).get("results", [])
+        if len(results) != count:
+            error = f"Batch returned {len(results)} results for {count} ops"
+            logger.error(error)
+            return [{"status": "error", "error": error} for _ in range(count)]
+            
+        return [cls._normalize_response(result) for result in results]
+    
+    @staticmethod
+    def _normalize_response(response: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert both Unreal error formats to {"status": "error", "error": ...}."""
+        # Check for both error formats: {"status": "error", ...} and {"success": false, ...}
+        if response.get("status") == "error":
+            error_message = response.get("error") or response.get("message", "Unknown Unreal error")
+            logger.error("Unreal error (status=error): %s", error_message)
+            # We want to preserve the original error structure but ensure error is accessible
+            if "error" not in response:
+                response["error"] = error_message
+        elif response.get("success") is False:
+            # This format uses {"success": false, "error": "message"} or {"success": false, "message": "message"}
+            error_message = response.get("error") or response.get("message", "Unknown Unreal error")
+            logger.error("Unreal error (success=false): %s", error_message)
+            # Convert to the standard format expected by higher layers
+            response = {
+                "status": "error",
+                "error": error_message
+            }
+        return response
+
+class UnrealConnectionPool:
+    """
+    Bounded pool of persistent connections to one Unreal Engine endpoint.
+    
+    Each command borrows a connection for its round-trip, so commands from
+    different threads run side by side instead of queueing on one socket.
+    Idle connections are reused most-recently-released first, keeping the
+    warmest sockets in use.
+    """
+    
+    def __init__(self, host: str = UNREAL_HOST, port: int = UNREAL_PORT, max_size: int = UNREAL_POOL_SIZE):
+        """Initialize the pool; connections are opened lazily."""
+        self.host = host
+        self.port = port
+        self.max_size = max_size
+        self._idle: "queue.LifoQueue[UnrealConnection]" = queue.LifoQueue()
+        self._connections: List[UnrealConnection] = []
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # time.monotonic() before which get_unreal_connection doesn't try to reconnect
+        self.offline_until = 0.0
+    
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = UNREAL_POOL_TIMEOUT) -> Iterator[UnrealConnection]:
+        """Borrow a connection, opening a new one while below max_size; raises queue.Empty on timeout."""
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                connection = None
+                if len(self._connections) < self.max_size:
+                    connection = UnrealConnection(self.host, self.port)
+                    self._connections.append(connection)
+            if connection is None:
+                connection = self._idle.get(timeout=timeout)
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+    
+    @property
+    def connected(self) -> bool:
+        """Whether any connection in the pool is currently open."""
+        return any(connection.connected for connection in self._connections)
+    
+    def send_command(self, command: str, params: Union[Dict[str, Any], bytes] = None) -> Optional[Dict[str, Any]]:
+        """Send a command to Unreal Engine over a pooled connection and get the response."""
+        try:
+            with self.acquire() as connection:
+                return connection.send_command(command, params)
+        except queue.Empty:
+            logger.error("Timed out waiting for a free Unreal connection")
+            return {
+                "status": "error",
+                "error": "Timed out waiting for a free Unreal connection"
+            }
+    
+    def send_command_async(self, command: str, params: Dict[str, Any] = None) -> "Future[Optional[Dict[str, Any]]]":
+        """
+        Start sending a command on a worker thread and return a Future for its response.
+        
+        Independent commands started together run side by side on separate pooled
+        connections, so their round-trips overlap instead of adding up.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_size, thread_name_prefix="UnrealMCP")
+        return self._executor.submit(self.send_command, command, params)
+    
+    def send_pipelined(self, ops: List[Tuple[str, Dict[str, Any]]]) -> List[Optional[Dict[str, Any]]]:
+        """Send several independent commands back to back over one pooled connection."""
+        try:
+            with self.acquire() as connection:
+                return connection.send_pipelined(ops)
+        except queue.Empty:
+            logger.error("Timed out waiting for a free Unreal connection")
+            return [{
+                "status": "error",
+                "error": "Timed out waiting for a free Unreal connection"
+            } for _ in ops]
+    
+    def send_batch(self, ops: List[Tuple[str, Union[Dict[str, Any], bytes]]]) -> List[Dict[str, Any]]:
+        """Send several commands in a single round-trip over one pooled connection; returns one response per op, in order."""
+        try:
+            with self.acquire() as connection:
+                return connection.send_batch(ops)
+        except queue.Empty:
+            logger.error("Timed out waiting for a free Unreal connection")
+            return [{
+                "status": "error",
+                "error": "Timed out waiting for a free Unreal connection"
+            } for _ in ops]
+    
+    def batch(self) -> CommandBatch:
+        """Start a CommandBatch that is sent over one pooled connection."""
+        return CommandBatch(self)
+    
+    def disconnect(self):
+        """Close every connection in the pool."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            for connection in self._connections:
+                connection.disconnect()
+
+# Global connection pools, one per Unreal endpoint
+_unreal_pools: Dict[Tuple[str, int], UnrealConnectionPool] = {}
+_unreal_pools_lock = threading.Lock()
+
+def get_unreal_connection() -> Optional[UnrealConnectionPool]:
+    """Get the shared connection pool for Unreal Engine, making sure Unreal is reachable."""
+    try:
+        endpoint = (UNREAL_HOST, UNREAL_PORT)
+        pool = _unreal_pools.get(endpoint)
+        if pool is None:
+            with _unreal_pools_lock:
+                pool = _unreal_pools.get(endpoint)
+                if pool is None:
+                    pool = _unreal_pools[endpoint] = UnrealConnectionPool(*endpoint)
+        
+        # Tool calls made while Unreal is connected take this path and never touch the idle queue
+        if pool.connected:
+            return pool
+        
+        if time.monotonic() < pool.offline_until:
+            return None
+        
+        # A broken socket is detected and replaced by send_command itself, so no ping is needed here
+        with pool.acquire() as connection:
+            if not connection.connected and not connection.connect():
+                logger.warning("Could not connect to Unreal Engine")
+                pool.offline_until = time.monotonic() + UNREAL_RECONNECT_COOLDOWN
+                return None
+        
+        return pool
+    except Exception as e:
+        logger.error("Error getting Unreal connection: %s", e)
+        return None
+
+class AsyncUnrealConnection:
+    """
+    Persistent asyncio connection to an Unreal Engine instance.
+    
+    Commands are written as length-prefixed JSON frames tagged with a request id.
+    A single background task reads the responses and resolves the matching
+    Future, so any number of commands can be in flight at once. Frames queued
+    in the same event loop iteration are flushed together in one write.
+    """
+    
+    def __init__(self):
+        """Initialize the connection."""
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.connected = False
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._read_task: Optional[asyncio.Task] = None
+        self._outgoing: List[bytes] = []
+        self._flushed: Optional[asyncio.Future] = None
+        self._connect_lock = asyncio.Lock()
+    
+    async def connect(self) -> bool:
+        """Connect to the Unreal Engine instance."""
+        # Close whatever a lost connection left behind before opening a new one
+        if self._read_task:
+            self._read_task.cancel()
+            self._read_task = None
+        await self._close_writer()
+        
+        try:
+            # open_connection doesn't expose TCP_NODELAY, so connect our own socket and hand it over
+            endpoints = _unreal_endpoints(UNREAL_HOST, UNREAL_PORT)
+            for attempt, (family, address) in enumerate(endpoints, 1):
+                logger.info("Connecting to Unreal at %s (async)...", address)
+                sock = _create_unreal_socket(family)
+                sock.setblocking(False)
                 try:
-                    json.loads(data.decode('utf-8'))
-                    logger.info(f"Using partial response after timeout ({len(data)} bytes)")
-                    return data
-                except:
-                    pass
-            raise Exception("Timeout receiving Unreal response")
+                    await asyncio.wait_for(asyncio.get_running_loop().sock_connect(sock, address), timeout=UNREAL_CONNECT_TIMEOUT)
+                    break
+                except (OSError, asyncio.TimeoutError):
+                    sock.close()
+                    if attempt == len(endpoints):
+                        raise
+            
+            self.reader, self.writer = await asyncio.open_connection(sock=sock)
+            self._read_task = asyncio.create_task(self._read_loop())
+            self.connected = True
+            logger.info("Connected to Unreal Engine (async)")
+            return True
+            
         except Exception as e:
-            logger.error(f"Error during receive: {str(e)}")
-            raise
+            logger.error("Failed to connect to Unreal: %s", e)
+            self.connected = False
+            return False
     
-    def send_command(self, command: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
-        """Send a command to Unreal Engine and get the response."""
-        # Always reconnect for each command, since Unreal closes the connection after each command
-        # This is different from Unity which keeps connections alive
-        if self.socket:
+    async def disconnect(self):
+        """Disconnect from the Unreal Engine instance."""
+        self.connected = False
+        if self._read_task:
+            self._read_task.cancel()
+            self._read_task = None
+        await self._close_writer()
+        self._fail_pending(ConnectionError("Disconnected from Unreal Engine"))
+    
+    async def _close_writer(self):
+        """Close the socket, if one is open."""
+        writer, self.reader, self.writer = self.writer, None, None
+        if writer:
             try:
-                self.socket.close()
-            except:
+                writer.close()
+                await writer.wait_closed()
+            except Exception:
                 pass
-            self.socket = None
-            self.connected = False
-        
-        if not self.connect():
+    
+    async def send_command(self, command: str, params: Union[Dict[str, Any], bytes] = None) -> Optional[Dict[str, Any]]:
+        """Send a command to Unreal Engine and await its response; params may be pre-encoded JSON."""
+        if not self.connected and not await self._reconnect():
             logger.error("Failed to connect to Unreal Engine for command")
             return None
         
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        
         try:
-            # Match Unity's command format exactly
-            command_obj = {
-                "type": command,  # Use "type" instead of "command"
-                "params": params or {}  # Use Unity's params or {} pattern
-            }
-            
-            # Send without newline, exactly like Unity
-            command_json = json.dumps(command_obj)
-            logger.info(f"Sending command: {command_json}")
-            self.socket.sendall(command_json.encode('utf-8'))
-            
-            # Read response using improved handler
-            response_data = self.receive_full_response(self.socket)
-            response = json.loads(response_data.decode('utf-8'))
+            _notify_blueprint_changes(command, params)
+            # Drain once the coalesced write has actually reached the transport
+            await self._queue_frame(UnrealConnection._encode_command(request_id, command, params))
+            if self.writer is None:
+                raise ConnectionError("Disconnected from Unreal Engine")
+            await self.writer.drain()
             
-            # Log complete response for debugging
-            logger.info(f"Complete response from Unreal: {response}")
+            response = await asyncio.wait_for(future, timeout=UNREAL_COMMAND_TIMEOUT)
+            response.pop("id", None)
+            logger.info("Complete response from Unreal: %s", response)
             
-            # Check for both error formats: {"status": "error", ...} and {"success": false, ...}
-            if response.get("status") == "error":
-                error_message = response.get("error") or response.get("message", "Unknown Unreal error")
-                logger.error(f"Unreal error (status=error): {error_message}")
-                # We want to preserve the original error structure but ensure error is accessible
-                if "error" not in response:
-                    response["error"] = error_message
-            elif response.get("success") is False:
-                # This format uses {"success": false, "error": "message"} or {"success": false, "message": "message"}
-                error_message = response.get("error") or response.get("message", "Unknown Unreal error")
-                logger.error(f"Unreal error (success=false): {error_message}")
-                # Convert to the standard format expected by higher layers
-                response = {
-                    "status": "error",
-                    "error": error_message
-                }
-            
-            # Always close the connection after command is complete
-            # since Unreal will close it on its side anyway
-            try:
-                self.socket.close()
-            except:
-                pass
-            self.socket = None
-            self.connected = False
-            
-            return response
+            return UnrealConnection._normalize_response(response)
             
         except Exception as e:
-            logger.error(f"Error sending command: {e}")
-            # Always reset connection state on any error
-            self.connected = False
-            try:
-                self.socket.close()
-            except:
-                pass
-            self.socket = None
+            logger.error("Error sending command: %s", e)
+            self._pending.pop(request_id, None)
+            if not isinstance(e, asyncio.TimeoutError):
+                await self.disconnect()
             return {
                 "status": "error",
-                "error": str(e)
+                "error": str(e) or type(e).__name__
             }
-
-# Global connection state
-_unreal_connection: UnrealConnection = None
-
-def get_unreal_connection() -> Optional[UnrealConnection]:
-    """Get the connection to Unreal Engine."""
-    global _unreal_connection
-    try:
-        if _unreal_connection is None:
-            _unreal_connection = UnrealConnection()
-            if not _unreal_connection.connect():
+    
+    async def _reconnect(self) -> bool:
+        """Reopen the connection once, however many commands are waiting to use it."""
+        async with self._connect_lock:
+            return self.connected or await self.connect()
+    
+    async def send_batch(self, ops: List[Tuple[str, Union[Dict[str, Any], bytes]]]) -> List[Dict[str, Any]]:
+        """Send several commands in a single round-trip; params may be pre-encoded JSON. Returns one response per op, in order."""
+        response = await self.send_command("batch", _encode_batch_params(ops))
+        return UnrealConnection._split_batch_response(response, len(ops))
+    
+    def _queue_frame(self, frame: bytes) -> asyncio.Future:
+        """Queue a frame to be written with any others sent in this loop iteration; the returned Future resolves once it is written."""
+        self._outgoing.append(frame)
+        if len(self._outgoing) == 1:
+            self._flushed = asyncio.get_running_loop().create_future()
+            asyncio.get_running_loop().call_soon(self._flush_frames)
+        flushed = self._flushed
+        if len(self._outgoing) >= WRITE_COALESCE_MAX_FRAMES:
+            self._flush_frames()
+        return flushed
+    
+    def _flush_frames(self):
+        """Hand every queued frame to the transport at once, which sends them in one syscall when it can."""
+        frames, self._outgoing = self._outgoing, []
+        if frames and self.writer is not None:
+            self.writer.writelines(frames)
+        if not self._flushed.done():
+            self._flushed.set_result(None)
+    
+    async def _read_loop(self):
+        """Read length-prefixed responses and hand each to the Future waiting on its id."""
+        try:
+            while True:
+                header = await self.reader.readexactly(4)
+                (length,) = struct.unpack(">I", header)
+                response = _json_loads(await self.reader.readexactly(length))
+                future = self._pending.pop(response.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Async Unreal connection closed: %s", e)
+            self.connected = False
+            self._read_task = None
+            self._fail_pending(ConnectionError(f"Connection to Unreal Engine lost: {e}"))
+            await self._close_writer()
+    
+    def _fail_pending(self, error: Exception):
+        """Fail every in-flight command."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+# Async connection state, bound to the event loop it was opened on
+_async_unreal_connection: Optional[AsyncUnrealConnection] = None
+_async_unreal_loop: Optional[asyncio.AbstractEventLoop] = None
+_async_unreal_lock: Optional[asyncio.Lock] = None
+_async_unreal_retry_at = 0.0
+
+async def get_async_unreal_connection() -> Optional[AsyncUnrealConnection]:
+    """Get the persistent async connection to Unreal Engine, opening it if needed."""
+    global _async_unreal_connection, _async_unreal_loop, _async_unreal_lock, _async_unreal_retry_at
+    loop = asyncio.get_running_loop()
+    
+    if _async_unreal_loop is not loop:
+        _async_unreal_connection = None
+        _async_unreal_loop = loop
+        _async_unreal_lock = asyncio.Lock()
+        _async_unreal_retry_at = 0.0
+    
+    # Concurrent first calls share one connection instead of each opening their own
+    async with _async_unreal_lock:
+        if _async_unreal_connection is None or not _async_unreal_connection.connected:
+            if loop.time() < _async_unreal_retry_at:
+                return None
+            if _async_unreal_connection is not None:
+                await _async_unreal_connection.disconnect()
+                _async_unreal_connection = None
+            connection = AsyncUnrealConnection()
+            if not await connection.connect():
                 logger.warning("Could not connect to Unreal Engine")
-                _unreal_connection = None
-        else:
-            # Verify connection is still valid with a ping-like test
-            try:
-                # Simple test by sending an empty buffer to check if socket is still connected
-                _unreal_connection.socket.sendall(b'\x00')
-                logger.debug("Connection verified with ping test")
-            except Exception as e:
-                logger.warning(f"Existing connection failed: {e}")
-                _unreal_connection.disconnect()
-                _unreal_connection = None
-                # Try to reconnect
-                _unreal_connection = UnrealConnection()
-                if not _unreal_connection.connect():
-                    logger.warning("Could not reconnect to Unreal Engine")
-                    _unreal_connection = None
-                else:
-                    logger.info("Successfully reconnected to Unreal Engine")
+                _async_unreal_retry_at = loop.time() + UNREAL_RECONNECT_COOLDOWN
+                return None
+            _async_unreal_connection = connection
         
-        return _unreal_connection
-    except Exception as e:
-        logger.error(f"Error getting Unreal connection: {e}")
-        return None
+    return _async_unreal_connection
 
 @asynccontextmanager
 async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
     """Handle server startup and shutdown."""
-    global _unreal_connection
     logger.info("UnrealMCP server starting up")
     try:
-        _unreal_connection = get_unreal_connection()
-        if _unreal_connection:
+        if get_unreal_connection():
             logger.info("Connected to Unreal Engine on startup")
         else:
             logger.warning("Could not connect to Unreal Engine on startup")
     except Exception as e:
-        logger.error(f"Error connecting to Unreal Engine on startup: {e}")
-        _unreal_connection = None
+        logger.error("Error connecting to Unreal Engine on startup: %s", e)
     
     try:
         yield {}
     finally:
-        if _unreal_connection:
-            _unreal_connection.disconnect()
-            _unreal_connection = None
+        with _unreal_pools_lock:
+            for pool in _unreal_pools.values():
+                pool.disconnect()
+            _unreal_pools.clear()
+        if _async_unreal_connection:
+            await _async_unreal_connection.disconnect()
         logger.info("Unreal MCP server shut down")
 
 # Initialize server
@@ -306,7 +854,10 @@ mcp = FastMCP(
     lifespan=server_lifespan
 )
 
-# Import and register tools
+# Import and register tools. Each register_* function imports what it needs from this
+# module (get_unreal_connection and friends) when it is called rather than at the top of
+# its own module: this module imports the tool modules, so a module-level import back
+# would be circular. The import runs once per registration, not once per tool call.
 from tools.editor_tools import register_editor_tools
 from tools.blueprint_tools import register_blueprint_tools
 from tools.node_tools import register_blueprint_node_tools
@@ -458,6 +1009,14 @@ def info():
     - `create_game_state(asset_name, save_path)` - Create a Game State Blueprint
     - `create_player_controller(asset_name, save_path)` - Create a Player Controller Blueprint
     
+    ### Batching
+    - `create_assets_batch(ops)` - Create several assets in one round-trip; each op is `{"command": "create_material", "params": {...}}`
+    - `create_assets_parallel(ops, max_concurrency)` - Run several create_* tools concurrently; each op is `{"tool": "create_material", "args": {...}}`
+    - `create_blueprint_classes_batch(specs)` - Create several Blueprint classes in one round-trip; each spec is `{"asset_name": ..., "parent_class": ..., "save_path": ...}`
+    - `create_gameplay_suite(game_mode_name, game_state_name, player_controller_name, save_path)` - Create a Game Mode, Game State and Player Controller in one round-trip
+    - Every create_* tool above also takes `wait`; with `wait=False` it returns the expected asset path at once and creates the asset in the background
+    - `flush_pending_creates()` - Wait for background creations started with `wait=False` and report any that failed
+    
     ## Enhanced Node Tools
     - `create_rotating_actor(actor_type, blueprint_name, location, rotation, scale, rotation_speed, rotation_axis)` - Create an actor that rotates continuously
     - `add_blueprint_complete_rotation_logic(blueprint_name, rotation_speed, rotation_axis)` - Add complete rotation logic to an existing Blueprint